@@ -256,7 +256,6 @@ Popup {
                     
                     textInput.text = ""
                     toast.isJointMode = false
-                    PositionController.load_poses()
                     toast.close()
                 }
             }
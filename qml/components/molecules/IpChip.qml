@@ -6,9 +6,15 @@ Column {
     id: root
     spacing: 4
 
-    property bool connected: false
+    // Robots.link.state: "connected" | "connecting" | "reconnecting" | "disconnected"
+    property string linkState: "disconnected"
+    property real   rttMs: -1
     property string initialIp: "192.168.167.199"
 
+    readonly property bool connected: linkState === "connected"
+    readonly property color stateColor: connected ? "#28A745"
+                                      : linkState === "disconnected" ? "#DC3545" : "#F59E0B"
+
     signal connectRequested(string ip)
 
     Text {
@@ -26,7 +32,7 @@ Column {
         height: 36
         radius: 18
         color: "#ffffff"
-        border.color: root.connected ? "#28A745" : "#DC3545"
+        border.color: root.stateColor
         border.width: 1.5
 
         Rectangle {
@@ -35,7 +41,7 @@ Column {
             anchors.left: parent.left
             anchors.leftMargin: 12
             width: 8; height: 8; radius: 4
-            color: root.connected ? "#28A745" : "#DC3545"
+            color: root.stateColor
         }
 
         TextField {
@@ -68,4 +74,14 @@ Column {
             root.connectRequested(ip)
         }
     }
+
+    Text {
+        anchors.horizontalCenter: parent.horizontalCenter
+        text: root.connected
+              ? (root.rttMs >= 0 ? root.rttMs.toFixed(1) + " ms" : "")
+              : root.linkState === "reconnecting" ? "reconnecting…"
+              : root.linkState === "connecting"   ? "connecting…" : "offline"
+        font.pixelSize: 9
+        color: root.rttMs > 50 ? "#B45309" : "#888"
+    }
 }
@@ -14,12 +14,11 @@ Window {
     height: mainCol.implicitHeight + 32  // 16px top + content + 16px bottom
 
     // ── State ─────────────────────────────────────────────────────────────────
-    property var  tcpPose:         [0, 0, 0, 0, 0, 0]
-    property var  jointPose:       [0, 0, 0, 0, 0, 0]
     property bool isJointMode:     false
     property real jogStep:         10
     property var  stepPresets:     [1, 5, 10, 50, 100]
     property bool gamepadConnected: false
+    property real jogLatencyMs:    -1   // EMA of per-tick jog cost; -1 = no jog yet
 
     // Notify Python when mode changes so gamepad routing stays in sync
     onIsJointModeChanged: PositionController.set_jog_mode(isJointMode)
@@ -41,10 +40,9 @@ Window {
     Connections {
         target: PositionController
 
-        // Position state (100 ms polling from Python QTimer)
-        function onJogStateUpdated(state) {
-            jogWindow.tcpPose   = state["tcp"]
-            jogWindow.jointPose = state["joints"]
+        // Per-tick cost of the last jog commands
+        function onJogLatencyUpdated(latency) {
+            jogWindow.jogLatencyMs = latency["avg_ms"]
         }
 
         // Gamepad connection status
@@ -118,6 +116,15 @@ Window {
 
                     Item { Layout.fillWidth: true }
 
+                    // Jog tick latency (hidden until the first jog)
+                    Text {
+                        visible: jogWindow.jogLatencyMs >= 0
+                        text: jogWindow.jogLatencyMs.toFixed(0) + " ms"
+                        font.pixelSize: 10
+                        font.family: "monospace"
+                        color: jogWindow.jogLatencyMs > 50 ? "#B45309" : "#6B7280"
+                    }
+
                     // Gamepad connection indicator
                     Rectangle {
                         height: 20; radius: 10
@@ -313,17 +320,17 @@ Window {
                     columns: 2; rowSpacing: 6; columnSpacing: 10
 
                     Text { text: "X";  font.pixelSize: 10; font.bold: true; color: "#E74C3C" }
-                    Text { text: jogWindow.tcpPose[0].toFixed(2); font.pixelSize: 11; font.family: "monospace"; color: "#111827"; Layout.minimumWidth: 62; horizontalAlignment: Text.AlignRight }
+                    Text { text: RobotState.x.toFixed(2); font.pixelSize: 11; font.family: "monospace"; color: "#111827"; Layout.minimumWidth: 62; horizontalAlignment: Text.AlignRight }
                     Text { text: "Y";  font.pixelSize: 10; font.bold: true; color: "#27AE60" }
-                    Text { text: jogWindow.tcpPose[1].toFixed(2); font.pixelSize: 11; font.family: "monospace"; color: "#111827"; Layout.minimumWidth: 62; horizontalAlignment: Text.AlignRight }
+                    Text { text: RobotState.y.toFixed(2); font.pixelSize: 11; font.family: "monospace"; color: "#111827"; Layout.minimumWidth: 62; horizontalAlignment: Text.AlignRight }
                     Text { text: "Z";  font.pixelSize: 10; font.bold: true; color: "#2980B9" }
-                    Text { text: jogWindow.tcpPose[2].toFixed(2); font.pixelSize: 11; font.family: "monospace"; color: "#111827"; Layout.minimumWidth: 62; horizontalAlignment: Text.AlignRight }
+                    Text { text: RobotState.z.toFixed(2); font.pixelSize: 11; font.family: "monospace"; color: "#111827"; Layout.minimumWidth: 62; horizontalAlignment: Text.AlignRight }
                     Text { text: "RX"; font.pixelSize: 10; font.bold: true; color: "#C0392B" }
-                    Text { text: jogWindow.tcpPose[3].toFixed(2); font.pixelSize: 11; font.family: "monospace"; color: "#111827"; Layout.minimumWidth: 62; horizontalAlignment: Text.AlignRight }
+                    Text { text: RobotState.rx.toFixed(2); font.pixelSize: 11; font.family: "monospace"; color: "#111827"; Layout.minimumWidth: 62; horizontalAlignment: Text.AlignRight }
                     Text { text: "RY"; font.pixelSize: 10; font.bold: true; color: "#1A7A40" }
-                    Text { text: jogWindow.tcpPose[4].toFixed(2); font.pixelSize: 11; font.family: "monospace"; color: "#111827"; Layout.minimumWidth: 62; horizontalAlignment: Text.AlignRight }
+                    Text { text: RobotState.ry.toFixed(2); font.pixelSize: 11; font.family: "monospace"; color: "#111827"; Layout.minimumWidth: 62; horizontalAlignment: Text.AlignRight }
                     Text { text: "RZ"; font.pixelSize: 10; font.bold: true; color: "#1A5276" }
-                    Text { text: jogWindow.tcpPose[5].toFixed(2); font.pixelSize: 11; font.family: "monospace"; color: "#111827"; Layout.minimumWidth: 62; horizontalAlignment: Text.AlignRight }
+                    Text { text: RobotState.rz.toFixed(2); font.pixelSize: 11; font.family: "monospace"; color: "#111827"; Layout.minimumWidth: 62; horizontalAlignment: Text.AlignRight }
                 }
             }
 
@@ -376,8 +383,7 @@ Window {
                         Item { Layout.fillWidth: true }
 
                         Text {
-                            text: (typeof jogWindow.jointPose[index] === "number"
-                                   ? jogWindow.jointPose[index].toFixed(2) : "0.00") + "°"
+                            text: RobotState["j" + (index + 1)].toFixed(2) + "°"
                             font.pixelSize: 12; font.family: "monospace"; color: "#111827"
                             horizontalAlignment: Text.AlignRight
                             Layout.minimumWidth: 72
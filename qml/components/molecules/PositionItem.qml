@@ -15,12 +15,25 @@ Rectangle {
     property int poseId
     property var poses
     property string poseType: "cartesian"
+    // services/pose_validation.py status for the selected robot; -1 = not checked yet
+    property int checkStatus: -1
+    // 1-based place in the program being built; 0 = not part of it
+    property int programStep: 0
+
+    readonly property var checkBadges: [
+        { text: "Reachable",           color: "#d6ffd7", textColor: "#3c8f40" },
+        { text: "Unreachable",         color: "#ffd6d6", textColor: "#c0392b" },
+        { text: "Config unreachable",  color: "#ffe8c2", textColor: "#b36b00" },
+        { text: "Joint limits",        color: "#ffd6d6", textColor: "#c0392b" },
+        { text: "Config mismatch",     color: "#ffe8c2", textColor: "#b36b00" }
+    ]
 
     signal movePressed(string poseName, var poses, string poseType)
     signal moveReleased()
     signal editClicked(int poseId)
     signal deleteClicked(int poseId)
     signal offsetClicked(int poseId)
+    signal programToggled()
 
     ColumnLayout {
         id: content
@@ -33,6 +46,28 @@ Rectangle {
             Layout.fillWidth: true
             spacing: 10
 
+            // Program pick: click in the order the poses should run
+            Rectangle {
+                width: 24; height: 24; radius: 12
+                color: programStep > 0 ? "#2563EB" : "transparent"
+                border.color: programStep > 0 ? "#2563EB" : "#b1b1b1"
+                border.width: 1.5
+
+                Text {
+                    anchors.centerIn: parent
+                    text: programStep > 0 ? programStep : ""
+                    font.pixelSize: 11
+                    font.bold: true
+                    color: "#ffffff"
+                }
+
+                MouseArea {
+                    anchors.fill: parent
+                    cursorShape: Qt.PointingHandCursor
+                    onClicked: positionItem.programToggled()
+                }
+            }
+
             Title {
                 titleText: nameText
                 font.pixelSize: 16
@@ -45,6 +80,15 @@ Rectangle {
                 backgroundColor: poseType === "joint" ? "#ffd6d6" : "#d6e3ff"
             }
 
+            Tag {
+                property var badge: checkStatus >= 0 && checkStatus < checkBadges.length
+                                    ? checkBadges[checkStatus] : null
+                visible: badge !== null
+                text: badge ? badge.text : ""
+                backgroundColor: badge ? badge.color : "#ececec"
+                textColor: badge ? badge.textColor : "#b1b1b1"
+            }
+
             Item { Layout.fillWidth: true }
 
             // Buttons pinned to the right — always visible
@@ -0,0 +1,191 @@
+import QtQuick 2.15
+import QtQuick.Controls 2.15
+import QtQuick.Layouts 1.15
+
+// Picks which robot the jog panel, moves and programs target; robots are
+// added / removed here, and "Stop all" halts every robot at once.
+Column {
+    id: root
+    spacing: 4
+
+    function stateColor(state) {
+        return state === "connected" ? "#28A745"
+             : state === "disconnected" ? "#DC3545" : "#F59E0B"
+    }
+
+    function summaryOf(name) {
+        let rows = Robots.overview
+        for (let i = 0; i < rows.length; i++)
+            if (rows[i].name === name)
+                return rows[i]
+        return null
+    }
+
+    Text {
+        anchors.horizontalCenter: parent.horizontalCenter
+        text: "ROBOT"
+        font.pixelSize: 9
+        font.bold: true
+        font.letterSpacing: 1.2
+        color: "#888"
+    }
+
+    Row {
+        spacing: 6
+
+        Rectangle {
+            width: 190
+            height: 36
+            radius: 18
+            color: "#ffffff"
+            border.color: "#6C757D"
+            border.width: 1.5
+
+            ComboBox {
+                id: robotCombo
+                anchors.fill: parent
+                anchors.leftMargin: 10
+                anchors.rightMargin: 48
+                flat: true
+                model: Robots.names
+                currentIndex: Robots.names.indexOf(Robots.selected)
+                onActivated: (index) => PositionController.select_robot(Robots.names[index])
+                font.pixelSize: 13
+
+                delegate: ItemDelegate {
+                    required property string modelData
+                    width: robotCombo.width
+                    contentItem: Row {
+                        spacing: 8
+                        Rectangle {
+                            anchors.verticalCenter: parent.verticalCenter
+                            width: 8; height: 8; radius: 4
+                            property var summary: root.summaryOf(modelData)
+                            color: root.stateColor(summary ? summary.state : "disconnected")
+                        }
+                        Text {
+                            text: {
+                                let summary = root.summaryOf(modelData)
+                                return modelData + (summary && summary.ip ? "  " + summary.ip : "")
+                            }
+                            font.pixelSize: 13
+                            color: "#333"
+                        }
+                    }
+                }
+            }
+
+            Row {
+                anchors.verticalCenter: parent.verticalCenter
+                anchors.right: parent.right
+                anchors.rightMargin: 8
+
+                Repeater {
+                    model: [
+                        { label: "+", enabled: true },
+                        { label: "−", enabled: Robots.names.length > 1 }
+                    ]
+                    Rectangle {
+                        width: 20; height: 20; radius: 10
+                        opacity: modelData.enabled ? 1.0 : 0.35
+                        color: btnMouse.containsMouse && modelData.enabled ? "#F0F0F0" : "transparent"
+
+                        Text {
+                            anchors.centerIn: parent
+                            text: modelData.label
+                            font.pixelSize: 15
+                            color: "#555"
+                        }
+
+                        MouseArea {
+                            id: btnMouse
+                            anchors.fill: parent
+                            hoverEnabled: true
+                            enabled: modelData.enabled
+                            cursorShape: Qt.PointingHandCursor
+                            onClicked: {
+                                if (index === 0)
+                                    addPopup.open()
+                                else
+                                    PositionController.remove_robot(Robots.selected)
+                            }
+                        }
+                    }
+                }
+            }
+        }
+
+        Rectangle {
+            anchors.verticalCenter: parent.verticalCenter
+            width: 72
+            height: 24
+            radius: 12
+            visible: Robots.names.length > 1
+            color: stopAllMouse.containsMouse ? "#C0392B" : "#DC3545"
+
+            Text {
+                anchors.centerIn: parent
+                text: "Stop all"
+                font.pixelSize: 10
+                font.bold: true
+                color: "#ffffff"
+                font.letterSpacing: 0.5
+            }
+
+            MouseArea {
+                id: stopAllMouse
+                anchors.fill: parent
+                hoverEnabled: true
+                cursorShape: Qt.PointingHandCursor
+                onClicked: PositionController.stop_all()
+            }
+        }
+    }
+
+    Popup {
+        id: addPopup
+        y: parent.height + 4
+        padding: 12
+        modal: true
+        focus: true
+        onOpened: { nameField.text = "Robot " + (Robots.names.length + 1); ipField.text = "" ; ipField.forceActiveFocus() }
+
+        background: Rectangle {
+            radius: 10
+            color: "#ffffff"
+            border.color: "#D1D5DB"
+        }
+
+        ColumnLayout {
+            spacing: 8
+
+            TextField {
+                id: nameField
+                Layout.preferredWidth: 200
+                placeholderText: "Name"
+                font.pixelSize: 13
+            }
+
+            TextField {
+                id: ipField
+                Layout.preferredWidth: 200
+                placeholderText: "IP address"
+                inputMethodHints: Qt.ImhPreferNumbers
+                font.pixelSize: 13
+                font.family: "monospace"
+                onAccepted: addButton.clicked()
+            }
+
+            Button {
+                id: addButton
+                Layout.alignment: Qt.AlignRight
+                text: "Add"
+                enabled: nameField.text.trim().length > 0 && /^\d{1,3}(\.\d{1,3}){3}$/.test(ipField.text.trim())
+                onClicked: {
+                    PositionController.add_robot(nameField.text.trim(), ipField.text.trim())
+                    addPopup.close()
+                }
+            }
+        }
+    }
+}
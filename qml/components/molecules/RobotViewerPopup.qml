@@ -19,6 +19,27 @@ Window {
     property real _dx: 0
     property real _dy: 0
 
+    // True while a telemetry replay drives the model instead of the live feed.
+    property bool _replaying: false
+
+    function _run(script) {
+        if (webLoader.item)
+            webLoader.item.runJavaScript("window.RobotViewer && " + script)
+    }
+
+    Connections {
+        target: PositionController
+        function onReplayJoints(joints) {
+            robotWindow._run("RobotViewer.setJoints(" + JSON.stringify(joints) + ")")
+        }
+        function onTelemetryStatus(status) {
+            if (status["replaying"] === robotWindow._replaying)
+                return
+            robotWindow._replaying = status["replaying"]
+            robotWindow._run(robotWindow._replaying ? "RobotViewer.disconnect()" : "RobotViewer.connect()")
+        }
+    }
+
     // Position on first show; clamp width to screen if the display is very narrow.
     Component.onCompleted: {
         let maxW = Screen.desktopAvailableWidth - 32
@@ -70,7 +91,7 @@ Window {
                     Rectangle { width: 8; height: 8; radius: 4; color: "#FE6900" }
 
                     Text {
-                        text: "3D Viewer"
+                        text: Robots.selected ? "3D Viewer · " + Robots.selected : "3D Viewer"
                         font.pixelSize: 14
                         font.bold: true
                         color: "#111827"
@@ -132,7 +153,8 @@ Window {
         id: viewerComponent
         WebEngineView {
             id: web
-            url: typeof robotViewerUrl !== "undefined" ? robotViewerUrl : ""
+            // Rebuilt (and reconnected) whenever another robot is selected.
+            url: typeof robotViewerPage !== "undefined" ? robotViewerPage + "&host=" + Robots.feedHost : ""
             backgroundColor: "transparent"
             layer.enabled: true
             layer.smooth: true
@@ -0,0 +1,234 @@
+import QtQuick 2.15
+import QtQuick.Controls 2.15
+import QtQuick.Layouts 1.15
+import QtQuick.Dialogs
+import QtQuick.Window 2.15
+import "../atoms"
+
+Window {
+    id: statsWindow
+    title: "RPC Latency"
+    flags: Qt.Tool | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint
+    color: "transparent"
+    visible: false
+
+    width:  560
+    height: 420
+
+    // ── State ─────────────────────────────────────────────────────────────────
+    property bool recording: false
+    property var  methods:   []   // slowest p95 first, from PositionController
+
+    // Drag tracking
+    property real _dx: 0
+    property real _dy: 0
+
+    Component.onCompleted: {
+        let maxW = Screen.desktopAvailableWidth - 32
+        if (maxW > 0 && maxW < width)
+            width = maxW
+        x = (Screen.width  - width)  / 2
+        y = (Screen.height - height) / 2
+    }
+
+    Connections {
+        target: PositionController
+        function onRpcStatsUpdated(stats) {
+            statsWindow.recording = stats["enabled"]
+            statsWindow.methods   = stats["methods"]
+        }
+    }
+
+    // Refresh only while the panel is open.
+    Timer {
+        interval: 1000
+        repeat: true
+        running: statsWindow.visible
+        triggeredOnStart: true
+        onTriggered: PositionController.refresh_rpc_stats()
+    }
+
+    FileDialog {
+        id: dumpFilePicker
+        title: "Save RPC statistics"
+        nameFilters: ["JSON (*.json)"]
+        defaultSuffix: "json"
+        fileMode: FileDialog.SaveFile
+        onAccepted: PositionController.dump_rpc_stats(selectedFile.toString())
+    }
+
+    function formatMs(ms) {
+        return ms >= 100 ? ms.toFixed(0) : ms >= 10 ? ms.toFixed(1) : ms.toFixed(2)
+    }
+
+    function formatErrors(errors) {
+        let parts = []
+        for (let code in errors)
+            parts.push(code + "×" + errors[code])
+        return parts.length ? parts.join(" ") : "–"
+    }
+
+    // ── Shell ─────────────────────────────────────────────────────────────────
+    Rectangle {
+        anchors.fill: parent
+        color: "#F4F6F9"
+        radius: 14
+        border.color: "#D1D5DB"
+        border.width: 1
+        clip: true
+
+        ColumnLayout {
+            anchors.fill: parent
+            anchors.margins: 16
+            spacing: 12
+
+            // ── Header (drag handle) ──────────────────────────────────────────
+            Item {
+                Layout.fillWidth: true
+                height: 28
+
+                MouseArea {
+                    anchors.fill: parent
+                    anchors.rightMargin: 36
+                    cursorShape: Qt.SizeAllCursor
+                    onPressed:  { statsWindow._dx = mouseX; statsWindow._dy = mouseY }
+                    onPositionChanged: {
+                        if (pressed) {
+                            statsWindow.x += mouseX - statsWindow._dx
+                            statsWindow.y += mouseY - statsWindow._dy
+                        }
+                    }
+                }
+
+                RowLayout {
+                    anchors.fill: parent
+                    spacing: 8
+
+                    Rectangle {
+                        width: 8; height: 8; radius: 4
+                        color: statsWindow.recording ? "#28A745" : "#9CA3AF"
+                    }
+
+                    Text {
+                        text: "RPC Latency"
+                        font.pixelSize: 14
+                        font.bold: true
+                        color: "#111827"
+                    }
+
+                    Item { Layout.fillWidth: true }
+
+                    Rectangle {
+                        width: 26; height: 26; radius: 13
+                        color: xMouse.containsMouse ? "#E5E7EB" : "transparent"
+
+                        Text {
+                            anchors.centerIn: parent
+                            text: "×"
+                            font.pixelSize: 18
+                            color: "#6B7280"
+                        }
+
+                        MouseArea {
+                            id: xMouse
+                            anchors.fill: parent
+                            hoverEnabled: true
+                            cursorShape: Qt.PointingHandCursor
+                            onClicked: statsWindow.hide()
+                        }
+                    }
+                }
+            }
+
+            // ── Controls ──────────────────────────────────────────────────────
+            RowLayout {
+                Layout.fillWidth: true
+                spacing: 8
+
+                Switch {
+                    text: "Record"
+                    checked: statsWindow.recording
+                    onToggled: PositionController.set_rpc_stats_enabled(checked)
+                }
+
+                Item { Layout.fillWidth: true }
+
+                CommonBtn {
+                    text: "Reset"
+                    style: "secondary"
+                    Layout.margins: 0
+                    Layout.preferredWidth: 90
+                    Layout.preferredHeight: 36
+                    onClicked: PositionController.reset_rpc_stats()
+                }
+
+                CommonBtn {
+                    text: "Save JSON"
+                    style: "primary"
+                    Layout.margins: 0
+                    Layout.preferredWidth: 120
+                    Layout.preferredHeight: 36
+                    onClicked: dumpFilePicker.open()
+                }
+            }
+
+            // ── Table ─────────────────────────────────────────────────────────
+            RowLayout {
+                Layout.fillWidth: true
+                spacing: 0
+                Repeater {
+                    model: ["Method", "Calls", "p50", "p95", "p99", "Max", "Errors"]
+                    Text {
+                        Layout.preferredWidth: index === 0 ? 150 : 58
+                        Layout.fillWidth: index === 6
+                        text: modelData
+                        font.pixelSize: 12
+                        font.bold: true
+                        color: "#6B7280"
+                    }
+                }
+            }
+
+            ListView {
+                Layout.fillWidth: true
+                Layout.fillHeight: true
+                clip: true
+                model: statsWindow.methods
+
+                delegate: RowLayout {
+                    width: ListView.view.width
+                    spacing: 0
+                    Repeater {
+                        model: [
+                            modelData.name,
+                            modelData.calls,
+                            statsWindow.formatMs(modelData.p50_ms),
+                            statsWindow.formatMs(modelData.p95_ms),
+                            statsWindow.formatMs(modelData.p99_ms),
+                            statsWindow.formatMs(modelData.max_ms),
+                            statsWindow.formatErrors(modelData.errors)
+                                + (modelData.failures ? "  ✕" + modelData.failures : "")
+                        ]
+                        Text {
+                            Layout.preferredWidth: index === 0 ? 150 : 58
+                            Layout.fillWidth: index === 6
+                            text: modelData
+                            font.pixelSize: 12
+                            font.family: index === 0 ? "" : "monospace"
+                            color: index === 6 && text !== "–" ? "#DC3545" : "#111827"
+                            elide: Text.ElideRight
+                        }
+                    }
+                }
+
+                Text {
+                    anchors.centerIn: parent
+                    visible: statsWindow.methods.length === 0
+                    text: statsWindow.recording ? "No controller calls yet" : "Recording is off"
+                    font.pixelSize: 13
+                    color: "#9CA3AF"
+                }
+            }
+        }
+    }
+}
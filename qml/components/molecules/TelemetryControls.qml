@@ -0,0 +1,80 @@
+import QtQuick 2.15
+import QtQuick.Controls 2.15
+import QtQuick.Layouts 1.15
+import QtQuick.Dialogs
+import "../atoms"
+
+// Record robot state telemetry and replay a saved segment at 1x or faster.
+RowLayout {
+    id: root
+    spacing: 8
+
+    property bool   recording: false
+    property bool   replaying: false
+    property string message:   ""
+    property real   playedS:   0
+    property real   totalS:    0
+
+    Connections {
+        target: PositionController
+        function onTelemetryStatus(status) {
+            root.recording = status["recording"]
+            root.replaying = status["replaying"]
+            if (status["message"] !== undefined) root.message = status["message"]
+            if (status["total_s"] !== undefined) {
+                root.playedS = status["played_s"]
+                root.totalS  = status["total_s"]
+            }
+        }
+    }
+
+    FileDialog {
+        id: segmentPicker
+        title: "Replay Telemetry"
+        nameFilters: ["Telemetry segments (*.npz)"]
+        fileMode: FileDialog.OpenFile
+        onAccepted: PositionController.replay_telemetry(selectedFile.toString(), speedBox.currentValue)
+    }
+
+    CommonBtn {
+        text: root.recording ? "■ REC" : "● REC"
+        style: root.recording ? "danger" : "secondary"
+        Layout.margins: 0
+        Layout.preferredWidth: 90
+        Layout.preferredHeight: 54
+        enabled: !root.replaying
+        onClicked: root.recording ? PositionController.stop_telemetry() : PositionController.start_telemetry()
+    }
+
+    ComboBox {
+        id: speedBox
+        Layout.preferredWidth: 76
+        textRole: "text"
+        valueRole: "value"
+        model: [
+            { text: "1x",  value: 1 },
+            { text: "2x",  value: 2 },
+            { text: "5x",  value: 5 },
+            { text: "10x", value: 10 }
+        ]
+    }
+
+    CommonBtn {
+        text: root.replaying ? "Stop" : "Replay"
+        style: root.replaying ? "danger" : "secondary"
+        Layout.margins: 0
+        Layout.preferredWidth: 90
+        Layout.preferredHeight: 54
+        enabled: !root.recording
+        onClicked: root.replaying ? PositionController.stop_replay() : segmentPicker.open()
+    }
+
+    Label {
+        Layout.maximumWidth: 220
+        elide: Text.ElideMiddle
+        text: root.replaying && root.totalS > 0
+              ? root.playedS.toFixed(1) + " / " + root.totalS.toFixed(1) + " s"
+              : root.message
+        color: "#6B7280"
+    }
+}
@@ -13,77 +13,13 @@ Rectangle {
     radius: 30
     color: "transparent"
 
-    // Master list – all loaded poses, never filtered
-    property var allPoses: []
-
     // Filename shown in the DB picker chip; updated from FileDialog/Python.
     property string currentDbName: "No database selected"
 
-    ListModel { id: savedPositionsModel }
-
-    function applyFilter(text) {
-        savedPositionsModel.clear()
-        let lower = text.toLowerCase().trim()
-        for (let pose of allPoses) {
-            if (lower === "" || pose.name.toLowerCase().indexOf(lower) !== -1) {
-                savedPositionsModel.append(pose)
-            }
-        }
-    }
-
+    // The pose list itself is PoseListModel (Python): it pages rows in from
+    // SQLite as the ListView scrolls and applies single-pose edits in place.
     Component.onCompleted: PositionController.load_poses()
 
-    Connections {
-        target: PositionController
-        function onPosesLoaded(poses) {
-            allPoses = []
-            for (let pose of poses) {
-                if (pose.type === "cartesian") {
-                    allPoses.push({
-                        id: pose.id,
-                        name: pose.name,
-                        type: "cartesian",
-                        poses: {
-                            posX: pose.x,
-                            posY: pose.y,
-                            posZ: pose.z,
-                            posRX: pose.rx,
-                            posRY: pose.ry,
-                            posRZ: pose.rz,
-                            posDX: pose.dx,
-                            posDY: pose.dy,
-                            posDZ: pose.dz,
-                            posDRX: pose.drx,
-                            posDRY: pose.dry,
-                            posDRZ: pose.drz
-                        }
-                    })
-                } else if (pose.type === "joint") {
-                    allPoses.push({
-                        id: pose.id,
-                        name: pose.name,
-                        type: "joint",
-                        poses: {
-                            j1: pose.j1,
-                            j2: pose.j2,
-                            j3: pose.j3,
-                            j4: pose.j4,
-                            j5: pose.j5,
-                            j6: pose.j6,
-                            dx: pose.dx,
-                            dy: pose.dy,
-                            dz: pose.dz,
-                            drx: pose.drx,
-                            dry: pose.dry,
-                            drz: pose.drz
-                        }
-                    })
-                }
-            }
-            applyFilter(positionInputBar.currentText)
-        }
-    }
-
     PositionPopup {
         id: addPositionPopup
         onMainButtonClicked: {
@@ -108,7 +44,6 @@ Rectangle {
                     parseFloat(poseRZValue)
                 )
             }
-            PositionController.load_poses()
         }
     }
 
@@ -139,7 +74,6 @@ Rectangle {
                     parseFloat(poseRZValue)
                 )
             }
-            PositionController.load_poses()
         }
     }
 
@@ -167,7 +101,6 @@ Rectangle {
                     parseFloat(drzValue)
                 )
             }
-            PositionController.load_poses()
         }
     }
 
@@ -187,22 +120,74 @@ Rectangle {
             onAccepted: PositionController.set_database(selectedFile.toString())
         }
 
+        FileDialog {
+            id: exportFilePicker
+            title: "Export Points"
+            nameFilters: ["Pose archives (*.npz)"]
+            defaultSuffix: "npz"
+            fileMode: FileDialog.SaveFile
+            onAccepted: {
+                transferStatus.start()
+                PositionController.export_poses(selectedFile.toString())
+            }
+        }
+
+        FileDialog {
+            id: importFilePicker
+            title: "Import Points"
+            nameFilters: ["Pose archives (*.npz)", "All files (*)"]
+            fileMode: FileDialog.OpenFile
+            // Names already in the database are kept, not overwritten.
+            onAccepted: {
+                transferStatus.start()
+                PositionController.import_poses(selectedFile.toString(), false)
+            }
+        }
+
         QtObject {
-            id: ipStatus
-            property bool connected: false
+            id: transferStatus
+            property bool running: false
+            property real progress: 0
+            function start() { progress = 0; running = true }
         }
 
+        // Saved-pose program run (the poses picked in the list, in pick order, blended).
         QtObject {
-            id: robotStates
-            property int estop:     -1
-            property int collision: -1
-            property int enable:    -1
+            id: programStatus
+            property bool running: false
+            property int done: 0
+            property int total: 0
+            property string message: ""
+            property string estimate: ""     // "before → after" travel time when the order was optimized
+            property var selection: []       // [{name, type}] in the order they were picked
+            function start() { done = 0; total = 0; message = "Resolving poses..."; estimate = ""; running = true }
+            function stepOf(name, type) {
+                for (let i = 0; i < selection.length; i++)
+                    if (selection[i].name === name && selection[i].type === type)
+                        return i + 1
+                return 0
+            }
+            function toggle(name, type) {
+                let picked = selection.filter(p => p.name !== name || p.type !== type)
+                if (picked.length === selection.length)
+                    picked.push({ name: name, type: type })
+                selection = picked
+            }
+            // Keep picks in step with edits: a deleted pose leaves the program,
+            // a renamed one keeps its place under the new name.
+            function forget(name, type) {
+                selection = selection.filter(p => p.name !== name || p.type !== type)
+            }
+            function rename(oldName, newName, type) {
+                selection = selection.map(p => p.name === oldName && p.type === type
+                                               ? { name: newName, type: type } : p)
+            }
         }
 
         Connections {
             target: PositionController
-            function onRobotStatusChanged(connected, ip) { ipStatus.connected = connected }
             function onDatabaseChanged(path) {
+                programStatus.selection = []
                 if (!path) {
                     positionController.currentDbName = "No database selected"
                     return
@@ -210,10 +195,30 @@ Rectangle {
                 let parts = path.split(/[\/\\]/)  // handles both POSIX and Windows separators
                 positionController.currentDbName = parts[parts.length - 1] || path
             }
-            function onRobotStatesUpdated(states) {
-                robotStates.estop     = states["estop"]
-                robotStates.collision = states["collision"]
-                robotStates.enable    = states["enable"]
+            function onPoseRemoved(type, name) {
+                programStatus.forget(name, type)
+            }
+            function onPoseUpdated(previousName, pose) {
+                if (pose.name !== previousName)
+                    programStatus.rename(previousName, pose.name, pose.type || "cartesian")
+            }
+            function onTransferProgress(operation, done, total) {
+                transferStatus.progress = total > 0 ? done / total : 1
+            }
+            function onTransferFinished(operation, ok, message) {
+                transferStatus.running = false
+            }
+            function onProgramProgress(done, total, name) {
+                programStatus.done = done
+                programStatus.total = total
+                programStatus.message = done < total ? "Running " + name : "Finishing"
+            }
+            function onProgramOrdered(beforeS, afterS) {
+                programStatus.estimate = "order " + beforeS.toFixed(1) + " s → " + afterS.toFixed(1) + " s"
+            }
+            function onProgramFinished(ok, message) {
+                programStatus.running = false
+                programStatus.message = message
             }
         }
 
@@ -227,22 +232,23 @@ Rectangle {
 
             SpeedChip {}
 
+            RobotSelector {}
+
             IpChip {
-                connected: ipStatus.connected
-                onConnectRequested: (ip) => {
-                    ipStatus.connected = false
-                    PositionController.connect_robot(ip)
-                }
+                initialIp: Robots.link ? Robots.link.ip : "192.168.167.199"
+                linkState: Robots.link ? Robots.link.state : "disconnected"
+                rttMs:     Robots.link ? Robots.link.rttMs : -1
+                onConnectRequested: (ip) => PositionController.connect_robot(ip)
             }
 
             RobotStatesChip {
-                estop:     robotStates.estop
-                collision: robotStates.collision
-                enable:    robotStates.enable
+                estop:     RobotState.estop
+                collision: RobotState.collision
+                enable:    RobotState.enable
             }
 
             RobotActionsChip {
-                enableState: robotStates.enable
+                enableState: RobotState.enable
                 onResetClicked: PositionController.reset_all_error()
                 onToggleEnableClicked: (newState) => PositionController.robot_enable(newState)
             }
@@ -254,10 +260,21 @@ Rectangle {
             ThreeDToggleButton {
                 onClicked: robotViewerPopup.visible ? robotViewerPopup.hide() : robotViewerPopup.show()
             }
+
+            CommonBtn {
+                text: "RPC"
+                style: "secondary"
+                width: 72
+                height: 54
+                onClicked: rpcStatsPopup.visible ? rpcStatsPopup.hide() : rpcStatsPopup.show()
+            }
+
+            TelemetryControls {}
         }
 
         JogControlPopup { id: jogControlPopup }
         RobotViewerPopup { id: robotViewerPopup }
+        RpcStatsPopup { id: rpcStatsPopup }
 
         // ── Row 2: search · DB picker · New Point — wraps on narrow widths ──
         Flow {
@@ -273,8 +290,8 @@ Rectangle {
                 height: 55
                 buttonName: "Search"
                 placeholder: "Type point name..."
-                onTextChanged: applyFilter(currentText)
-                onConnectClicked: (text) => applyFilter(text)
+                onTextChanged: PositionController.search_poses(currentText)
+                onConnectClicked: (text) => PositionController.search_poses_now(text)
             }
 
             DbPicker {
@@ -282,6 +299,57 @@ Rectangle {
                 onSelectClicked: dbFilePicker.open()
             }
 
+            CommonBtn {
+                text: "Import"
+                style: "secondary"
+                width: 100
+                height: 50
+                enabled: !transferStatus.running
+                onClicked: importFilePicker.open()
+            }
+
+            CommonBtn {
+                text: "Export"
+                style: "secondary"
+                width: 100
+                height: 50
+                enabled: !transferStatus.running
+                onClicked: exportFilePicker.open()
+            }
+
+            CommonBtn {
+                text: programStatus.running ? "Stop"
+                      : programStatus.selection.length > 0 ? "Run (" + programStatus.selection.length + ")" : "Run"
+                style: programStatus.running ? "danger" : "secondary"
+                width: 100
+                height: 50
+                enabled: programStatus.running || programStatus.selection.length > 0
+                onClicked: {
+                    if (programStatus.running)
+                        PositionController.stop_program()
+                    else
+                        confirmRunPopup.open()
+                }
+            }
+
+            CommonBtn {
+                text: "Clear"
+                style: "secondary"
+                width: 80
+                height: 50
+                visible: programStatus.selection.length > 0 && !programStatus.running
+                onClicked: programStatus.selection = []
+            }
+
+            CheckBox {
+                id: optimizeOrder
+                height: 50
+                text: "Optimize order"
+                enabled: !programStatus.running
+                ToolTip.visible: hovered
+                ToolTip.text: "Visit the poses in the order with the shortest estimated cycle time"
+            }
+
             CommonBtn {
                 text: "New Point"
                 style: "primary"
@@ -291,6 +359,30 @@ Rectangle {
             }
         }
 
+        ProgressBar {
+            Layout.fillWidth: true
+            visible: transferStatus.running
+            value: transferStatus.progress
+        }
+
+        RowLayout {
+            Layout.fillWidth: true
+            visible: programStatus.running || programStatus.message !== ""
+            spacing: 12
+
+            ProgressBar {
+                Layout.fillWidth: true
+                value: programStatus.total > 0 ? programStatus.done / programStatus.total : 0
+            }
+
+            Label {
+                text: (programStatus.total > 0
+                       ? programStatus.done + " / " + programStatus.total + "  " + programStatus.message
+                       : programStatus.message)
+                      + (programStatus.estimate ? "  (" + programStatus.estimate + ")" : "")
+            }
+        }
+
         Rectangle {
             height: 2
             color: "#b8b8b8"
@@ -302,7 +394,7 @@ Rectangle {
             id: savedPositionsList
             Layout.fillWidth: true
             Layout.fillHeight: true
-            model: savedPositionsModel
+            model: PoseListModel
             spacing: 12
             clip: true
 
@@ -312,6 +404,13 @@ Rectangle {
                 nameText: name
                 poses: model.poses
                 poseType: model.type || "cartesian"
+                checkStatus: model.check
+                programStep: programStatus.stepOf(name, model.type || "cartesian")
+
+                onProgramToggled: {
+                    if (!programStatus.running)
+                        programStatus.toggle(name, model.type || "cartesian")
+                }
 
                 onMovePressed: (poseName, poseData, type) => {
                     if (type === "joint") {
@@ -399,6 +498,88 @@ Rectangle {
         }
     }
 
+    Popup {
+        id: confirmRunPopup
+        modal: true
+        focus: true
+        parent: Overlay.overlay
+        anchors.centerIn: Overlay.overlay
+        closePolicy: Popup.CloseOnEscape
+        padding: 24
+
+        width: 400
+
+        background: Rectangle {
+            color: "#ffffff"
+            radius: 12
+            border.color: "#D1D5DB"
+            border.width: 1
+        }
+
+        contentItem: ColumnLayout {
+            spacing: 14
+
+            Label {
+                text: "Run " + programStatus.selection.length + " pose(s) on " + (Robots.selected || "the robot") + "?"
+                font.pixelSize: 18
+                font.bold: true
+                color: "#111827"
+            }
+
+            Label {
+                text: programStatus.selection.map(p => p.name).join(" → ")
+                      + (optimizeOrder.checked ? "\n\nThe visit order will be optimized for the shortest cycle time." : "")
+                font.pixelSize: 13
+                color: "#6B7280"
+                wrapMode: Text.Wrap
+                maximumLineCount: 8
+                elide: Text.ElideRight
+                Layout.fillWidth: true
+            }
+
+            // Pins for the optimized order: keep the picked first / last pose
+            // in place (e.g. a home pose to start from or end on).
+            CheckBox {
+                id: pinStart
+                visible: optimizeOrder.checked && programStatus.selection.length > 2
+                text: "Start at " + (programStatus.selection.length ? programStatus.selection[0].name : "")
+            }
+
+            CheckBox {
+                id: pinEnd
+                visible: optimizeOrder.checked && programStatus.selection.length > 2
+                text: "End at " + (programStatus.selection.length
+                                   ? programStatus.selection[programStatus.selection.length - 1].name : "")
+            }
+
+            RowLayout {
+                Layout.fillWidth: true
+                Layout.topMargin: 4
+                spacing: 8
+
+                Item { Layout.fillWidth: true }
+
+                Button {
+                    text: "Cancel"
+                    onClicked: confirmRunPopup.close()
+                }
+                Button {
+                    text: "Run"
+                    highlighted: true
+                    onClicked: {
+                        confirmRunPopup.close()
+                        programStatus.start()
+                        if (optimizeOrder.checked)
+                            PositionController.run_program_optimized(programStatus.selection, 100, 3,
+                                                                   pinStart.checked, pinEnd.checked)
+                        else
+                            PositionController.run_program(programStatus.selection, 100, 3)
+                    }
+                }
+            }
+        }
+    }
+
     Popup {
         id: confirmDeletePopup
         modal: true
@@ -451,6 +632,7 @@ Rectangle {
                     highlighted: true
                     onClicked: {
                         PositionController.delete_all_poses()
+                        programStatus.selection = []
                         confirmDeletePopup.close()
                     }
                 }
@@ -189,7 +189,8 @@ Rectangle {
         WebEngineView {
             id: robotViewerWeb
             anchors.fill: parent
-            url: typeof robotViewerUrl !== "undefined" ? robotViewerUrl : ""
+            // Rebuilt (and reconnected) whenever another robot is selected.
+            url: typeof robotViewerPage !== "undefined" ? robotViewerPage + "&host=" + Robots.feedHost : ""
             backgroundColor: "transparent"
             layer.enabled: true
             layer.smooth: true
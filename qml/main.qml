@@ -18,6 +18,10 @@ ApplicationWindow {
     // via Window.window.deleteUnlocked.
     property bool deleteUnlocked: false
 
+    // Robot state is polled more slowly while nobody can see it.
+    onVisibilityChanged: PositionController.set_window_visible(
+        visibility !== Window.Minimized && visibility !== Window.Hidden)
+
     Rectangle {
         anchors.fill: parent
         color: "#f5f7fa"
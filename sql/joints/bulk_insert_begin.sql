@@ -0,0 +1,8 @@
+-- Bulk import: index the new names in one pass instead of one trigger call
+-- per row (bulk_insert_end.sql). Runs inside the import's transaction, so
+-- other connections never see the table without its trigger.
+
+DROP TRIGGER IF EXISTS joint_fts_insert;
+
+CREATE TEMP TABLE joint_bulk_mark AS
+SELECT COALESCE(MAX(id), 0) AS last_id FROM joint;
@@ -0,0 +1,12 @@
+-- Index every row added since bulk_insert_begin.sql (ids only grow:
+-- AUTOINCREMENT), then restore the trigger from migration 007.
+
+INSERT INTO joint_fts (rowid, name)
+SELECT id, name FROM joint
+WHERE id > (SELECT last_id FROM temp.joint_bulk_mark);
+
+DROP TABLE temp.joint_bulk_mark;
+
+CREATE TRIGGER joint_fts_insert AFTER INSERT ON joint BEGIN
+    INSERT INTO joint_fts (rowid, name) VALUES (new.id, new.name);
+END;
@@ -0,0 +1 @@
+SELECT COUNT(*) AS total FROM joint;
@@ -0,0 +1 @@
+SELECT 1 FROM joint WHERE name = :name LIMIT 1;
@@ -0,0 +1,17 @@
+SELECT
+    name,
+    j1,
+    j2,
+    j3,
+    j4,
+    j5,
+    j6,
+    dx,
+    dy,
+    dz,
+    drx,
+    dry,
+    drz,
+    config
+FROM joint
+ORDER BY id;
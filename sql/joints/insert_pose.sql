@@ -29,4 +29,5 @@ VALUES (
     :dry,
     :drz,
     :config
-);
+)
+ON CONFLICT (name) DO NOTHING;
@@ -0,0 +1,23 @@
+SELECT 
+    t.id,
+    t.name,
+    t.j1,
+    t.j2,
+    t.j3,
+    t.j4,
+    t.j5,
+    t.j6,
+    t.dx,
+    t.dy,
+    t.dz,
+    t.drx,
+    t.dry,
+    t.drz,
+    t.config,
+    t.created_at,
+    t.check_status
+FROM joint_fts
+JOIN joint AS t ON t.id = joint_fts.rowid
+WHERE joint_fts MATCH :query
+ORDER BY joint_fts.rank, t.id DESC
+LIMIT :limit OFFSET :offset;
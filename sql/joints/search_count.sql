@@ -0,0 +1 @@
+SELECT COUNT(*) AS total FROM joint_fts WHERE joint_fts MATCH :query;
@@ -0,0 +1,23 @@
+-- Trigram indexes need at least 3 characters; shorter queries scan.
+SELECT 
+    id,
+    name,
+    j1,
+    j2,
+    j3,
+    j4,
+    j5,
+    j6,
+    dx,
+    dy,
+    dz,
+    drx,
+    dry,
+    drz,
+    config,
+    created_at,
+    check_status
+FROM joint
+WHERE name LIKE :pattern ESCAPE '\'
+ORDER BY id DESC
+LIMIT :limit OFFSET :offset;
@@ -0,0 +1,22 @@
+SELECT 
+    id,
+    name,
+    j1,
+    j2,
+    j3,
+    j4,
+    j5,
+    j6,
+    dx,
+    dy,
+    dz,
+    drx,
+    dry,
+    drz,
+    config,
+    created_at,
+    check_status
+FROM joint
+WHERE id < :before_id
+ORDER BY id DESC
+LIMIT :limit;
@@ -0,0 +1,12 @@
+SELECT
+    id,
+    j1,
+    j2,
+    j3,
+    j4,
+    j5,
+    j6,
+    config
+FROM joint
+WHERE check_key IS NOT :key
+ORDER BY id;
@@ -0,0 +1,13 @@
+-- Only lands if the pose still has the values it was checked with.
+UPDATE joint
+SET
+    check_status = :status,
+    check_key = :key
+WHERE id = :id
+  AND j1 = :j1
+  AND j2 = :j2
+  AND j3 = :j3
+  AND j4 = :j4
+  AND j5 = :j5
+  AND j6 = :j6
+  AND config = :config;
@@ -0,0 +1,46 @@
+INSERT INTO joint (
+    name,
+    j1,
+    j2,
+    j3,
+    j4,
+    j5,
+    j6,
+    dx,
+    dy,
+    dz,
+    drx,
+    dry,
+    drz,
+    config
+)
+VALUES (
+    :name,
+    :j1,
+    :j2,
+    :j3,
+    :j4,
+    :j5,
+    :j6,
+    :dx,
+    :dy,
+    :dz,
+    :drx,
+    :dry,
+    :drz,
+    :config
+)
+ON CONFLICT (name) DO UPDATE SET
+    j1 = excluded.j1,
+    j2 = excluded.j2,
+    j3 = excluded.j3,
+    j4 = excluded.j4,
+    j5 = excluded.j5,
+    j6 = excluded.j6,
+    dx = excluded.dx,
+    dy = excluded.dy,
+    dz = excluded.dz,
+    drx = excluded.drx,
+    dry = excluded.dry,
+    drz = excluded.drz,
+    config = excluded.config;
@@ -0,0 +1,38 @@
+-- Pose names are the lookup key for update, offset and delete, so they must be
+-- unique per table. Legacy databases may hold duplicates: keep the oldest row's
+-- name and suffix the others with their id before building the indexes. If
+-- "name (id)" is itself taken, a counter is added ("name (id-1)", ...) until
+-- the name is free.
+
+BEGIN TRANSACTION;
+
+UPDATE tcp SET name = (
+    WITH RECURSIVE attempt(k) AS (
+        SELECT 0
+        UNION ALL
+        SELECT k + 1 FROM attempt
+        WHERE tcp.name || ' (' || tcp.id || CASE k WHEN 0 THEN '' ELSE '-' || k END || ')'
+              IN (SELECT name FROM tcp)
+    )
+    SELECT tcp.name || ' (' || tcp.id || CASE MAX(k) WHEN 0 THEN '' ELSE '-' || MAX(k) END || ')'
+    FROM attempt
+)
+WHERE id NOT IN (SELECT MIN(id) FROM tcp GROUP BY name);
+
+UPDATE joint SET name = (
+    WITH RECURSIVE attempt(k) AS (
+        SELECT 0
+        UNION ALL
+        SELECT k + 1 FROM attempt
+        WHERE joint.name || ' (' || joint.id || CASE k WHEN 0 THEN '' ELSE '-' || k END || ')'
+              IN (SELECT name FROM joint)
+    )
+    SELECT joint.name || ' (' || joint.id || CASE MAX(k) WHEN 0 THEN '' ELSE '-' || MAX(k) END || ')'
+    FROM attempt
+)
+WHERE id NOT IN (SELECT MIN(id) FROM joint GROUP BY name);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_tcp_name ON tcp (name);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_joint_name ON joint (name);
+
+COMMIT;
@@ -0,0 +1,42 @@
+-- Trigram full-text indexes over pose names for the search bar. They are
+-- external-content tables (the names live only in tcp / joint) kept in sync
+-- by the triggers below; 'rebuild' indexes rows that predate them.
+
+BEGIN TRANSACTION;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS tcp_fts
+USING fts5(name, content = 'tcp', content_rowid = 'id', tokenize = 'trigram');
+
+CREATE VIRTUAL TABLE IF NOT EXISTS joint_fts
+USING fts5(name, content = 'joint', content_rowid = 'id', tokenize = 'trigram');
+
+CREATE TRIGGER IF NOT EXISTS tcp_fts_insert AFTER INSERT ON tcp BEGIN
+    INSERT INTO tcp_fts (rowid, name) VALUES (new.id, new.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS tcp_fts_delete AFTER DELETE ON tcp BEGIN
+    INSERT INTO tcp_fts (tcp_fts, rowid, name) VALUES ('delete', old.id, old.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS tcp_fts_rename AFTER UPDATE OF name ON tcp BEGIN
+    INSERT INTO tcp_fts (tcp_fts, rowid, name) VALUES ('delete', old.id, old.name);
+    INSERT INTO tcp_fts (rowid, name) VALUES (new.id, new.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS joint_fts_insert AFTER INSERT ON joint BEGIN
+    INSERT INTO joint_fts (rowid, name) VALUES (new.id, new.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS joint_fts_delete AFTER DELETE ON joint BEGIN
+    INSERT INTO joint_fts (joint_fts, rowid, name) VALUES ('delete', old.id, old.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS joint_fts_rename AFTER UPDATE OF name ON joint BEGIN
+    INSERT INTO joint_fts (joint_fts, rowid, name) VALUES ('delete', old.id, old.name);
+    INSERT INTO joint_fts (rowid, name) VALUES (new.id, new.name);
+END;
+
+INSERT INTO tcp_fts (tcp_fts) VALUES ('rebuild');
+INSERT INTO joint_fts (joint_fts) VALUES ('rebuild');
+
+COMMIT;
@@ -0,0 +1,28 @@
+-- Joint solution cached on each cartesian pose so replaying it is a single
+-- MoveJ. solution_key names the arm model, tool/user frame and tool offset
+-- it was solved for (NULL = not solved); sol_j1 NULL with a key set means
+-- no cached solution for that key (unreachable, or config -1 which is
+-- solved against the arm's position at move time). Moving the pose or
+-- changing its config clears the key; offsets are applied by the controller
+-- on top of the base pose and do not invalidate it.
+
+BEGIN TRANSACTION;
+
+ALTER TABLE tcp ADD COLUMN sol_j1 REAL;
+ALTER TABLE tcp ADD COLUMN sol_j2 REAL;
+ALTER TABLE tcp ADD COLUMN sol_j3 REAL;
+ALTER TABLE tcp ADD COLUMN sol_j4 REAL;
+ALTER TABLE tcp ADD COLUMN sol_j5 REAL;
+ALTER TABLE tcp ADD COLUMN sol_j6 REAL;
+ALTER TABLE tcp ADD COLUMN solution_key TEXT;
+
+CREATE TRIGGER IF NOT EXISTS tcp_solution_reset
+AFTER UPDATE OF x, y, z, rx, ry, rz, config ON tcp
+WHEN old.x IS NOT new.x OR old.y IS NOT new.y OR old.z IS NOT new.z
+  OR old.rx IS NOT new.rx OR old.ry IS NOT new.ry OR old.rz IS NOT new.rz
+  OR old.config IS NOT new.config
+BEGIN
+    UPDATE tcp SET solution_key = NULL WHERE id = new.id;
+END;
+
+COMMIT;
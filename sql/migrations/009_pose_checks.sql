@@ -0,0 +1,31 @@
+-- Result of the reachability sweep (services.pose_validation) on every pose.
+-- check_key is the solution key (arm model, tool/user frame, tool offset) the
+-- row was checked for, check_status the outcome code (0 = ok); both NULL
+-- until checked. Moving a pose or changing its config clears them.
+
+BEGIN TRANSACTION;
+
+ALTER TABLE tcp ADD COLUMN check_status INTEGER;
+ALTER TABLE tcp ADD COLUMN check_key TEXT;
+ALTER TABLE joint ADD COLUMN check_status INTEGER;
+ALTER TABLE joint ADD COLUMN check_key TEXT;
+
+CREATE TRIGGER IF NOT EXISTS tcp_check_reset
+AFTER UPDATE OF x, y, z, rx, ry, rz, config ON tcp
+WHEN old.x IS NOT new.x OR old.y IS NOT new.y OR old.z IS NOT new.z
+  OR old.rx IS NOT new.rx OR old.ry IS NOT new.ry OR old.rz IS NOT new.rz
+  OR old.config IS NOT new.config
+BEGIN
+    UPDATE tcp SET check_status = NULL, check_key = NULL WHERE id = new.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS joint_check_reset
+AFTER UPDATE OF j1, j2, j3, j4, j5, j6, config ON joint
+WHEN old.j1 IS NOT new.j1 OR old.j2 IS NOT new.j2 OR old.j3 IS NOT new.j3
+  OR old.j4 IS NOT new.j4 OR old.j5 IS NOT new.j5 OR old.j6 IS NOT new.j6
+  OR old.config IS NOT new.config
+BEGIN
+    UPDATE joint SET check_status = NULL, check_key = NULL WHERE id = new.id;
+END;
+
+COMMIT;
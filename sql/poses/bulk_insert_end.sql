@@ -0,0 +1,12 @@
+-- Index every row added since bulk_insert_begin.sql (ids only grow:
+-- AUTOINCREMENT), then restore the trigger from migration 007.
+
+INSERT INTO tcp_fts (rowid, name)
+SELECT id, name FROM tcp
+WHERE id > (SELECT last_id FROM temp.tcp_bulk_mark);
+
+DROP TABLE temp.tcp_bulk_mark;
+
+CREATE TRIGGER tcp_fts_insert AFTER INSERT ON tcp BEGIN
+    INSERT INTO tcp_fts (rowid, name) VALUES (new.id, new.name);
+END;
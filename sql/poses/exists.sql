@@ -0,0 +1 @@
+SELECT 1 FROM tcp WHERE name = :name LIMIT 1;
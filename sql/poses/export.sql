@@ -0,0 +1,17 @@
+SELECT
+    name,
+    x,
+    y,
+    z,
+    rx,
+    ry,
+    rz,
+    dx,
+    dy,
+    dz,
+    drx,
+    dry,
+    drz,
+    config
+FROM tcp
+ORDER BY id;
@@ -0,0 +1,23 @@
+SELECT 
+    t.id,
+    t.name,
+    t.x,
+    t.y,
+    t.z,
+    t.rx,
+    t.ry,
+    t.rz,
+    t.dx,
+    t.dy,
+    t.dz,
+    t.drx,
+    t.dry,
+    t.drz,
+    t.config,
+    t.created_at,
+    t.check_status
+FROM tcp_fts
+JOIN tcp AS t ON t.id = tcp_fts.rowid
+WHERE tcp_fts MATCH :query
+ORDER BY tcp_fts.rank, t.id DESC
+LIMIT :limit OFFSET :offset;
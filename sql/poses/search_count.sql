@@ -0,0 +1 @@
+SELECT COUNT(*) AS total FROM tcp_fts WHERE tcp_fts MATCH :query;
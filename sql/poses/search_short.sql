@@ -0,0 +1,23 @@
+-- Trigram indexes need at least 3 characters; shorter queries scan.
+SELECT 
+    id,
+    name,
+    x,
+    y,
+    z,
+    rx,
+    ry,
+    rz,
+    dx,
+    dy,
+    dz,
+    drx,
+    dry,
+    drz,
+    config,
+    created_at,
+    check_status
+FROM tcp
+WHERE name LIKE :pattern ESCAPE '\'
+ORDER BY id DESC
+LIMIT :limit OFFSET :offset;
@@ -0,0 +1 @@
+SELECT COUNT(*) AS total FROM tcp WHERE name LIKE :pattern ESCAPE '\';
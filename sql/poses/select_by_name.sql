@@ -0,0 +1,19 @@
+SELECT 
+    id, 
+    name, 
+    x, 
+    y, 
+    z, 
+    rx, 
+    ry, 
+    rz, 
+    dx,
+    dy,
+    dz,
+    drx,
+    dry,
+    drz,
+    config,
+    created_at
+FROM tcp
+WHERE name = :name;
@@ -0,0 +1,22 @@
+SELECT 
+    id,
+    name,
+    x,
+    y,
+    z,
+    rx,
+    ry,
+    rz,
+    dx,
+    dy,
+    dz,
+    drx,
+    dry,
+    drz,
+    config,
+    created_at,
+    check_status
+FROM tcp
+WHERE id < :before_id
+ORDER BY id DESC
+LIMIT :limit;
@@ -0,0 +1,19 @@
+-- Cached joints for a pose, if solved for :key at these coordinates
+-- (the stored config applies; callers may not know it).
+SELECT
+    sol_j1,
+    sol_j2,
+    sol_j3,
+    sol_j4,
+    sol_j5,
+    sol_j6
+FROM tcp
+WHERE name = :name
+  AND solution_key = :key
+  AND sol_j1 IS NOT NULL
+  AND ABS(x - :x) < 1e-6
+  AND ABS(y - :y) < 1e-6
+  AND ABS(z - :z) < 1e-6
+  AND ABS(rx - :rx) < 1e-6
+  AND ABS(ry - :ry) < 1e-6
+  AND ABS(rz - :rz) < 1e-6;
@@ -0,0 +1,12 @@
+SELECT
+    id,
+    x,
+    y,
+    z,
+    rx,
+    ry,
+    rz,
+    config
+FROM tcp
+WHERE check_key IS NOT :key
+ORDER BY id;
@@ -0,0 +1,13 @@
+-- Only lands if the pose still has the values it was checked with.
+UPDATE tcp
+SET
+    check_status = :status,
+    check_key = :key
+WHERE id = :id
+  AND x = :x
+  AND y = :y
+  AND z = :z
+  AND rx = :rx
+  AND ry = :ry
+  AND rz = :rz
+  AND config = :config;
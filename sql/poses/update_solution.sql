@@ -0,0 +1,18 @@
+-- Only lands if the pose still has the coordinates it was solved for.
+UPDATE tcp
+SET
+    sol_j1 = :j1,
+    sol_j2 = :j2,
+    sol_j3 = :j3,
+    sol_j4 = :j4,
+    sol_j5 = :j5,
+    sol_j6 = :j6,
+    solution_key = :key
+WHERE id = :id
+  AND x = :x
+  AND y = :y
+  AND z = :z
+  AND rx = :rx
+  AND ry = :ry
+  AND rz = :rz
+  AND config = :config;
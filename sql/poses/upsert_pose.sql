@@ -0,0 +1,46 @@
+INSERT INTO tcp (
+    name,
+    x,
+    y,
+    z,
+    rx,
+    ry,
+    rz,
+    dx,
+    dy,
+    dz,
+    drx,
+    dry,
+    drz,
+    config
+)
+VALUES (
+    :name,
+    :x,
+    :y,
+    :z,
+    :rx,
+    :ry,
+    :rz,
+    :dx,
+    :dy,
+    :dz,
+    :drx,
+    :dry,
+    :drz,
+    :config
+)
+ON CONFLICT (name) DO UPDATE SET
+    x = excluded.x,
+    y = excluded.y,
+    z = excluded.z,
+    rx = excluded.rx,
+    ry = excluded.ry,
+    rz = excluded.rz,
+    dx = excluded.dx,
+    dy = excluded.dy,
+    dz = excluded.dz,
+    drx = excluded.drx,
+    dry = excluded.dry,
+    drz = excluded.drz,
+    config = excluded.config;
@@ -1,21 +1,61 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
 from PySide6.QtCore import QObject, Slot, Signal, QTimer
 from repository.position_repository import PositionRepository
 from repository.positionJ_repository import PositionJRepository
+from repository.pose_cache import PoseCache
 from model.position_model import PositionModel
 from model.positionJ_model import PositionJModel
+from model.write_result import WriteResult
+from model.pose_list_model import PoseListModel
+from model.robot_state import RobotState
+from model.pose_snapshot import PoseSnapshot
+from db.db_worker import DbWorker
 from services.robot_service import RobotService
 from services.gamepad_service import GamepadService
+from services.jog_service import JogService
+from services.robot_executor import RobotExecutor, PRIORITY_QUERY
+from services.robot_registry import RobotCell, RobotRegistry
+from services.state_hub import StateHub
+from services.program_runner import ProgramRunner, ProgramStep
+from services.joint_solutions import solve_rows, store_solutions
+from services.pose_validation import OK as CHECK_OK, check_rows, read_unchecked, results_by_id, store_results
+from services.sequence_optimizer import order_steps
+from services.telemetry import (TelemetryRecorder, TelemetryReplay, TelemetryRing,
+                                RING_SECONDS, SAMPLE_PERIOD_S, load_segment)
+from utils.rpc_stats import RPC_STATS
 
 _SERVICE = RobotService()
 
+# How far a saved pose may be from the last capture (the UI rounds to 0.01)
+# and still count as that capture.
+_CAPTURE_MATCH_TOLERANCE = 0.006
+
 class PositionController(QObject):
-    posesLoaded = Signal(list)
+    # Incremental deltas after a single edit — full reloads (pose_model.reload)
+    # are reserved for database switches and "delete all".
+    poseInserted = Signal(dict)             # pose dict incl. 'type'
+    poseUpdated  = Signal(str, dict)        # previous name, pose dict incl. 'type'
+    poseRemoved  = Signal(str, str)         # type ('cartesian' | 'joint'), name
     currentPoseLoaded = Signal(dict)
     currentJointPoseLoaded = Signal(dict)
+    posesChecked = Signal(int, int)         # poses checked, how many have problems
     databaseChanged = Signal(str)   # emits the new db file path
-    robotStatusChanged = Signal(bool, str)  # connected, ip
-    robotStatesUpdated = Signal(dict)       # estop, collision, enable
-    jogStateUpdated    = Signal(dict)       # tcp[6] + joints[6] from state pkg
+    jogLatencyUpdated  = Signal(dict)       # ticks, last_ms, avg_ms, max_ms
+    # Bulk import/export — operation is 'import' | 'export'
+    transferProgress = Signal(str, int, int)   # operation, done, total
+    transferFinished = Signal(str, bool, str)  # operation, ok, message
+    programProgress  = Signal(int, int, str)   # done, total, current pose name
+    programSegment   = Signal(int, str, float) # index, pose name, seconds
+    programOrdered   = Signal(float, float)    # estimated travel s: given order, optimized
+    programFinished  = Signal(bool, str)       # ok, message
+    robotsStates     = Signal(list)            # [{name, tcp, joints, estop, collision, enable} | {name, error}]
+    rpcStatsUpdated  = Signal(dict)            # enabled, since, methods: [{name, calls, p50_ms, ...}]
+    telemetryStatus  = Signal(dict)            # recording, replaying, played_s, total_s, message
+    replayJoints     = Signal(dict)            # {j1..j6: deg} for the 3D viewer during replay
+    _computed        = Signal(object, object)  # on_done, Future (compute thread → GUI thread)
 
     # ── Gamepad signals → QML ─────────────────────────────────────────────────
     gamepadConnected   = Signal(bool)    # connection status
@@ -25,19 +65,74 @@ class PositionController(QObject):
     # ── Gamepad step presets (mirrors QML stepPresets) ────────────────────────
     _STEP_PRESETS = [1, 5, 10, 50, 100]
 
+    _SEARCH_DEBOUNCE_MS = 150
+    _EXTERNAL_CHECK_MS = 2000
+
     def __init__(self):
         super().__init__()
-        self.repo = PositionRepository()
-        self.repoJ = PositionJRepository()
-        self._jog_timer = QTimer(self)
-        self._jog_timer.setInterval(100)
-        self._jog_timer.timeout.connect(self._poll_jog_state)
-        self._jog_timer.start()
-
-        self._status_timer = QTimer(self)
-        self._status_timer.setInterval(200)
-        self._status_timer.timeout.connect(self._poll_robot_states)
-        self._status_timer.start()
+        # Name lookups and existence checks are served from memory; the caches
+        # are only ever touched from the DB thread, like the repositories.
+        self.repo = PoseCache(PositionRepository())
+        self.repoJ = PoseCache(PositionJRepository())
+        # Every SQLite call goes through this thread; slots only queue jobs.
+        self._db = DbWorker(self)
+        # CPU-heavy work (program ordering) runs here so it never holds up the DB thread.
+        self._compute = ThreadPoolExecutor(max_workers=1, thread_name_prefix="compute")
+        self._computed.connect(self._on_computed)
+        self._sweeps: dict[str, bool] = {}      # library pass running → run it again when done
+        # Exposed to QML as "PoseListModel"; pages rows in as the list scrolls.
+        self.pose_model = PoseListModel(self.repo, self.repoJ, self._db, self)
+        self.poseInserted.connect(self.pose_model.insert_pose)
+        self.poseUpdated.connect(self.pose_model.update_pose)
+        self.poseRemoved.connect(self.pose_model.remove_pose)
+
+        # Search-bar keystrokes are coalesced so only the settled text queries
+        # the FTS index (see search_poses).
+        self._search_text = ""
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self._SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._run_search)
+
+        # Another station may edit the same .db file; reload when it does.
+        self._external_timer = QTimer(self)
+        self._external_timer.setInterval(self._EXTERNAL_CHECK_MS)
+        self._external_timer.timeout.connect(self._check_external_changes)
+        self._external_timer.start()
+
+        # Named robot connections, each with its own command thread, link
+        # monitor and state poll; slots target the selected one. Exposed to
+        # QML as "Robots".
+        self.robots = RobotRegistry(self)
+        self.robots.selectedChanged.connect(self._on_robot_selected)
+        self.robots.linkUp.connect(self._on_link_up)
+        # The selected robot's state hub feeds the jog panel and the status
+        # chips, with only the fields that changed. Exposed to QML as
+        # "RobotState".
+        self.robot_state = RobotState(self)
+        self._state_hub: StateHub | None = None
+        self._window_visible = True
+        self._jog = JogService()
+        # (local IK, solution key) once verified on the selected robot; saved
+        # cartesian poses are pre-solved with it (see _solve_poses).
+        self._solver = None
+        self._program = ProgramRunner(_SERVICE, self)
+        # Last "Get Position" capture; save_pose reuses its config code when
+        # the pose being saved is the captured one.
+        self._last_capture: PoseSnapshot | None = None
+
+        # State recorder (created on first use) and replay; while a replay
+        # runs, the state hub stands down and the UI shows recorded frames.
+        self._telemetry: TelemetryRecorder | None = None
+        self._replay = TelemetryReplay(self)
+        self._replay.frame.connect(self._on_replay_frame)
+        self._replay.progress.connect(
+            lambda played, total: self._emit_telemetry(played_s=played, total_s=total))
+        self._replay.finished.connect(lambda: self._emit_telemetry(message="Replay finished"))
+        self._replay.finished.connect(lambda: self._state_hub and self._state_hub.set_paused(False))
+        self._program.progressChanged.connect(self.programProgress)
+        self._program.segmentTimed.connect(self.programSegment)
+        self._program.finished.connect(self.programFinished)
 
         # ── Gamepad state ─────────────────────────────────────────────────────
         self._jog_mode    = False   # False = Tool/Cartesian, True = Joints
@@ -60,75 +155,105 @@ class PositionController(QObject):
         self._gamepad.hat_changed.connect(self._on_hat)
         self._gamepad.button_pressed.connect(self._on_button)
 
+    DEFAULT_ROBOT = "Robot 1"
+
+    def _selected_cell(self, action: str) -> RobotCell | None:
+        """The selected robot, or None (logged) if there is none to send `action` to."""
+        cell = self.robots.current
+        if cell is None:
+            print(f"[PositionController] {action} failed: no robot selected")
+        return cell
+
     @Slot(str)
     def connect_robot(self, ip: str) -> None:
-        """Attempt to connect (or reconnect) to the robot at the given IP."""
-        from utils.robot_singleton import RobotSingletonRCP
-        try:
-            RobotSingletonRCP(ip)
-            print(f"[PositionController] Robot connected at {ip}")
-            self.robotStatusChanged.emit(True, ip)
-        except Exception as e:
-            print(f"[PositionController] Robot connection failed: {e}")
-            self.robotStatusChanged.emit(False, ip)
+        """Point the selected robot at `ip` (retried until it answers); adds one if there is none."""
+        self.robots.add(self.robots.selected or self.DEFAULT_ROBOT, ip)
 
-    def _poll_robot_states(self) -> None:
-        """Called by QTimer every 200 ms — reads robot_state_pkg directly."""
-        from utils.robot_singleton import RobotSingletonRCP
-        try:
-            pkg = RobotSingletonRCP().robot_state_pkg
-            self.robotStatesUpdated.emit({
-                "estop":     int(pkg.EmergencyStop),
-                "collision": int(pkg.collisionState),
-                "enable":    int(pkg.rbtEnableState),
-            })
-        except Exception:
-            pass
-
-    def _poll_jog_state(self) -> None:
-        """Called by QTimer every 100 ms — reads robot_state_pkg directly, no XML-RPC."""
-        from utils.robot_singleton import RobotSingletonRCP
-        try:
-            pkg = RobotSingletonRCP().robot_state_pkg
-            self.jogStateUpdated.emit({
-                "tcp":    [float(pkg.tl_cur_pos[i]) for i in range(6)],
-                "joints": [float(pkg.jt_cur_pos[i]) for i in range(6)],
-            })
-        except Exception:
-            pass
+    @Slot(str, str)
+    def add_robot(self, name: str, ip: str) -> None:
+        """Add a named robot (or re-address an existing one) and select it."""
+        name = name.strip()
+        if not name:
+            return
+        self.robots.add(name, ip)
+        self.robots.select(name)
+
+    @Slot(str)
+    def remove_robot(self, name: str) -> None:
+        if len(self.robots.names) <= 1:
+            print("[PositionController] The last robot cannot be removed")
+            return
+        if self._program.running and name == self.robots.selected:
+            self._program.stop()
+        self.robots.remove(name)
+
+    @Slot(str)
+    def select_robot(self, name: str) -> None:
+        if self._program.running:
+            print("[PositionController] Stop the running program before switching robots")
+            self.robots.selectedChanged.emit()   # puts the QML selector back
+            return
+        self.robots.select(name)
+
+    def _on_robot_selected(self) -> None:
+        """Re-wire the jog panel, status chips and IK solver to the selected robot."""
+        if self._state_hub is not None:
+            self._state_hub.changed.disconnect(self.robot_state.apply)
+            self._state_hub.set_paused(False)
+            self._state_hub.set_visible(False)
+        cell = self.robots.current
+        self._state_hub = cell.hub if cell is not None else None
+        self._jog.stop()
+        self._solver = None
+        self._last_capture = None
+        if cell is None:
+            return
+        print(f"[PositionController] Selected robot '{cell.name}' ({cell.link.ip})")
+        cell.hub.changed.connect(self.robot_state.apply)
+        cell.hub.set_paused(self._replay.running)
+        cell.hub.set_visible(self._window_visible)
+        cell.hub.resync()
+        if cell.link.connected:
+            self._request_solver(cell)
+
+    def _on_link_up(self, name: str, ip: str) -> None:
+        print(f"[PositionController] Robot '{name}' connected at {ip}")
+        if name != self.robots.selected:
+            return
+        self._state_hub.resync()
+        self._request_solver(self.robots.current)
+
+    @Slot(bool)
+    def set_window_visible(self, visible: bool) -> None:
+        """Main window shown / minimized; state polling slows down while hidden."""
+        self._window_visible = visible
+        if self._state_hub is not None:
+            self._state_hub.set_visible(visible)
+
+    def _robot_call(self, label: str, fn) -> None:
+        """Queue a fire-and-forget robot command; failures are logged."""
+        cell = self._selected_cell(label)
+        if cell is None:
+            return
+        cell.io.submit(
+            fn,
+            on_done=lambda _: print(f"[PositionController] {label} called"),
+            on_error=lambda e: print(f"[PositionController] {label} failed: {e}"))
 
     @Slot()
     def reset_all_error(self) -> None:
         """Clear all robot errors."""
-        from utils.robot_singleton import RobotSingletonRCP
-        try:
-            robot = RobotSingletonRCP()
-            robot.ResetAllError()
-            print("[PositionController] ResetAllError called")
-        except Exception as e:
-            print(f"[PositionController] ResetAllError failed: {e}")
+        self._robot_call("ResetAllError", lambda robot: robot.ResetAllError())
 
     @Slot(int)
     def robot_enable(self, state: int) -> None:
         """Enable (state=1) or disable (state=0) the robot."""
-        from utils.robot_singleton import RobotSingletonRCP
-        try:
-            robot = RobotSingletonRCP()
-            robot.RobotEnable(state)
-            print(f"[PositionController] RobotEnable({state}) called")
-        except Exception as e:
-            print(f"[PositionController] RobotEnable failed: {e}")
+        self._robot_call(f"RobotEnable({state})", lambda robot: robot.RobotEnable(state))
 
     @Slot(int)
     def set_speed(self, speed: int) -> None:
         """Set robot speed (1-100%)."""
-        from utils.robot_singleton import RobotSingletonRCP
-        try:
-            robot = RobotSingletonRCP()
-            robot.SetSpeed(speed)
-            print(f"[PositionController] Speed set to {speed}%")
-        except Exception as e:
-            print(f"[PositionController] Failed to set speed: {e}")
+        self._robot_call(f"SetSpeed({speed})", lambda robot: robot.SetSpeed(speed))
 
     @Slot(str)
     def set_database(self, path_or_url: str) -> None:
@@ -138,33 +263,77 @@ class PositionController(QObject):
         FileDialog hands us the latter, and QUrl.toLocalFile gives us a clean
         path on every OS (handles the leading-slash quirk on Windows drives).
         """
-        from PySide6.QtCore import QUrl, QSettings
+        from PySide6.QtCore import QSettings
+
+        path = self._local_path(path_or_url)
+        QSettings().setValue("last_db_path", path)
+        self.open_database(path)
+
+    def open_database(self, path: str) -> None:
+        """Open + migrate `path` on the DB thread, then reload the pose list."""
         from db.db_manager import DB_Manager
 
-        if path_or_url.startswith("file:"):
-            path = QUrl(path_or_url).toLocalFile()
-        else:
-            path = path_or_url
+        def _open() -> None:
+            DB_Manager.set_custom_path(path)
+            DB_Manager().init_database()
+            self.repo.invalidate()
+            self.repoJ.invalidate()
 
-        DB_Manager.set_custom_path(path)
-        DB_Manager().init_database()
+        def _failed(error: Exception) -> None:
+            print(f"[DB] Could not open {path}: {error}")
+            DB_Manager.set_custom_path(None)
+            self.load_poses()
 
-        QSettings().setValue("last_db_path", path)
+        def _opened(_) -> None:
+            self.load_poses()
+            self._solve_poses()
+
+        self._db.submit(_open, on_done=_opened, on_error=_failed)
+
+    def _check_external_changes(self) -> None:
+        self._db.submit(self._external_change_job, self.repo, self.repoJ,
+                        on_done=lambda changed: changed and self._on_external_change())
+
+    @staticmethod
+    def _external_change_job(repo, repoJ) -> bool:
+        from db.db_manager import DB_Manager
+        if not DB_Manager.has_path():
+            return False
+        # No short-circuit: both caches must see the new version.
+        changed = [cache.refresh_if_changed(force_check=True) for cache in (repo, repoJ)]
+        return any(changed)
+
+    def _on_external_change(self) -> None:
+        print("[DB] Database changed outside this app, reloading poses")
+        self.pose_model.reload()
+
+    def shutdown(self) -> None:
+        """Stop the DB thread (closing the connection); call on app quit."""
+        self._compute.shutdown(wait=False, cancel_futures=True)
+        self._db.stop()
+        if self._telemetry is not None:
+            self._telemetry.stop()
+        self.robots.shutdown()
 
-        self.databaseChanged.emit(path)
-        self.load_poses()
-    
     @Slot()
     def get_current_pose(self): 
-        position_model = _SERVICE.get_current_pose()
-        if position_model:
-            self.currentPoseLoaded.emit(position_model.as_dict())
+        self._capture_pose(lambda snapshot: self.currentPoseLoaded.emit(snapshot.as_position().as_dict()))
     
     @Slot()
     def get_current_joint_pose(self): 
-        position_model = _SERVICE.get_current_joint_pose()
-        if position_model:
-            self.currentJointPoseLoaded.emit(position_model.as_dict())
+        self._capture_pose(lambda snapshot: self.currentJointPoseLoaded.emit(snapshot.as_joint_position().as_dict()))
+
+    def _capture_pose(self, emit) -> None:
+        """One state-frame capture of TCP, joints and config (see RobotService.capture_pose)."""
+        def _on_done(snapshot: PoseSnapshot) -> None:
+            self._last_capture = snapshot
+            emit(snapshot)
+        cell = self._selected_cell("Pose capture")
+        if cell is None:
+            return
+        cell.io.submit(_SERVICE.capture_pose, priority=PRIORITY_QUERY, kind="capture",
+                       on_done=_on_done,
+                       on_error=lambda e: print(f"[PositionController] Pose capture failed: {e}"))
 
     @Slot(str, float, float, float, float, float, float)
     def move_j(self, name, x, y, z, rx, ry, rz): 
@@ -179,11 +348,348 @@ class PositionController(QObject):
             rz=rz
         )
 
-        _SERVICE.move(points)
+        self._move_cartesian(_SERVICE.move, points)
+
+    def _move(self, move, points, *args) -> None:
+        """Queue a RobotService move; stop_motion cancels it if still waiting."""
+        cell = self._selected_cell(move.__name__)
+        if cell is None:
+            return
+        cell.hub.kick()
+        cell.io.submit(move, points, *args, kind="motion",
+                       on_error=lambda e: print(f"[PositionController] {move.__name__} failed: {e}"))
+
+    def _move_cartesian(self, move, points) -> None:
+        """_move for a saved cartesian pose, using its stored joint solution if valid."""
+        key = self._solution_key
+        if key is None:
+            self._move(move, points)
+            return
+        self._db.submit(self.repo.get_solution, points, key,
+                        on_done=lambda joints: self._move(move, points, joints),
+                        on_error=lambda _e: self._move(move, points))
+
+    # ── RPC latency statistics ────────────────────────────────────────────────
+
+    @Slot(bool)
+    def set_rpc_stats_enabled(self, enabled: bool) -> None:
+        """Start / stop timing controller calls (see utils.rpc_stats)."""
+        RPC_STATS.enabled = enabled
+        self.refresh_rpc_stats()
+
+    @Slot()
+    def refresh_rpc_stats(self) -> None:
+        snapshot = RPC_STATS.snapshot()
+        # A list keeps the slowest-first order for the QML ListView.
+        snapshot["methods"] = [{"name": name, **stats} for name, stats in snapshot["methods"].items()]
+        self.rpcStatsUpdated.emit(snapshot)
+
+    @Slot()
+    def reset_rpc_stats(self) -> None:
+        RPC_STATS.reset()
+        self.refresh_rpc_stats()
+
+    @Slot(str)
+    def dump_rpc_stats(self, path_or_url: str) -> None:
+        """Write the current statistics to a JSON file."""
+        try:
+            path = RPC_STATS.dump_json(self._local_path(path_or_url))
+            print(f"[PositionController] RPC statistics written to {path}")
+        except OSError as e:
+            print(f"[PositionController] Could not write RPC statistics: {e}")
+
+    # ── Telemetry recording / replay ──────────────────────────────────────────
+
+    @staticmethod
+    def _telemetry_dir() -> Path:
+        from PySide6.QtCore import QStandardPaths
+        return Path(QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)) / "telemetry"
+
+    def _live_state_pkg(self):
+        cell = self.robots.current
+        robot = cell.io.robot if cell is not None else None
+        return robot.robot_state_pkg if robot is not None else None
+
+    @Slot()
+    def start_telemetry(self) -> None:
+        """Record robot_state_pkg at the controller rate (segments every minute)."""
+        if self._telemetry is None:
+            directory = self._telemetry_dir()
+            ring = TelemetryRing(directory / "live.ring", int(RING_SECONDS / SAMPLE_PERIOD_S))
+            self._telemetry = TelemetryRecorder(ring, self._live_state_pkg, directory)
+        self._telemetry.start()
+        self._emit_telemetry(message=f"Recording to {self._telemetry.segment_dir}")
+
+    @Slot()
+    def stop_telemetry(self) -> None:
+        if self._telemetry is None or not self._telemetry.recording:
+            return
+        path = self._telemetry.stop()
+        self._emit_telemetry(message=f"Saved {path.name}" if path else "Nothing recorded")
+
+    @Slot(str, float)
+    def replay_telemetry(self, path_or_url: str, speed: float) -> None:
+        """Play a recorded segment into the jog panel, status chips and 3D viewer."""
+        try:
+            records = load_segment(self._local_path(path_or_url))
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[PositionController] Could not load telemetry: {e}")
+            self._emit_telemetry(message=f"Could not load: {e}")
+            return
+        # The live state stands down while recorded frames drive the UI.
+        if self._state_hub is not None:
+            self._state_hub.set_paused(True)
+        self._replay.start(records, speed)
+        self._emit_telemetry(message=f"Replaying {len(records)} samples at {speed:g}x")
+
+    @Slot()
+    def stop_replay(self) -> None:
+        self._replay.stop()
+
+    def _on_replay_frame(self, frame: dict) -> None:
+        self.robot_state.apply(frame)
+        self.replayJoints.emit({f"j{i + 1}": deg for i, deg in enumerate(frame["joints"])})
+
+    def _emit_telemetry(self, **extra) -> None:
+        self.telemetryStatus.emit({
+            "recording": self._telemetry is not None and self._telemetry.recording,
+            "replaying": self._replay.running,
+            **extra,
+        })
+
+    # ── Stored joint solutions ────────────────────────────────────────────────
+
+    @property
+    def _solution_key(self) -> str | None:
+        """Key of the stored joint solutions valid for the selected robot."""
+        return self._solver[1] if self._solver is not None else None
+
+    def _request_solver(self, cell) -> None:
+        cell.io.submit(_SERVICE.solver, priority=PRIORITY_QUERY,
+                       on_done=lambda solver: cell is self.robots.current and self._on_solver(solver))
+
+    def _on_solver(self, solver) -> None:
+        self._solver = solver
+        if solver is None:
+            print("[PositionController] Local IK unavailable, saved poses are solved at move time")
+            return
+        self._solve_poses()
+
+    def _solve_poses(self) -> None:
+        """Solve every cartesian pose not yet solved for the connected robot, then check them all."""
+        if self._solver is None:
+            return
+        kin, key = self._solver
+        self._sweep("Solving saved poses", self._solve_poses,
+                    read=lambda: self.repo.get_unsolved(key) if self._db_ready() else [],
+                    compute=lambda rows: solve_rows(kin, rows),
+                    store=lambda rows, solved: store_solutions(self.repo, key, rows, solved),
+                    on_stored=lambda count: count and print(f"[DB] Stored joint solutions for {count} poses"))
+        self._check_poses()
+
+    @Slot()
+    def validate_poses(self) -> None:
+        if self._solver is None:
+            print("[PositionController] Pose check needs local IK verified on a connected robot")
+            return
+        self._check_poses()
+
+    def _check_poses(self) -> None:
+        """Reachability check of every pose not yet checked for the selected robot (see pose_validation)."""
+        if self._solver is None:
+            return
+        kin, key = self._solver
+        started = time.perf_counter()
+
+        def _store(rows: dict, statuses: dict) -> dict:
+            store_results(self.repo, self.repoJ, key, rows, statuses)
+            return results_by_id(rows, statuses)
+
+        self._sweep("Checking saved poses", self._check_poses,
+                    read=lambda: read_unchecked(self.repo, self.repoJ, key) if self._db_ready() else {},
+                    compute=lambda rows: check_rows(kin, rows),
+                    store=_store,
+                    on_stored=lambda results: self._on_validated(results, started))
+
+    @staticmethod
+    def _db_ready() -> bool:
+        from db.db_manager import DB_Manager
+        return DB_Manager.has_path()
+
+    def _sweep(self, label: str, restart, read, compute, store, on_stored) -> None:
+        """One library pass split across threads so the DB thread never runs the IK.
+
+        read() and store(rows, result) run on the DB thread, compute(rows)
+        on the compute thread, on_stored(stored) back here. One pass per
+        label at a time: asking again meanwhile runs restart() once it ends.
+        """
+        if label in self._sweeps:
+            self._sweeps[label] = True
+            return
+        self._sweeps[label] = False
+
+        def _end(error: Exception | None = None) -> None:
+            if error is not None:
+                print(f"[DB] {label} failed: {error}")
+            if self._sweeps.pop(label, False):
+                restart()
+
+        def _stored(stored) -> None:
+            on_stored(stored)
+            _end()
+
+        def _computed(rows, future: Future) -> None:
+            try:
+                result = future.result()
+            except Exception as e:
+                _end(e)
+                return
+            self._db.submit(store, rows, result, on_done=_stored, on_error=_end)
+
+        def _read(rows) -> None:
+            if not rows:
+                _end()
+                return
+            self._run_compute(compute, rows, on_done=lambda future: _computed(rows, future))
+
+        self._db.submit(read, on_done=_read, on_error=_end)
+
+    def _on_validated(self, results: dict, started: float) -> None:
+        checked = sum(len(ids) for ids, _ in results.values())
+        if not checked:
+            return
+        for pose_type, (ids, statuses) in results.items():
+            self.pose_model.set_checks(pose_type, ids, statuses)
+        problems = sum(int((statuses != CHECK_OK).sum()) for _, statuses in results.values())
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        print(f"[DB] Checked {checked} poses in {elapsed_ms:.0f} ms, {problems} with problems")
+        self.posesChecked.emit(checked, problems)
     
     @Slot()
     def stop_motion(self):
-        _SERVICE.stop_motion()
+        self._jog.stop()
+        if self._program.running:
+            self._program.stop()
+            return
+        cell = self._selected_cell("StopMotion")
+        if cell is not None:
+            cell.io.stop()
+
+    @Slot()
+    def stop_all(self) -> None:
+        """Stop every robot at once, not just the selected one."""
+        self._jog.stop()
+        if self._program.running:
+            self._program.stop()
+        started = time.perf_counter()
+        self.robots.stop_all(on_done=lambda results: self._on_stopped_all(results, started))
+
+    def _on_stopped_all(self, results: dict, started: float) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        print(f"[PositionController] Stop all: {len(results)} robot(s) in {elapsed_ms:.0f} ms")
+        for name, result in results.items():
+            if isinstance(result, Exception):
+                print(f"[PositionController] Stop on '{name}' failed: {result}")
+
+    @Slot()
+    def read_all_states(self) -> None:
+        """Read every connected robot's state in parallel; answered through robotsStates."""
+        self.robots.fan_out(_SERVICE.read_state, on_done=lambda results: self.robotsStates.emit([
+            {"name": name, "error": str(r)} if isinstance(r, Exception) else {"name": name, **r}
+            for name, r in results.items()]))
+
+    # ── Program execution ─────────────────────────────────────────────────────
+
+    @Slot(list, float, int)
+    def run_program(self, poses: list, blend_ms: float, lookahead: int) -> None:
+        """Run the chosen saved poses in order as one blended motion.
+
+        `poses` is a list of {name, type} with type 'cartesian' | 'joint',
+        in the order the user picked them; it must not be empty.
+        """
+        self._run_program(poses, blend_ms, lookahead)
+
+    @Slot(list, float, int, bool, bool)
+    def run_program_optimized(self, poses: list, blend_ms: float, lookahead: int,
+                              fix_start: bool, fix_end: bool) -> None:
+        """run_program with the visits reordered for the shortest estimated cycle time.
+
+        fix_start / fix_end keep the first / last pose of `poses` in place;
+        an open start begins nearest the arm's current joints.
+        """
+        start_joints = None if fix_start else self._state_hub and self._state_hub.snapshot.get("joints")
+        kin = self._solver[0] if self._solver is not None else None
+        self._run_program(poses, blend_ms, lookahead, (kin, start_joints, fix_start, fix_end))
+
+    def _run_program(self, poses: list, blend_ms: float, lookahead: int, ordering: tuple | None = None) -> None:
+        if self._program.running:
+            print("[PositionController] A program is already running")
+            return
+        if not poses:
+            print("[PositionController] No poses selected for the program")
+            self.programFinished.emit(False, "No poses selected")
+            return
+        # Runs on the robot selected now, even if the selection changes meanwhile.
+        cell = self._selected_cell("Program")
+        if cell is None:
+            self.programFinished.emit(False, "No robot selected")
+            return
+        io = cell.io
+        self._db.submit(self._program_job, self.repo, self.repoJ, list(poses), self._solution_key,
+                        on_done=lambda steps: self._order_program(io, steps, ordering, blend_ms, lookahead),
+                        on_error=lambda e: self.programFinished.emit(False, str(e)))
+
+    def _order_program(self, io: RobotExecutor, steps: list[ProgramStep], ordering: tuple | None,
+                       blend_ms: float, lookahead: int) -> None:
+        """Steps are loaded; reorder them on the compute thread if asked, then start."""
+        if ordering is None or len(steps) < 3:
+            self._program.start(io, steps, blend_ms, lookahead)
+            return
+        self._run_compute(order_steps, steps, *ordering,
+                          on_done=lambda future: self._on_program_ordered(io, steps, future, blend_ms, lookahead))
+
+    def _on_program_ordered(self, io: RobotExecutor, steps: list[ProgramStep], future: Future,
+                            blend_ms: float, lookahead: int) -> None:
+        try:
+            ordered = future.result()
+        except Exception as e:
+            self.programFinished.emit(False, str(e))
+            return
+        if ordered is None:
+            print("[PositionController] Some poses have no joint solution, running them in the given order")
+        else:
+            steps, before_s, after_s = ordered
+            print(f"[PositionController] Program order optimized: {before_s:.1f} s -> {after_s:.1f} s (estimated travel)")
+            self.programOrdered.emit(before_s, after_s)
+        self._program.start(io, steps, blend_ms, lookahead)
+
+    def _run_compute(self, fn, *args, on_done) -> None:
+        """Run fn(*args) on the compute thread; on_done(future) is called on the GUI thread."""
+        self._compute.submit(fn, *args).add_done_callback(lambda future: self._computed.emit(on_done, future))
+
+    @Slot(object, object)
+    def _on_computed(self, on_done, future: Future) -> None:
+        if not future.cancelled():
+            on_done(future)
+
+    @Slot()
+    def stop_program(self) -> None:
+        self._program.stop()
+
+    @staticmethod
+    def _program_job(repo, repoJ, poses: list, key: str | None) -> list[ProgramStep]:
+        steps = []
+        for entry in poses:
+            source = repoJ if entry.get("type") == "joint" else repo
+            pose = source.get_pose(entry["name"])
+            if pose is None:
+                raise ValueError(f"Pose '{entry['name']}' not found")
+            step = ProgramStep.from_model(pose)
+            # Cartesian steps with a stored solution skip IK in the runner.
+            if key and step.kind == "cartesian":
+                step.joints = repo.get_solution(pose, key)
+            steps.append(step)
+        return steps
 
     # ── Gamepad QML sync slots ────────────────────────────────────────────────
 
@@ -306,41 +812,25 @@ class PositionController(QObject):
         """Jog in base-frame cartesian space.
         axis: 'x'|'y'|'z'|'rx'|'ry'|'rz', direction: 1 or -1, step: mm / degrees.
         Moves to current_pose + delta; call stop_motion() on button release."""
-        from utils.robot_singleton import RobotSingletonRCP
-        try:
-            robot = RobotSingletonRCP()
-            res = robot.GetActualTCPPose()
-            if not isinstance(res, tuple):
-                return
-            _, pose = res
-            target = [float(v) for v in pose[:6]]
-            idx = {'x': 0, 'y': 1, 'z': 2, 'rx': 3, 'ry': 4, 'rz': 5}.get(axis, -1)
-            if idx < 0:
-                return
-            target[idx] += direction * step
-            cfg = robot.GetRobotCurJointsConfig()
-            config = cfg[1] if isinstance(cfg, tuple) and cfg[0] == 0 else -1
-            ik = robot.GetInverseKin(desc_pos=target, type=0, config=config)
-            if isinstance(ik, tuple) and ik[0] == 0:
-                robot.MoveJ(joint_pos=ik[1], tool=1, user=0, vel=100, blendT=0)
-        except Exception as e:
-            print(f"[PositionController] jog_cartesian failed: {e}")
+        self._submit_jog(self._jog.jog_cartesian, axis, direction, step)
 
     @Slot(int, int, float)
     def jog_joint(self, joint_idx: int, direction: int, step: float) -> None:
         """Jog a single joint. joint_idx: 0–5, direction: 1 or -1, step: degrees."""
-        from utils.robot_singleton import RobotSingletonRCP
-        try:
-            robot = RobotSingletonRCP()
-            res = robot.GetActualJointPosDegree(0)
-            if not isinstance(res, tuple):
-                return
-            _, joints = res
-            target = [float(j) for j in joints[:6]]
-            target[joint_idx] += direction * step
-            robot.MoveJ(joint_pos=target, tool=1, user=0, vel=100, blendT=0)
-        except Exception as e:
-            print(f"[PositionController] jog_joint failed: {e}")
+        self._submit_jog(self._jog.jog_joint, joint_idx, direction, step)
+
+    _JOG_TIMEOUT_S = 0.25   # a jog tick older than this is no longer what the operator wants
+
+    def _submit_jog(self, jog, *args) -> None:
+        # One pending tick at most: a newer tick replaces one still queued.
+        cell = self._selected_cell(jog.__name__)
+        if cell is None:
+            return
+        cell.hub.kick()
+        cell.io.submit(
+            jog, *args, kind="motion", key="jog", timeout=self._JOG_TIMEOUT_S,
+            on_done=lambda _: self.jogLatencyUpdated.emit(self._jog.latency.as_dict()),
+            on_error=lambda e: print(f"[PositionController] {jog.__name__} failed: {e}"))
 
     @Slot(str, float, float, float, float, float, float)
     def move_joints(self, name, j1, j2, j3, j4, j5, j6):
@@ -355,7 +845,7 @@ class PositionController(QObject):
             j6=j6
         )
 
-        _SERVICE.move_joints(points)
+        self._move(_SERVICE.move_joints, points)
 
     @Slot(str, str, str)
     def move_j_with_offset(self, name, base_csv, offset_csv):
@@ -366,7 +856,7 @@ class PositionController(QObject):
         points = PositionModel(id=None, name=name,
                                x=b[0], y=b[1], z=b[2], rx=b[3], ry=b[4], rz=b[5],
                                dx=o[0], dy=o[1], dz=o[2], drx=o[3], dry=o[4], drz=o[5])
-        _SERVICE.move_with_offset(points)
+        self._move_cartesian(_SERVICE.move_with_offset, points)
 
     @Slot(str, str, str)
     def move_joints_with_offset(self, name, base_csv, offset_csv):
@@ -377,85 +867,191 @@ class PositionController(QObject):
         points = PositionJModel(id=None, name=name,
                                 j1=b[0], j2=b[1], j3=b[2], j4=b[3], j5=b[4], j6=b[5],
                                 dx=o[0], dy=o[1], dz=o[2], drx=o[3], dry=o[4], drz=o[5])
-        _SERVICE.move_joints_with_offset(points)
+        self._move(_SERVICE.move_joints_with_offset, points)
 
     @Slot()
     def load_poses(self):
         from db.db_manager import DB_Manager
-        if not DB_Manager.has_path():
-            # No DB selected yet — emit empty list + empty path so the UI clears
-            # both the pose list and the picker label.
-            self.databaseChanged.emit("")
-            self.posesLoaded.emit([])
+        # No DB selected yet — emit an empty path so the picker label clears;
+        # the model comes back empty on its own.
+        self.databaseChanged.emit(str(DB_Manager.current_path()) if DB_Manager.has_path() else "")
+        self.pose_model.reload()
+
+    @Slot(str)
+    def search_poses(self, text: str) -> None:
+        """Filter the pose list by name; called on every keystroke, debounced."""
+        self._search_text = text
+        self._search_timer.start()
+
+    @Slot(str)
+    def search_poses_now(self, text: str) -> None:
+        """Filter immediately (Search button / Enter)."""
+        self._search_timer.stop()
+        self._search_text = text
+        self._run_search()
+
+    def _run_search(self) -> None:
+        self.pose_model.set_filter(self._search_text)
+
+    @staticmethod
+    def _local_path(path_or_url: str) -> str:
+        from PySide6.QtCore import QUrl
+        if path_or_url.startswith("file:"):
+            return QUrl(path_or_url).toLocalFile()
+        return path_or_url
+
+    @Slot(str)
+    def export_poses(self, path_or_url: str) -> None:
+        """Write the whole library (both tables) to a columnar .npz file."""
+        from services.pose_archive import export_poses
+        path = self._local_path(path_or_url)
+        repos = {"tcp": self.repo, "joint": self.repoJ}
+        progress = lambda done, total: self.transferProgress.emit("export", done, total)
+        self._db.submit(export_poses, repos, path, progress,
+                        on_done=lambda count: self._on_transfer("export", f"{count} poses exported to {path}"),
+                        on_error=lambda e: self._on_transfer_failed("export", e))
+
+    @Slot(str, bool)
+    def import_poses(self, path_or_url: str, replace: bool) -> None:
+        """Load a .npz library; existing names are skipped unless `replace`."""
+        from services.pose_archive import import_poses
+        path = self._local_path(path_or_url)
+        repos = {"tcp": self.repo, "joint": self.repoJ}
+        progress = lambda done, total: self.transferProgress.emit("import", done, total)
+
+        def _done(count: int) -> None:
+            self._on_transfer("import", f"{count} poses imported from {path}")
+            self.pose_model.reload()
+            self._solve_poses()
+
+        self._db.submit(import_poses, repos, path, replace, progress,
+                        on_done=_done, on_error=lambda e: self._on_transfer_failed("import", e))
+
+    def _on_transfer(self, operation: str, message: str) -> None:
+        print(f"[POSITION_CONTROLLER] {message}")
+        self.transferFinished.emit(operation, True, message)
+
+    def _on_transfer_failed(self, operation: str, error: Exception) -> None:
+        print(f"[POSITION_CONTROLLER] {operation} failed: {error}")
+        self.transferFinished.emit(operation, False, str(error))
+
+    @staticmethod
+    def _pose_dict(pose: PositionModel | PositionJModel, pose_type: str) -> dict:
+        pose_dict = pose.as_dict()
+        pose_dict['type'] = pose_type
+        return pose_dict
+
+    # ── DB jobs (run on the DbWorker thread) ──────────────────────────────────
+    # Each write returns its WriteResult together with the row it touched, so
+    # the GUI-thread callback can emit the delta without another query.
+
+    @staticmethod
+    def _insert_job(repo, pose):
+        result = repo.insert_pose(pose)
+        return result, repo.get_pose(pose.name) if result.ok else None
+
+    @staticmethod
+    def _update_job(repo, pose, actualName):
+        result = repo.update_pose(pose, actualName)
+        return result, repo.get_pose(pose.name) if result.ok else None
+
+    @staticmethod
+    def _update_offset_job(repo, pose, actualName):
+        result = repo.update_offset(pose, actualName)
+        return result, repo.get_pose(actualName) if result.ok else None
+
+    @staticmethod
+    def _delete_job(repos, name):
+        return [pose_type for pose_type, repo in repos if repo.delete_pose(name).ok]
+
+    @staticmethod
+    def _delete_all_job(repo, repoJ):
+        repo.delete_all_poses()
+        repoJ.delete_all_poses()
+
+    def _on_inserted(self, outcome, pose_type: str, name: str) -> None:
+        result, pose = outcome
+        label = "juntas" if pose_type == 'joint' else "cartesiano"
+        if result is WriteResult.CONFLICT:
+            print(f"[POSITION_CONTROLLER] AVISO: Posição '{name}' já existe ({label}), não será salva")
             return
+        print(f"[POSITION_CONTROLLER] Posição '{name}' salva com sucesso ({label})")
+        if pose:
+            self.poseInserted.emit(self._pose_dict(pose, pose_type))
+        if pose_type == 'cartesian':
+            self._solve_poses()
+        else:
+            self._check_poses()
 
-        self.databaseChanged.emit(str(DB_Manager.current_path()))
-
-        cartesian_poses = self.repo.get_all_poses()
-        joint_poses = self.repoJ.get_all_poses()
-        
-        # Combina ambas as listas e adiciona um campo 'type' para identificar
-        all_poses = []
-        for pose in cartesian_poses:
-            pose_dict = pose.as_dict()
-            pose_dict['type'] = 'cartesian'
-            all_poses.append(pose_dict)
-        
-        for pose in joint_poses:
-            pose_dict = pose.as_dict()
-            pose_dict['type'] = 'joint'
-            all_poses.append(pose_dict)
-        
-        self.posesLoaded.emit(all_poses)
+    def _on_updated(self, outcome, pose_type: str, actualName: str, name: str) -> None:
+        result, pose = outcome
+        label = "juntas" if pose_type == 'joint' else "cartesiano"
+        if result is WriteResult.CONFLICT:
+            print(f"[POSITION_CONTROLLER] AVISO: Nome '{name}' já existe ({label}), não será atualizado")
+            return
+        if result is WriteResult.NOT_FOUND:
+            print(f"[POSITION_CONTROLLER] AVISO: Posição '{actualName}' não encontrada ({label})")
+            return
+        print(f"[POSITION_CONTROLLER] Posição '{actualName}' atualizada ({label}) com sucesso")
+        if pose:
+            self.poseUpdated.emit(actualName, self._pose_dict(pose, pose_type))
+        if pose_type == 'cartesian':
+            self._solve_poses()
+        else:
+            self._check_poses()
+
+    def _on_removed(self, removed_types: list[str], name: str) -> None:
+        for pose_type in removed_types:
+            self.poseRemoved.emit(pose_type, name)
 
     @Slot()
     def delete_all_poses(self):
-        self.repo.delete_all_poses()
-        self.repoJ.delete_all_poses()
-        self.load_poses()
+        self._db.submit(self._delete_all_job, self.repo, self.repoJ,
+                        on_done=lambda _: self.pose_model.reload())
 
     @Slot(str)
     def delete_pose(self, name):
         # Tenta deletar de ambos os repositórios (pode não existir em um deles)
-        try:
-            self.repo.delete_pose(name)
-        except:
-            pass
-        try:
-            self.repoJ.delete_pose(name)
-        except:
-            pass
-        self.load_poses()
+        repos = [('cartesian', self.repo), ('joint', self.repoJ)]
+        self._db.submit(self._delete_job, repos, name,
+                        on_done=lambda removed: self._on_removed(removed, name))
     
     @Slot(str, str)
     def delete_pose_by_type(self, name, pose_type):
         if pose_type == "joint":
-            self.repoJ.delete_pose(name)
+            repos = [('joint', self.repoJ)]
         else:
-            self.repo.delete_pose(name)
-        self.load_poses()
+            repos = [('cartesian', self.repo)]
+        self._db.submit(self._delete_job, repos, name,
+                        on_done=lambda removed: self._on_removed(removed, name))
 
     @Slot(str, float, float, float, float, float, float)
     def save_pose(self, name, x, y, z, rx, ry, rz):
         print(f"[POSITION_CONTROLLER] SALVAR - Tipo: CARTESIANO")
         print(f"[POSITION_CONTROLLER] Nome: {name}, X: {x}, Y: {y}, Z: {z}, RX: {rx}, RY: {ry}, RZ: {rz}")
-        poses = self.repo.get_all_poses()
-        for p in poses:
-            if p.name == name:
-                print(f"[POSITION_CONTROLLER] AVISO: Posição '{name}' já existe (cartesiano), não será salva")
-                return
+        cell = self.robots.current
+        if cell is None:
+            self._insert_cartesian(name, x, y, z, rx, ry, rz, None)
+            return
+        captured = self._last_capture
+        # The popup shows captures to 2 decimals; an unedited capture saves
+        # with the config from that same frame, no round trip needed.
+        if captured is not None and captured.config >= 0 \
+                and captured.matches_tcp([x, y, z, rx, ry, rz], _CAPTURE_MATCH_TOLERANCE):
+            self._insert_cartesian(name, x, y, z, rx, ry, rz, (0, captured.config))
+            return
+        cell.io.submit(
+            lambda robot: robot.GetRobotCurJointsConfig(), priority=PRIORITY_QUERY,
+            on_done=lambda result: self._insert_cartesian(name, x, y, z, rx, ry, rz, result),
+            # No robot: the pose is still saved, with config -1 (solve from current joints).
+            on_error=lambda _: self._insert_cartesian(name, x, y, z, rx, ry, rz, None))
 
+    def _insert_cartesian(self, name, x, y, z, rx, ry, rz, config_result) -> None:
         config = -1
-        try:
-            from utils.robot_singleton import RobotSingletonRCP
-            robot = RobotSingletonRCP()
-            result = robot.GetRobotCurJointsConfig()
-            if isinstance(result, tuple):
-                error, data = result
-                if error == 0:
-                    config = data
-        except Exception:
-            pass
+        if isinstance(config_result, tuple):
+            error, data = config_result
+            if error == 0:
+                config = data
 
         pose = PositionModel(
             id=None,
@@ -469,20 +1065,13 @@ class PositionController(QObject):
             config=config,
             created_at=None
         )
-        self.repo.insert_pose(pose)
-        print(f"[POSITION_CONTROLLER] Posição cartesiana '{name}' salva com sucesso")
-        self.load_poses()
+        self._db.submit(self._insert_job, self.repo, pose,
+                        on_done=lambda outcome: self._on_inserted(outcome, 'cartesian', name))
     
     @Slot(str, float, float, float, float, float, float)
     def save_joint_pose(self, name, j1, j2, j3, j4, j5, j6): 
         print(f"[POSITION_CONTROLLER] SALVAR - Tipo: JUNTAS")
         print(f"[POSITION_CONTROLLER] Nome: {name}, J1: {j1}, J2: {j2}, J3: {j3}, J4: {j4}, J5: {j5}, J6: {j6}")
-        poses = self.repoJ.get_all_poses()  
-        for p in poses:
-            if p.name == name:
-                print(f"[POSITION_CONTROLLER] AVISO: Posição '{name}' já existe (juntas), não será salva")
-                return
-            
         pose = PositionJModel(
             id=None,
             name=name,
@@ -494,20 +1083,11 @@ class PositionController(QObject):
             j6=j6,
             created_at=None
         )
-        self.repoJ.insert_pose(pose)
-        print(f"[POSITION_CONTROLLER] Posição de juntas '{name}' salva com sucesso")
-        self.load_poses()
+        self._db.submit(self._insert_job, self.repoJ, pose,
+                        on_done=lambda outcome: self._on_inserted(outcome, 'joint', name))
 
     @Slot( str, str, float, float, float, float, float, float)
     def update_pose(self,actualName, name, x, y, z, rx, ry, rz):
-
-        if actualName != name:
-            poses = self.repo.get_all_poses()  
-            for p in poses:
-                if p.name == name:
-                    print(f"[POSITION_CONTROLLER] AVISO: Nome '{name}' já existe (cartesiano), não será atualizado")
-                    return
-                
         pose = PositionModel(
             id=None,
             name=name,
@@ -518,9 +1098,8 @@ class PositionController(QObject):
             ry=ry, 
             rz=rz
         )
-        self.repo.update_pose(pose, actualName)
-        print(f"[POSITION_CONTROLLER] Posição cartesiana '{actualName}' atualizada para '{name}' com sucesso")
-        self.load_poses()
+        self._db.submit(self._update_job, self.repo, pose, actualName,
+                        on_done=lambda outcome: self._on_updated(outcome, 'cartesian', actualName, name))
 
     @Slot(str, float, float, float, float, float, float)
     def update_pose_offset(self, actualName, dx, dy, dz, drx, dry, drz):
@@ -534,9 +1113,8 @@ class PositionController(QObject):
             dry=dry,
             drz=drz
         )
-        self.repo.update_offset(pose, actualName)
-        print(f"[POSITION_CONTROLLER] Offset cartesiano '{actualName}' atualizado com sucesso")
-        self.load_poses()
+        self._db.submit(self._update_offset_job, self.repo, pose, actualName,
+                        on_done=lambda outcome: self._on_updated(outcome, 'cartesian', actualName, actualName))
     
     @Slot( str, str, float, float, float, float, float, float)
     def update_joint_pose(self, actualName, name, j1, j2, j3, j4, j5, j6):
@@ -544,13 +1122,6 @@ class PositionController(QObject):
         print(f"[POSITION_CONTROLLER] Nome atual: {actualName}, Novo nome: {name}")
         print(f"[POSITION_CONTROLLER] Valores: J1: {j1}, J2: {j2}, J3: {j3}, J4: {j4}, J5: {j5}, J6: {j6}")
 
-        if actualName != name:
-            poses = self.repoJ.get_all_poses()  
-            for p in poses:
-                if p.name == name:
-                    print(f"[POSITION_CONTROLLER] AVISO: Nome '{name}' já existe (juntas), não será atualizado")
-                    return
-                
         pose = PositionJModel(
             id=None,
             name=name,
@@ -561,9 +1132,8 @@ class PositionController(QObject):
             j5=j5, 
             j6=j6
         )
-        self.repoJ.update_pose(pose, actualName)
-        print(f"[POSITION_CONTROLLER] Posição de juntas '{actualName}' atualizada para '{name}' com sucesso")
-        self.load_poses()
+        self._db.submit(self._update_job, self.repoJ, pose, actualName,
+                        on_done=lambda outcome: self._on_updated(outcome, 'joint', actualName, name))
 
     @Slot(str, float, float, float, float, float, float)
     def update_joint_offset(self, actualName, dx, dy, dz, drx, dry, drz):
@@ -577,7 +1147,5 @@ class PositionController(QObject):
             dry=dry,
             drz=drz
         )
-        self.repoJ.update_offset(pose, actualName)
-        print(f"[POSITION_CONTROLLER] Offset de juntas '{actualName}' atualizado com sucesso")
-        self.load_poses()
-
+        self._db.submit(self._update_offset_job, self.repoJ, pose, actualName,
+                        on_done=lambda outcome: self._on_updated(outcome, 'joint', actualName, actualName))
@@ -1,9 +1,11 @@
+import hashlib
 import sqlite3
 import sys
+import threading
 from pathlib import Path
 from functools import lru_cache
 from contextlib import contextmanager
-from typing import Generator, Any
+from typing import Generator, Any, Iterable, Iterator
 
 
 def _resource_root() -> Path:
@@ -13,14 +15,88 @@ def _resource_root() -> Path:
     # src/db/db_manager.py → src/db → src → project root
     return Path(__file__).resolve().parent.parent.parent
 
+# Transaction control inside a migration file; the runner owns the transaction.
+_TRANSACTION_STATEMENTS = {"BEGIN", "BEGIN TRANSACTION", "COMMIT", "COMMIT TRANSACTION", "END", "END TRANSACTION"}
+
+
+def _split_statements(script: str) -> list[str]:
+    """Split a migration script into complete statements (trigger bodies stay whole)."""
+    statements, buffer = [], ""
+    for line in script.splitlines(keepends=True):
+        if not buffer and line.lstrip().startswith("--"):
+            continue
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            statement = buffer.strip()
+            buffer = ""
+            if statement.rstrip(";").strip().upper() not in _TRANSACTION_STATEMENTS:
+                statements.append(statement)
+    if buffer.strip():
+        statements.append(buffer.strip())
+    return statements
+
+
 class DB_Manager:
     # The database path is selected at runtime via the file picker; there is no
     # default location and no DB file ships with the project.
     _custom_db_path: Path | None = None
 
+    # One long-lived connection per selected database, shared by every
+    # DB_Manager instance. Opening a file on a network share costs far more
+    # than the statements we run, so we pay it once per set_custom_path.
+    # The RLock serialises access from any thread that touches the DB.
+    _connection: sqlite3.Connection | None = None
+    _lock = threading.RLock()
+    # Bumped on every (re)open so caches can tell connections apart.
+    _generation = 0
+
+    # Applied once per connection. WAL lets readers and the writer overlap and
+    # turns most commits into an append; NORMAL sync is safe under WAL (only
+    # the last transaction can be lost on power failure, never corruption).
+    _PRAGMAS = (
+        "PRAGMA journal_mode = WAL",
+        "PRAGMA synchronous = NORMAL",
+        "PRAGMA cache_size = -16000",      # ~16 MB page cache
+        "PRAGMA mmap_size = 268435456",    # 256 MB memory-mapped reads
+        "PRAGMA temp_store = MEMORY",
+    )
+
     @classmethod
     def set_custom_path(cls, path: str | Path | None) -> None:
-        cls._custom_db_path = Path(path) if path else None
+        with cls._lock:
+            cls.close()
+            cls._custom_db_path = Path(path) if path else None
+            if cls._custom_db_path is not None:
+                cls._open()
+
+    @classmethod
+    def _open(cls) -> sqlite3.Connection:
+        """Return the shared connection, opening it on first use."""
+        if cls._connection is None:
+            if cls._custom_db_path is None:
+                raise RuntimeError(
+                    "No database selected. Pick a .db file via the UI's 'Select dB' button."
+                )
+            connection = sqlite3.connect(cls._custom_db_path, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            for pragma in cls._PRAGMAS:
+                connection.execute(pragma)
+            cls._connection = connection
+            cls._generation += 1
+            print(f"[DB] Opened connection: {cls._custom_db_path}")
+        return cls._connection
+
+    @classmethod
+    def close(cls) -> None:
+        """Close the shared connection (checkpoints the WAL back into the .db)."""
+        with cls._lock:
+            if cls._connection is None:
+                return
+            try:
+                cls._connection.close()
+                print(f"[DB] Closed connection: {cls._custom_db_path}")
+            finally:
+                cls._connection = None
 
     @classmethod
     def has_path(cls) -> bool:
@@ -44,16 +120,14 @@ class DB_Manager:
 
     @contextmanager
     def _connect(self) -> Generator[sqlite3.Connection, None, None]:
-        connection = sqlite3.connect(self._db_path)
-        connection.row_factory = sqlite3.Row
-        try:
-            yield connection
-            connection.commit()
-        except Exception:
-            connection.rollback()
-            raise
-        finally:
-            connection.close()
+        with DB_Manager._lock:
+            connection = DB_Manager._open()
+            try:
+                yield connection
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
 
     @lru_cache(maxsize=128)
     def load_sql(self, *parts: str) -> str:
@@ -67,93 +141,130 @@ class DB_Manager:
         migration_files = sorted(self._migrations_dir.glob("*.sql"))
         return migration_files
 
-    def _get_latest_migration(self) -> Path | None:
-        migration_files = self._get_all_migrations()
-        return migration_files[-1] if migration_files else None
-
-    def _column_exists(self, table_name: str, column_name: str) -> bool:
-        if not table_name.replace("_", "").replace("-", "").isalnum():
-            return False
-        if not column_name.replace("_", "").replace("-", "").isalnum():
-            return False
-        
-        with self._connect() as connection:
-            cursor = connection.cursor()
-            cursor.execute(f"PRAGMA table_info({table_name})")
-            columns = cursor.fetchall()
-            return any(col[1] == column_name for col in columns)
-
-    def _table_exists(self, table_name: str) -> bool:
-        if not table_name.replace("_", "").replace("-", "").isalnum():
-            return False
-
-        with self._connect() as connection:
-            cursor = connection.cursor()
-            cursor.execute(
-                "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?",
-                (table_name,),
-            )
-            return cursor.fetchone() is not None
-
-    def apply_latest_migration(self) -> None:
-        latest = self._get_latest_migration()
-        if not latest:
-            print("[DB] No migration found.")
-            return
-        self._apply_migration(latest)
+    def _applied_migrations(self, connection: sqlite3.Connection) -> dict[str, str] | None:
+        """{migration id: checksum} from schema_version, or None on a pre-versioning DB."""
+        try:
+            rows = connection.execute("SELECT id, checksum FROM schema_version").fetchall()
+        except sqlite3.OperationalError:
+            return None
+        return {row["id"]: row["checksum"] for row in rows}
 
     def apply_all_migrations(self) -> None:
-        """Aplica todas as migrations que ainda não foram aplicadas"""
+        """Apply every migration not yet recorded in schema_version.
+
+        Pending migrations run statement by statement inside one transaction
+        (their own BEGIN/COMMIT lines are skipped) and are recorded with a
+        checksum, so an up-to-date database costs a single SELECT here. On a
+        versioned database any failing statement aborts the whole batch.
+        """
         migrations = self._get_all_migrations()
         if not migrations:
             print("[DB] No migrations found.")
             return
-        
-        for migration in migrations:
-            try:
-                self._apply_migration(migration)
-            except sqlite3.OperationalError as e:
-                # Se a coluna já existe, ignora o erro
-                if "duplicate column" in str(e).lower() or "already exists" in str(e).lower():
-                    print(f"[DB] Migration {migration.name} already applied or column exists, skipping...")
-                else:
-                    raise
-
-    def _apply_migration(self, migration_path: Path) -> None:
-        """Aplica uma migration específica"""
-        script = migration_path.read_text(encoding="utf-8")
-        
-        # Verificação especial para migration de adicionar coluna
-        if "ADD COLUMN" in script.upper() and "config" in script:
-            column_name = "config"
-            if self._column_exists("tcp", column_name):
-                print(f"[DB] Column {column_name} already exists, skipping migration {migration_path.name}")
+
+        with self._connect() as connection:
+            applied = self._applied_migrations(connection)
+            pending = []
+            for migration in migrations:
+                script = migration.read_text(encoding="utf-8")
+                checksum = hashlib.sha256(script.encode("utf-8")).hexdigest()
+                if applied is not None and migration.stem in applied:
+                    if applied[migration.stem] != checksum:
+                        print(f"[DB] WARNING: migration {migration.name} changed after being applied")
+                    continue
+                pending.append((migration, script, checksum))
+
+            if not pending:
                 return
-        
+
+            connection.execute("BEGIN")
+            if applied is None:
+                # Databases created before versioning: their migrations were
+                # applied ad hoc, so statements that already took effect are
+                # tolerated (see _apply_statement) and recorded once here.
+                connection.execute(
+                    "CREATE TABLE schema_version ("
+                    " id TEXT PRIMARY KEY,"
+                    " checksum TEXT NOT NULL,"
+                    " applied_at TEXT DEFAULT (datetime('now')))"
+                )
+            for migration, script, checksum in pending:
+                for statement in _split_statements(script):
+                    self._apply_statement(connection, migration, statement, legacy=applied is None)
+                connection.execute(
+                    "INSERT INTO schema_version (id, checksum) VALUES (?, ?)",
+                    (migration.stem, checksum),
+                )
+                print(f"[DB] Applied migration: {migration.name}")
+
+    @staticmethod
+    def _apply_statement(connection: sqlite3.Connection, migration: Path, statement: str,
+                         legacy: bool = False) -> None:
+        """Run one migration statement.
+
+        Only while bootstrapping a pre-versioning database (legacy=True) are
+        errors from statements that already took effect tolerated.
+        """
+        try:
+            connection.execute(statement)
+        except sqlite3.OperationalError as e:
+            if not legacy:
+                raise
+            error_message = str(e).lower()
+            statement_lower = statement.lower()
+            # Se a coluna/tabela já existe, ignora o erro
+            if "duplicate column" in error_message or "already exists" in error_message:
+                print(f"[DB] Migration {migration.name} - already applied, skipping statement...")
+            # Se a tabela não existe em um RENAME, ignora o erro
+            elif "no such table" in error_message and "rename to" in statement_lower:
+                print(f"[DB] Migration {migration.name} - table missing, skipping rename...")
+            # Se o destino já existe em um RENAME, ignora o erro
+            elif "another table or index with this name" in error_message and "rename to" in statement_lower:
+                print(f"[DB] Migration {migration.name} - target already exists, skipping rename...")
+            # Se a tabela não existe em um ADD COLUMN, ignora o erro
+            elif "no such table" in error_message and "add column" in statement_lower:
+                print(f"[DB] Migration {migration.name} - table missing, skipping add column...")
+            else:
+                raise
+
+    def execute(self, sql: str, params: dict[str, Any] | None = None) -> int:
+        """Run a write statement and return the number of rows it touched."""
         with self._connect() as connection:
-            try:
-                connection.executescript(script)
-                print(f"[DB] Applied migration: {migration_path.name}")
-            except sqlite3.OperationalError as e:
-                error_message = str(e).lower()
-                # Se a coluna já existe, ignora o erro
-                if "duplicate column" in error_message or "already exists" in error_message:
-                    print(f"[DB] Migration {migration_path.name} - column already exists, skipping...")
-                # Se a tabela não existe em um RENAME, ignora o erro
-                elif "no such table" in error_message and "rename to" in script.lower():
-                    print(f"[DB] Migration {migration_path.name} - table missing, skipping rename...")
-                # Se o destino já existe em um RENAME, ignora o erro
-                elif "another table or index with this name" in error_message and "rename to" in script.lower():
-                    print(f"[DB] Migration {migration_path.name} - target already exists, skipping rename...")
-                # Se a tabela não existe em um ADD COLUMN, ignora o erro
-                elif "no such table" in error_message and "add column" in script.lower():
-                    print(f"[DB] Migration {migration_path.name} - table missing, skipping add column...")
-                else:
-                    raise
-
-    def execute(self, sql: str, params: dict[str, Any] | None = None) -> None:
+            return connection.execute(sql, params or {}).rowcount
+
+    def execute_many(self, sql: str, rows: Iterable[dict[str, Any]],
+                     before: str = "", after: str = "") -> int:
+        """Run one write statement per row in a single transaction.
+
+        `rows` may be a generator; it is consumed inside the transaction, so a
+        failure part-way through rolls the whole batch back. The optional
+        `before`/`after` scripts run in that same transaction.
+        """
+        with self._connect() as connection:
+            # Explicit: the sqlite3 module would not open one for DDL.
+            connection.execute("BEGIN")
+            for statement in _split_statements(before):
+                connection.execute(statement)
+            written = connection.executemany(sql, rows).rowcount
+            for statement in _split_statements(after):
+                connection.execute(statement)
+            return written
+
+    def fetch_rows(self, sql: str, params: dict[str, Any] | None = None) -> list[tuple]:
+        """Like fetch_all but plain tuples, for callers that build arrays."""
         with self._connect() as connection:
-            connection.execute(sql, params or {})
+            cursor = connection.execute(sql, params or {})
+            cursor.row_factory = None
+            return cursor.fetchall()
+
+    def fetch_batches(self, sql: str, size: int,
+                      params: dict[str, Any] | None = None) -> Iterator[list[tuple]]:
+        """Yield the result rows as plain tuples, `size` at a time."""
+        with self._connect() as connection:
+            cursor = connection.execute(sql, params or {})
+            cursor.row_factory = None
+            while batch := cursor.fetchmany(size):
+                yield batch
 
     def fetch_one(self, sql: str, params: dict[str, Any] | None = None) -> dict[str, Any] | None:
         with self._connect() as connection:
@@ -165,6 +276,16 @@ class DB_Manager:
             rows = connection.execute(sql, params or {}).fetchall()
             return [dict(row) for row in rows]
 
+    def data_version(self) -> tuple[int, int]:
+        """(connection generation, PRAGMA data_version).
+
+        data_version only moves when *another* connection commits to the
+        file, so a change means the database was edited from outside.
+        """
+        with self._connect() as connection:
+            version = connection.execute("PRAGMA data_version").fetchone()[0]
+            return DB_Manager._generation, version
+
     def init_database(self) -> None:
         print(f"[DB] Starting database: {self._db_path}")
         self.apply_all_migrations()
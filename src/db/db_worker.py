@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from PySide6.QtCore import QObject, QThread, Signal, Slot
+
+from db.db_manager import DB_Manager
+
+
+@dataclass(slots=True)
+class _Job:
+    fn: Callable[..., Any]
+    args: tuple
+    on_done: Callable[[Any], None] | None
+    on_error: Callable[[Exception], None] | None
+
+
+class _Runner(QObject):
+    """Lives on the worker thread; runs one job per queued call."""
+    done = Signal(object, object, object)   # job, result, error
+
+    @Slot(object)
+    def run(self, job: _Job) -> None:
+        try:
+            result, error = job.fn(*job.args), None
+        except Exception as e:
+            result, error = None, e
+        self.done.emit(job, result, error)
+
+
+class DbWorker(QObject):
+    """Single background thread that performs all SQLite I/O.
+
+    Callers on the GUI thread hand over repository calls with submit(); jobs
+    run strictly in submission order and their callbacks are delivered back
+    on the GUI thread in that same order, so a slow or locked .db never
+    stalls QML, jogging or status polling.
+    """
+    _submitted = Signal(object)
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._thread = QThread()
+        self._thread.setObjectName("db-worker")
+        self._runner = _Runner()
+        self._runner.moveToThread(self._thread)
+        # Both hops cross threads, so Qt queues them (FIFO per direction).
+        self._submitted.connect(self._runner.run)
+        self._runner.done.connect(self._deliver)
+        self._thread.start()
+
+    def submit(self, fn: Callable[..., Any], *args: Any,
+               on_done: Callable[[Any], None] | None = None,
+               on_error: Callable[[Exception], None] | None = None) -> None:
+        """Run fn(*args) on the worker; on_done(result) fires on the GUI thread."""
+        self._submitted.emit(_Job(fn, args, on_done, on_error))
+
+    @Slot(object, object, object)
+    def _deliver(self, job: _Job, result: Any, error: Exception | None) -> None:
+        if error is not None:
+            if job.on_error:
+                job.on_error(error)
+            else:
+                print(f"[DB] Job {getattr(job.fn, '__name__', job.fn)} failed: {error}")
+            return
+        if job.on_done:
+            job.on_done(result)
+
+    def stop(self) -> None:
+        """Finish the running job, stop the thread and close the connection."""
+        self._thread.quit()
+        self._thread.wait()
+        DB_Manager.close()
@@ -1,3 +1,4 @@
+import argparse
 from pathlib import Path
 from functools import partial
 from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
@@ -8,9 +9,8 @@ from PySide6.QtWidgets import QApplication
 from PySide6.QtQml import QQmlApplicationEngine
 from PySide6.QtWebEngineQuick import QtWebEngineQuick
 from controllers.position_controller import PositionController
-from utils.robot_singleton import RobotSingletonRCP
-from db.db_manager import DB_Manager
 from PySide6.QtGui import QIcon
+import os
 import sys
 
 
@@ -21,6 +21,24 @@ def _start_robot_viewer_server(directory: Path) -> ThreadingHTTPServer:
     return httpd
 
 
+# The cell's controller (its joint WebSocket server is on FEED_PORT, see RobotRegistry).
+ROBOT_IP = "192.168.167.199"
+
+
+def _parse_args() -> tuple[argparse.Namespace, list[str]]:
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--sim", action="store_true",
+                        help="run against the built-in simulated controller")
+    parser.add_argument("--sim-model", default=os.environ.get("ROBOT_MODEL", "FR3"),
+                        help="arm model for --sim (defaults to ROBOT_MODEL)")
+    parser.add_argument("--sim-latency-ms", type=float, default=2.0,
+                        help="mean RPC round trip for --sim")
+    parser.add_argument("--sim-port", type=int, default=9999,
+                        help="joint WebSocket port for --sim")
+    # Everything else (e.g. Qt's own -platform) goes on to QApplication.
+    return parser.parse_known_args()
+
+
 # Locate bundled resources whether running from source or from a PyInstaller
 # build. In a frozen build, sys._MEIPASS is the path to the bundled resource
 # directory; in source it's the project root (one level above this file).
@@ -31,6 +49,8 @@ else:
 
 
 def main() -> None:
+    args, qt_argv = _parse_args()
+
     # Identifies QSettings storage location per platform:
     #   macOS:   ~/Library/Preferences/com.robotine.RobotineController.plist
     #   Windows: HKCU\Software\Robotine\Robotine Controller
@@ -42,10 +62,9 @@ def main() -> None:
     settings = QSettings()
     saved_path = settings.value("last_db_path", "", type=str)
 
-    if saved_path and Path(saved_path).exists():
-        DB_Manager.set_custom_path(saved_path)
-        DB_Manager().init_database()
-        print(f"[DB] Resumed last database: {saved_path}")
+    resume_db = bool(saved_path) and Path(saved_path).exists()
+    if resume_db:
+        print(f"[DB] Resuming last database: {saved_path}")
     elif saved_path:
         print(f"[DB] Last database missing at {saved_path}; pick another via the UI.")
     else:
@@ -64,7 +83,7 @@ def main() -> None:
     # QtWebEngine in QML requires initialization before QApplication is built.
     QtWebEngineQuick.initialize()
 
-    app = QApplication(sys.argv)
+    app = QApplication(sys.argv[:1] + qt_argv)
     engine = QQmlApplicationEngine()
 
     engine.addImportPath(str(RESOURCE_DIR / "qml"))
@@ -74,11 +93,44 @@ def main() -> None:
     viewer_dir = RESOURCE_DIR / "robot_viewer"
     viewer_httpd = _start_robot_viewer_server(viewer_dir)
     viewer_port = viewer_httpd.server_address[1]
-    viewer_url = (
-        f"http://127.0.0.1:{viewer_port}/viewer.html"
-        f"?hud=0&autoconnect=1&host=192.168.167.199:9999"
-    )
-    engine.rootContext().setContextProperty("robotViewerUrl", viewer_url)
+    robot_ip, feed_at = ROBOT_IP, None
+    if args.sim:
+        from services.sim_robot import SimRPC, SimTiming
+        from services.sim_feed import SimJointFeed
+        from utils import robot_connection
+
+        timing = SimTiming(latency_ms=args.sim_latency_ms)
+        sim = SimRPC(args.sim_model, timing)
+        # One simulated controller per address, so extra robots added in
+        # the UI (127.0.0.2, ...) are independent arms.
+        sims = {sim.ip: sim}
+        sims_lock = threading.Lock()   # robot I/O threads and the GUI both ask
+        feeds: dict[str, SimJointFeed] = {}
+
+        def _sim_at(ip: str) -> SimRPC:
+            with sims_lock:
+                if ip not in sims:
+                    sims[ip] = SimRPC(args.sim_model, timing, ip=ip)
+                return sims[ip]
+
+        def _sim_feed_at(ip: str) -> str:
+            # Each arm gets its own joint feed; the first keeps --sim-port,
+            # the rest take any free port.
+            if ip not in feeds:
+                feeds[ip] = SimJointFeed(_sim_at(ip), args.sim_port if not feeds else 0)
+                print(f"[Sim] Joint feed for {ip} on ws://{feeds[ip].host}")
+            return feeds[ip].host
+
+        robot_connection.use_factory(_sim_at)
+        robot_ip, feed_at = sim.ip, _sim_feed_at
+        app.aboutToQuit.connect(lambda: [feed.close() for feed in feeds.values()])
+        app.aboutToQuit.connect(lambda: [s.shutdown() for s in sims.values()])
+        print(f"[Sim] Simulated {args.sim_model} controller")
+
+    # The feed host is appended in QML from Robots.feedHost, so the viewer
+    # follows the selected robot.
+    viewer_page = f"http://127.0.0.1:{viewer_port}/viewer.html?hud=0&autoconnect=1"
+    engine.rootContext().setContextProperty("robotViewerPage", viewer_page)
 
     def _stop_viewer_server() -> None:
         viewer_httpd.shutdown()
@@ -91,12 +143,29 @@ def main() -> None:
     # assets/app/ for the .app bundle (referenced via Info.plist).
     app.setWindowIcon(QIcon(str(RESOURCE_DIR / "assets" / "app" / "icon.ico")))
 
-    robot = RobotSingletonRCP("192.168.167.199")
-    # robot.RobotEnable(True)
-    # robot.DragTeachSwitch(False)
-
     controller = PositionController()
+    if feed_at is not None:
+        controller.robots.set_feed_resolver(feed_at)
+    # Each robot connects on its own I/O thread; the UI comes up even if
+    # they are offline. The robot list is kept between runs (not in --sim).
+    saved_robots = {} if args.sim else settings.value("robots", {}, type=dict)
+    for name, ip in saved_robots.items():
+        controller.add_robot(name, ip)
+    if saved_robots:
+        controller.select_robot(next(iter(saved_robots)))
+    else:
+        controller.connect_robot(robot_ip)
+    if not args.sim:
+        controller.robots.cellsChanged.connect(
+            lambda: settings.setValue("robots", controller.robots.addresses()))
+    app.aboutToQuit.connect(controller.shutdown)
+    if resume_db:
+        # Opened + migrated on the DB thread; the pose list fills in when done.
+        controller.open_database(saved_path)
     engine.rootContext().setContextProperty("PositionController", controller)
+    engine.rootContext().setContextProperty("PoseListModel", controller.pose_model)
+    engine.rootContext().setContextProperty("RobotState", controller.robot_state)
+    engine.rootContext().setContextProperty("Robots", controller.robots)
 
     qml_file = QUrl.fromLocalFile(str(RESOURCE_DIR / "qml" / "main.qml"))
     engine.load(qml_file)
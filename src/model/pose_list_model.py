@@ -0,0 +1,268 @@
+from typing import Any
+
+import numpy as np
+from PySide6.QtCore import QAbstractListModel, QByteArray, QModelIndex, QObject, Qt, Slot
+
+from db.db_manager import DB_Manager
+from db.db_worker import DbWorker
+from model.pose_table import PoseTable
+from repository.position_repository import PositionRepository
+from repository.positionJ_repository import PositionJRepository
+
+# Larger than any SQLite rowid — "no page loaded yet" for keyset paging.
+_FIRST_PAGE = 2**63 - 1
+
+_POSE_TYPES = ("cartesian", "joint")
+
+
+def view_poses(row: dict[str, Any]) -> dict[str, Any]:
+    """The nested `poses` map PositionItem.qml reads from a pose row."""
+    if row["type"] == "joint":
+        keys = ("j1", "j2", "j3", "j4", "j5", "j6", "dx", "dy", "dz", "drx", "dry", "drz")
+        return {key: row[key] for key in keys}
+    return {
+        "posX": row["x"], "posY": row["y"], "posZ": row["z"],
+        "posRX": row["rx"], "posRY": row["ry"], "posRZ": row["rz"],
+        "posDX": row["dx"], "posDY": row["dy"], "posDZ": row["dz"],
+        "posDRX": row["drx"], "posDRY": row["dry"], "posDRZ": row["drz"],
+    }
+
+
+class PoseListModel(QAbstractListModel):
+    """Lazily paged view over the tcp and joint tables for the pose ListView.
+
+    Rows are pulled PAGE_SIZE at a time through canFetchMore/fetchMore as the
+    view scrolls — cartesian poses first, then joint poses, newest first —
+    so opening a library costs two COUNTs and one page regardless of size.
+    PositionController feeds single-row edits in through insert_pose /
+    update_pose / remove_pose; reload() is for database switches.
+
+    With a filter set the model pages through the repositories' ranked
+    name search instead (best match first within each type). Edits made
+    while filtered simply re-run the search, which is an index lookup.
+
+    All queries run on the DbWorker thread; results land back here in
+    submission order. A generation counter drops pages that belong to a
+    reload or filter that has since been superseded.
+
+    Pages are kept as the PoseTable the repository returned; each row is a
+    (table, index) reference, and the QML-facing values are read out of the
+    arrays only when the view asks for a visible row.
+    """
+
+    PAGE_SIZE = 100
+
+    _FIELDS = (
+        "id", "name", "type", "config", "check", "created_at",
+        "x", "y", "z", "rx", "ry", "rz",
+        "j1", "j2", "j3", "j4", "j5", "j6",
+        "dx", "dy", "dz", "drx", "dry", "drz",
+        "poses",
+    )
+    _ROLES = {Qt.UserRole + i: field for i, field in enumerate(_FIELDS)}
+    _CHECK_ROLE = Qt.UserRole + _FIELDS.index("check")
+
+    def __init__(self, repo: PositionRepository, repoJ: PositionJRepository,
+                 db: DbWorker, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._repos = {"cartesian": repo, "joint": repoJ}
+        self._db = db
+        self._generation = 0
+        self._ready = False       # totals for the current generation have arrived
+        self._fetching = False    # a page request is in flight
+        self._rows: list[tuple[PoseTable, int]] = []
+        self._filter = ""
+        self._totals = dict.fromkeys(_POSE_TYPES, 0)
+        self._loaded = dict.fromkeys(_POSE_TYPES, 0)
+        self._cursor = dict.fromkeys(_POSE_TYPES, _FIRST_PAGE)
+
+    # ── QAbstractListModel ───────────────────────────────────────────────────
+
+    def roleNames(self) -> dict[int, QByteArray]:
+        return {role: QByteArray(field.encode()) for role, field in self._ROLES.items()}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        table, i = self._rows[index.row()]
+        field = self._ROLES.get(role, "name" if role == Qt.DisplayRole else None)
+        if field == "poses":
+            return view_poses(table.row(i))
+        return table.field(i, field) if field else None
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid() or not self._ready:
+            return False
+        return any(self._loaded[t] < self._totals[t] for t in _POSE_TYPES)
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if self._fetching or not self.canFetchMore(parent):
+            return
+        # Cartesian rows are exhausted before the first joint page is read,
+        # so each type stays one contiguous block.
+        pose_type = "cartesian" if self._loaded["cartesian"] < self._totals["cartesian"] else "joint"
+        repo = self._repos[pose_type]
+        generation = self._generation
+        self._fetching = True
+        if self._filter:
+            self._db.submit(repo.search, self._filter, self.PAGE_SIZE, self._loaded[pose_type],
+                            on_done=lambda page: self._on_page(generation, pose_type, page))
+        else:
+            self._db.submit(repo.get_page, self._cursor[pose_type], self.PAGE_SIZE,
+                            on_done=lambda page: self._on_page(generation, pose_type, page))
+
+    def _on_page(self, generation: int, pose_type: str, page: PoseTable) -> None:
+        if generation != self._generation:
+            return
+        self._fetching = False
+        if not len(page):
+            # Rows vanished under us (external edit) — stop asking for more.
+            self._totals[pose_type] = self._loaded[pose_type]
+            return
+
+        first = self._block_end(pose_type)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self._rows[first:first] = [(page, i) for i in range(len(page))]
+        self._loaded[pose_type] += len(page)
+        self._cursor[pose_type] = int(page.ids[-1])
+        self.endInsertRows()
+        # The view asks again on its own once it scrolls near the end.
+
+    # ── Controller-facing API ────────────────────────────────────────────────
+
+    @Slot()
+    def reload(self) -> None:
+        self._generation += 1
+        self._ready = False
+        self._fetching = False
+        self.beginResetModel()
+        self._rows = []
+        self._loaded = dict.fromkeys(_POSE_TYPES, 0)
+        self._cursor = dict.fromkeys(_POSE_TYPES, _FIRST_PAGE)
+        self._totals = dict.fromkeys(_POSE_TYPES, 0)
+        self.endResetModel()
+
+        generation = self._generation
+        self._db.submit(self._count, self._filter,
+                        on_done=lambda totals: self._on_totals(generation, totals))
+
+    def _count(self, text: str) -> dict[str, int]:
+        """Worker thread: row totals per type for the current filter."""
+        if not DB_Manager.has_path():
+            return dict.fromkeys(_POSE_TYPES, 0)
+        if text:
+            return {t: self._repos[t].search_count(text) for t in _POSE_TYPES}
+        return {t: self._repos[t].count() for t in _POSE_TYPES}
+
+    def _on_totals(self, generation: int, totals: dict[str, int]) -> None:
+        if generation != self._generation:
+            return
+        self._totals = totals
+        self._ready = True
+        self.fetchMore()
+
+    @Slot(str)
+    def set_filter(self, text: str) -> None:
+        text = text.strip()
+        if text == self._filter:
+            return
+        self._filter = text
+        self.reload()
+
+    # Edits arrive after their write job, so while a reload's totals are
+    # still pending they are already part of the counts/pages in flight.
+
+    def insert_pose(self, pose: dict) -> None:
+        if not self._ready:
+            return
+        if self._filter:
+            self.reload()
+            return
+        pose_type = pose["type"]
+        self._totals[pose_type] += 1
+        # Joint pages not reached yet: the new row arrives with them.
+        if pose_type == "joint" and self._loaded["cartesian"] < self._totals["cartesian"]:
+            return
+        # Newest first, so a fresh row always opens its type's block.
+        first = 0 if pose_type == "cartesian" else self._loaded["cartesian"]
+        self.beginInsertRows(QModelIndex(), first, first)
+        self._rows.insert(first, self._as_row(pose))
+        self._loaded[pose_type] += 1
+        self.endInsertRows()
+
+    def update_pose(self, previous_name: str, pose: dict) -> None:
+        if not self._ready:
+            return
+        if self._filter and previous_name != pose["name"]:
+            self.reload()
+            return
+        # Not paged in yet: it will be read fresh when the view gets there.
+        row = self._find(pose["type"], previous_name)
+        if row is not None:
+            table, i = self._rows[row]
+            updated = PoseTable.from_dicts(pose["type"], [pose])
+            # The check only resets in SQLite when values or config change
+            # (migration 009 triggers); a rename or offset edit keeps it.
+            if updated.configs[0] == table.configs[i] and np.array_equal(updated.values[0], table.values[i]):
+                updated.checks[0] = table.checks[i]
+            self._rows[row] = (updated, 0)
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+    def set_checks(self, pose_type: str, ids: np.ndarray, statuses: np.ndarray) -> None:
+        """Write validation results into the rows already paged in."""
+        if not len(ids):
+            return
+        order = np.argsort(ids)
+        ids, statuses = ids[order], statuses[order]
+        start = 0 if pose_type == "cartesian" else self._loaded["cartesian"]
+        end = start + self._loaded[pose_type]
+        # Rows share their page's table, so each table is patched once.
+        for table in {id(table): table for table, _ in self._rows[start:end]}.values():
+            at = np.minimum(np.searchsorted(ids, table.ids), len(ids) - 1)
+            hit = ids[at] == table.ids
+            table.checks[hit] = statuses[at[hit]]
+        if end > start:
+            self.dataChanged.emit(self.index(start), self.index(end - 1), [self._CHECK_ROLE])
+
+    def remove_pose(self, pose_type: str, name: str) -> None:
+        if not self._ready:
+            return
+        if self._filter:
+            self.reload()
+            return
+        row = self._find(pose_type, name)
+        if row is not None:
+            self._remove_row(row, pose_type)
+        else:
+            self._totals[pose_type] -= 1
+
+    # ── Helpers ──────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _as_row(pose: dict[str, Any]) -> tuple[PoseTable, int]:
+        return PoseTable.from_dicts(pose["type"], [pose]), 0
+
+    def _block_end(self, pose_type: str) -> int:
+        if pose_type == "cartesian":
+            return self._loaded["cartesian"]
+        return len(self._rows)
+
+    def _find(self, pose_type: str, name: str) -> int | None:
+        start = 0 if pose_type == "cartesian" else self._loaded["cartesian"]
+        end = start + self._loaded[pose_type]
+        for row in range(start, end):
+            table, i = self._rows[row]
+            if table.names[i] == name:
+                return row
+        return None
+
+    def _remove_row(self, row: int, pose_type: str) -> None:
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self._loaded[pose_type] -= 1
+        self._totals[pose_type] -= 1
+        self.endRemoveRows()
@@ -0,0 +1,36 @@
+from dataclasses import dataclass, asdict
+from typing import Optional, Any
+
+from model.position_model import PositionModel
+from model.positionJ_model import PositionJModel
+
+
+@dataclass(frozen=True)
+class PoseSnapshot:
+    """TCP pose, joints and config code of the arm at one instant.
+
+    frame is the controller's state frame counter the values came from
+    (-1 when they were read over RPC instead).
+    """
+    tcp: tuple[float, ...]
+    joints: tuple[float, ...]
+    config: int = -1
+    frame: int = -1
+    captured_at: Optional[str] = None
+
+    def as_position(self, name: Optional[Any] = 'nome do ponto') -> PositionModel:
+        x, y, z, rx, ry, rz = self.tcp
+        return PositionModel(id=None, name=name, x=x, y=y, z=z, rx=rx, ry=ry, rz=rz,
+                             config=self.config, created_at=self.captured_at)
+
+    def as_joint_position(self, name: Optional[Any] = 'nome do ponto') -> PositionJModel:
+        j1, j2, j3, j4, j5, j6 = self.joints
+        return PositionJModel(id=None, name=name, j1=j1, j2=j2, j3=j3, j4=j4, j5=j5, j6=j6,
+                              config=self.config, created_at=self.captured_at)
+
+    def matches_tcp(self, tcp: list[float], tolerance: float) -> bool:
+        """True if `tcp` is this pose to within `tolerance` on every component."""
+        return len(tcp) == 6 and all(abs(a - b) <= tolerance for a, b in zip(self.tcp, tcp))
+
+    def as_dict(self) -> dict:
+        return asdict(self)
@@ -0,0 +1,148 @@
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+
+from model.position_model import PositionModel
+from model.positionJ_model import PositionJModel
+
+# Value columns per pose type, in SELECT order (see sql/*/select_all.sql).
+POSE_COLUMNS = {
+    "cartesian": ("x", "y", "z", "rx", "ry", "rz"),
+    "joint":     ("j1", "j2", "j3", "j4", "j5", "j6"),
+}
+OFFSET_COLUMNS = ("dx", "dy", "dz", "drx", "dry", "drz")
+
+_MODELS = {"cartesian": PositionModel, "joint": PositionJModel}
+
+# One fixed-size record per pose; names and timestamps are variable-length
+# strings and live in plain lists beside it.
+RECORD_DTYPE = np.dtype([
+    ("id", np.int64),
+    ("values", np.float64, (6,)),
+    ("offsets", np.float64, (6,)),
+    ("config", np.int64),
+    # services.pose_validation status for the current robot setup; -1 = unchecked.
+    ("check", np.int64),
+])
+
+
+class PoseTable:
+    """A block of poses of one type held column-wise in a NumPy structured array.
+
+    Repositories build it straight from cursor tuples, so a page or a whole
+    library costs one array instead of one dataclass per row. `values` and
+    `offsets` are (N, 6) views for vectorised work over every pose; row(i)
+    and model(i) build the dict / dataclass shapes for single rows only,
+    when something (QML, a robot command) actually needs them.
+    """
+
+    __slots__ = ("kind", "records", "names", "created_at")
+
+    def __init__(self, kind: str, records: np.ndarray,
+                 names: list[str], created_at: list[str | None]) -> None:
+        self.kind = kind
+        self.records = records
+        self.names = names
+        self.created_at = created_at
+
+    # ── Construction ─────────────────────────────────────────────────────────
+
+    @classmethod
+    def empty(cls, kind: str) -> "PoseTable":
+        return cls(kind, np.empty(0, dtype=RECORD_DTYPE), [], [])
+
+    @classmethod
+    def from_rows(cls, kind: str, rows: Sequence[tuple]) -> "PoseTable":
+        """From (id, name, 6 values, 6 offsets, config, created_at[, check_status]) tuples."""
+        if not rows:
+            return cls.empty(kind)
+        columns = list(zip(*rows))
+        records = np.empty(len(rows), dtype=RECORD_DTYPE)
+        records["id"] = columns[0]
+        # None (NULL) becomes NaN in a float column.
+        records["values"] = np.array(columns[2:8], dtype=np.float64).T
+        records["offsets"] = np.array(columns[8:14], dtype=np.float64).T
+        records["config"] = [-1 if config is None else config for config in columns[14]]
+        records["check"] = [-1 if check is None else check for check in columns[16]] if len(columns) > 16 else -1
+        return cls(kind, records, list(columns[1]), list(columns[15]))
+
+    @classmethod
+    def from_dicts(cls, kind: str, poses: Iterable[dict[str, Any]]) -> "PoseTable":
+        """From as_dict()-shaped rows (e.g. a single edited pose)."""
+        keys = ("id", "name", *POSE_COLUMNS[kind], *OFFSET_COLUMNS, "config", "created_at")
+        return cls.from_rows(kind, [tuple(pose.get(key) for key in keys) for pose in poses])
+
+    # ── Columns ──────────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def ids(self) -> np.ndarray:
+        return self.records["id"]
+
+    @property
+    def values(self) -> np.ndarray:
+        """(N, 6) x..rz for cartesian, j1..j6 for joint."""
+        return self.records["values"]
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """(N, 6) dx..drz."""
+        return self.records["offsets"]
+
+    @property
+    def configs(self) -> np.ndarray:
+        return self.records["config"]
+
+    @property
+    def checks(self) -> np.ndarray:
+        return self.records["check"]
+
+    def index_of(self, name: str) -> int | None:
+        try:
+            return self.names.index(name)
+        except ValueError:
+            return None
+
+    def take(self, indices: Sequence[int] | np.ndarray) -> "PoseTable":
+        """A new table with the given rows, in the given order."""
+        indices = np.asarray(indices, dtype=np.intp)
+        return PoseTable(self.kind, self.records[indices],
+                         [self.names[i] for i in indices],
+                         [self.created_at[i] for i in indices])
+
+    # ── Single rows ──────────────────────────────────────────────────────────
+
+    def field(self, i: int, key: str) -> Any:
+        """One column of row i by its SQL name, as a Python scalar."""
+        if key == "name":
+            return self.names[i]
+        if key == "created_at":
+            return self.created_at[i]
+        if key == "type":
+            return self.kind
+        if key in ("id", "config", "check"):
+            return int(self.records[key][i])
+        if key in OFFSET_COLUMNS:
+            return float(self.records["offsets"][i, OFFSET_COLUMNS.index(key)])
+        columns = POSE_COLUMNS[self.kind]
+        if key in columns:
+            return float(self.records["values"][i, columns.index(key)])
+        return None
+
+    def row(self, i: int) -> dict[str, Any]:
+        """Row i in the as_dict() shape, plus its 'type'."""
+        record = self.records[i]
+        row = {"id": int(record["id"]), "name": self.names[i]}
+        row.update(zip(POSE_COLUMNS[self.kind], record["values"].tolist()))
+        row.update(zip(OFFSET_COLUMNS, record["offsets"].tolist()))
+        row["config"] = int(record["config"])
+        row["created_at"] = self.created_at[i]
+        row["type"] = self.kind
+        return row
+
+    def model(self, i: int) -> PositionModel | PositionJModel:
+        row = self.row(i)
+        del row["type"]
+        return _MODELS[self.kind](**row)
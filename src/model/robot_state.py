@@ -0,0 +1,90 @@
+from PySide6.QtCore import Property, QObject, Signal
+
+TCP_FIELDS = ("x", "y", "z", "rx", "ry", "rz")
+JOINT_FIELDS = ("j1", "j2", "j3", "j4", "j5", "j6")
+FLAG_FIELDS = ("estop", "collision", "enable")
+
+
+def _field(name: str, type_: type, notify: Signal) -> Property:
+    return Property(type_, lambda self: self._values[name], notify=notify)
+
+
+class RobotState(QObject):
+    """Live robot state for QML, one notifying property per field.
+
+    Exposed to QML as "RobotState". A binding on RobotState.z is only
+    re-evaluated when z changes; tcp / joints are the same values as lists,
+    for code that wants all six. Flags are -1 until the first state arrives.
+    Fed from the state hub (and from telemetry replay) through apply().
+    """
+
+    xChanged  = Signal()
+    yChanged  = Signal()
+    zChanged  = Signal()
+    rxChanged = Signal()
+    ryChanged = Signal()
+    rzChanged = Signal()
+    j1Changed = Signal()
+    j2Changed = Signal()
+    j3Changed = Signal()
+    j4Changed = Signal()
+    j5Changed = Signal()
+    j6Changed = Signal()
+    tcpChanged    = Signal()
+    jointsChanged = Signal()
+    estopChanged     = Signal()
+    collisionChanged = Signal()
+    enableChanged    = Signal()
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._values: dict[str, float | int] = dict.fromkeys(TCP_FIELDS + JOINT_FIELDS, 0.0)
+        self._values.update(dict.fromkeys(FLAG_FIELDS, -1))
+
+    x  = _field("x",  float, xChanged)
+    y  = _field("y",  float, yChanged)
+    z  = _field("z",  float, zChanged)
+    rx = _field("rx", float, rxChanged)
+    ry = _field("ry", float, ryChanged)
+    rz = _field("rz", float, rzChanged)
+    j1 = _field("j1", float, j1Changed)
+    j2 = _field("j2", float, j2Changed)
+    j3 = _field("j3", float, j3Changed)
+    j4 = _field("j4", float, j4Changed)
+    j5 = _field("j5", float, j5Changed)
+    j6 = _field("j6", float, j6Changed)
+    estop     = _field("estop",     int, estopChanged)
+    collision = _field("collision", int, collisionChanged)
+    enable    = _field("enable",    int, enableChanged)
+
+    def _tcp(self) -> list[float]:
+        return [self._values[name] for name in TCP_FIELDS]
+
+    def _joints(self) -> list[float]:
+        return [self._values[name] for name in JOINT_FIELDS]
+
+    tcp    = Property("QVariantList", _tcp, notify=tcpChanged)
+    joints = Property("QVariantList", _joints, notify=jointsChanged)
+
+    def apply(self, state: dict) -> None:
+        """Take any of tcp[6], joints[6], estop, collision, enable; notify what changed."""
+        if "tcp" in state and self._set_group(TCP_FIELDS, state["tcp"]):
+            self.tcpChanged.emit()
+        if "joints" in state and self._set_group(JOINT_FIELDS, state["joints"]):
+            self.jointsChanged.emit()
+        for name in FLAG_FIELDS:
+            if name in state:
+                self._set(name, int(state[name]))
+
+    def _set_group(self, names: tuple[str, ...], values) -> bool:
+        changed = False
+        for name, value in zip(names, values):
+            changed |= self._set(name, float(value))
+        return changed
+
+    def _set(self, name: str, value: float | int) -> bool:
+        if self._values[name] == value:
+            return False
+        self._values[name] = value
+        getattr(self, f"{name}Changed").emit()
+        return True
@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class WriteResult(Enum):
+    """Outcome of a repository write keyed by pose name."""
+    OK = "ok"                # row inserted / updated
+    CONFLICT = "conflict"    # another pose already uses the target name
+    NOT_FOUND = "not_found"  # no pose with the given actualName
+
+    @property
+    def ok(self) -> bool:
+        return self is WriteResult.OK
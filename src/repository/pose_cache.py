@@ -0,0 +1,166 @@
+import time
+from typing import Any
+
+from model.pose_table import PoseTable
+from model.write_result import WriteResult
+
+
+class PoseCache:
+    """Write-through in-memory cache in front of a pose repository.
+
+    Wraps PositionRepository or PositionJRepository with the same interface.
+    The whole table is read once per database into a name → model dict;
+    name lookups, existence checks and get_all_poses are then served from
+    memory, and every successful write updates the dict with the row read
+    back from SQLite; while the dict is not loaded, writes go straight to
+    SQLite and never load it. Paging and search queries pass straight
+    through.
+
+    Edits from other processes (another station on the same shared .db) are
+    caught via DB_Manager.data_version(), checked at most once per
+    CHECK_INTERVAL_S, which drops and refills the cache.
+
+    Not thread-safe by itself: use it only from the DbWorker thread.
+    """
+
+    CHECK_INTERVAL_S = 1.0
+
+    def __init__(self, repo: Any) -> None:
+        self._repo = repo
+        self.db = repo.db
+        self._poses: dict[str, Any] | None = None
+        self._version: tuple[int, int] | None = None
+        self._checked_at = 0.0
+
+    # ── Freshness ────────────────────────────────────────────────────────────
+
+    def refresh_if_changed(self, force_check: bool = False) -> bool:
+        """Drop the cache if the database changed underneath it; True if it did."""
+        now = time.monotonic()
+        if not force_check and self._poses is not None and now - self._checked_at < self.CHECK_INTERVAL_S:
+            return False
+        self._checked_at = now
+        version = self.db.data_version()
+        if version == self._version:
+            return False
+        # The first reading after open/invalidate is a baseline, not a change.
+        changed = self._version is not None
+        self._poses = None
+        self._version = version
+        return changed
+
+    def invalidate(self) -> None:
+        self._poses = None
+        self._version = None
+
+    def _cached(self) -> dict[str, Any]:
+        self.refresh_if_changed()
+        if self._poses is None:
+            # select_all is newest first; the dict keeps that order.
+            self._poses = {pose.name: pose for pose in self._repo.get_all_poses()}
+        return self._poses
+
+    def _reload_row(self, name: str) -> None:
+        if self._poses is None:
+            return      # not loaded: the next cached read picks the row up
+        pose = self._repo.get_pose(name)
+        if pose is not None:
+            self._poses[name] = pose
+
+    # ── Cached reads ─────────────────────────────────────────────────────────
+
+    def get_all_poses(self) -> list[Any]:
+        return sorted(self._cached().values(), key=lambda pose: pose.id, reverse=True)
+
+    def get_pose(self, name: str) -> Any | None:
+        return self._cached().get(name)
+
+    def exists(self, name: str) -> bool:
+        return name in self._cached()
+
+    # ── Pass-through reads (SQL does the work) ───────────────────────────────
+
+    def count(self) -> int:
+        return self._repo.count()
+
+    def get_table(self) -> PoseTable:
+        return self._repo.get_table()
+
+    def get_page(self, before_id: int, limit: int) -> PoseTable:
+        return self._repo.get_page(before_id, limit)
+
+    def search(self, text: str, limit: int = 50, offset: int = 0) -> PoseTable:
+        return self._repo.search(text, limit, offset)
+
+    def search_count(self, text: str) -> int:
+        return self._repo.search_count(text)
+
+    # ── Cached joint solutions (tcp only; not part of the models) ────────────
+
+    def get_solution(self, pose: Any, key: str) -> list[float] | None:
+        return self._repo.get_solution(pose, key)
+
+    def get_unsolved(self, key: str) -> list[tuple]:
+        return self._repo.get_unsolved(key)
+
+    def store_solutions(self, rows: Any) -> int:
+        return self._repo.store_solutions(rows)
+
+    # ── Reachability checks (not part of the models) ────────────────────────
+
+    def get_unchecked(self, key: str) -> list[tuple]:
+        return self._repo.get_unchecked(key)
+
+    def store_checks(self, rows: Any) -> int:
+        return self._repo.store_checks(rows)
+
+    # ── Write-through ────────────────────────────────────────────────────────
+
+    def insert_pose(self, pose: Any) -> WriteResult:
+        self.refresh_if_changed()
+        result = self._repo.insert_pose(pose)
+        if result.ok:
+            self._reload_row(pose.name)
+        return result
+
+    def upsert_pose(self, pose: Any) -> WriteResult:
+        self.refresh_if_changed()
+        result = self._repo.upsert_pose(pose)
+        self._reload_row(pose.name)
+        return result
+
+    def update_pose(self, pose: Any, actualName: str) -> WriteResult:
+        self.refresh_if_changed()
+        result = self._repo.update_pose(pose, actualName)
+        if result.ok and self._poses is not None:
+            self._poses.pop(actualName, None)
+            self._reload_row(pose.name)
+        return result
+
+    def update_offset(self, pose: Any, actualName: str) -> WriteResult:
+        self.refresh_if_changed()
+        result = self._repo.update_offset(pose, actualName)
+        if result.ok:
+            self._reload_row(actualName)
+        return result
+
+    def insert_many(self, rows: Any, replace: bool = False) -> int:
+        written = self._repo.insert_many(rows, replace)
+        # Cheaper to reread once on next use than to patch row by row.
+        self._poses = None
+        return written
+
+    def iter_rows(self, batch_size: int = 5000) -> Any:
+        return self._repo.iter_rows(batch_size)
+
+    def delete_pose(self, name: str) -> WriteResult:
+        self.refresh_if_changed()
+        result = self._repo.delete_pose(name)
+        if self._poses is not None:
+            self._poses.pop(name, None)
+        return result
+
+    def delete_all_poses(self) -> None:
+        self.refresh_if_changed()
+        self._repo.delete_all_poses()
+        self._poses = {}
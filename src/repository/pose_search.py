@@ -0,0 +1,24 @@
+"""Query building shared by the pose repositories' search methods."""
+
+# The trigram tokenizer only indexes 3-character windows; anything shorter
+# falls back to a LIKE scan (still fast for the 1–2 keystrokes it covers).
+TRIGRAM_MIN_LENGTH = 3
+
+
+def like_pattern(text: str) -> str:
+    """Substring LIKE pattern for `text`, escaping LIKE wildcards (ESCAPE '\\')."""
+    text = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{text}%"
+
+
+def search_query(text: str) -> tuple[str, dict[str, str]]:
+    """Pick the SQL file stem and parameters for a name search.
+
+    Returns ("search", {"query": ...}) for the FTS5 path — the text is passed
+    as a single quoted phrase so FTS operators in pose names are literal —
+    or ("search_short", {"pattern": ...}) for the LIKE fallback.
+    """
+    text = text.strip()
+    if len(text) >= TRIGRAM_MIN_LENGTH:
+        return "search", {"query": '"' + text.replace('"', '""') + '"'}
+    return "search_short", {"pattern": like_pattern(text)}
@@ -1,5 +1,11 @@
+import sqlite3
+from typing import Iterable, Iterator
+
 from db.db_manager import DB_Manager
 from model.positionJ_model import PositionJModel
+from model.pose_table import PoseTable
+from model.write_result import WriteResult
+from repository.pose_search import search_query
 
 class PositionJRepository:
     def __init__(self):
@@ -10,9 +16,85 @@ class PositionJRepository:
         rows = self.db.fetch_all(sql)
         return [PositionJModel(**row) for row in rows]
 
-    def insert_pose(self, pose: PositionJModel) -> None:
+    def get_pose(self, name: str) -> PositionJModel | None:
+        sql = self.db.load_sql("joints", "select_by_name.sql")
+        row = self.db.fetch_one(sql, {"name": name})
+        return PositionJModel(**row) if row else None
+
+    def count(self) -> int:
+        sql = self.db.load_sql("joints", "count.sql")
+        return self.db.fetch_one(sql)["total"]
+
+    def get_table(self) -> PoseTable:
+        """Every pose as one PoseTable, newest first."""
+        sql = self.db.load_sql("joints", "select_all.sql")
+        return PoseTable.from_rows("joint", self.db.fetch_rows(sql))
+
+    def get_page(self, before_id: int, limit: int) -> PoseTable:
+        """Up to `limit` poses with id < before_id, newest first."""
+        sql = self.db.load_sql("joints", "select_page.sql")
+        rows = self.db.fetch_rows(sql, {"before_id": before_id, "limit": limit})
+        return PoseTable.from_rows("joint", rows)
+
+    def search(self, text: str, limit: int = 50, offset: int = 0) -> PoseTable:
+        """Poses whose name contains `text` (case-insensitive), best matches first."""
+        stem, params = search_query(text)
+        sql = self.db.load_sql("joints", f"{stem}.sql")
+        rows = self.db.fetch_rows(sql, {**params, "limit": limit, "offset": offset})
+        return PoseTable.from_rows("joint", rows)
+
+    def search_count(self, text: str) -> int:
+        stem, params = search_query(text)
+        sql = self.db.load_sql("joints", f"{stem}_count.sql")
+        return self.db.fetch_one(sql, params)["total"]
+
+    def exists(self, name: str) -> bool:
+        sql = self.db.load_sql("joints", "exists.sql")
+        return self.db.fetch_one(sql, {"name": name}) is not None
+
+    def insert_pose(self, pose: PositionJModel) -> WriteResult:
+        """Insert a new pose; CONFLICT if the name is already taken."""
         sql = self.db.load_sql("joints", "insert_pose.sql")
-        self.db.execute(sql, {
+        inserted = self.db.execute(sql, self._row_params(pose))
+        return WriteResult.OK if inserted else WriteResult.CONFLICT
+
+    def upsert_pose(self, pose: PositionJModel) -> WriteResult:
+        """Insert a pose, or overwrite the existing one with the same name."""
+        sql = self.db.load_sql("joints", "upsert_pose.sql")
+        self.db.execute(sql, self._row_params(pose))
+        return WriteResult.OK
+
+    def insert_many(self, rows: Iterable[dict], replace: bool = False) -> int:
+        """Bulk insert in one transaction; rows are _row_params-shaped dicts.
+
+        Names already in the table are skipped, or overwritten when `replace`
+        is set. Returns how many rows were written.
+        """
+        sql = self.db.load_sql("joints", "upsert_pose.sql" if replace else "insert_pose.sql")
+        return self.db.execute_many(
+            sql, rows,
+            before=self.db.load_sql("joints", "bulk_insert_begin.sql"),
+            after=self.db.load_sql("joints", "bulk_insert_end.sql"),
+        )
+
+    def iter_rows(self, batch_size: int = 5000) -> Iterator[list[tuple]]:
+        """All poses as (name, j1..j6, dx..drz, config) tuples, oldest first."""
+        sql = self.db.load_sql("joints", "export.sql")
+        yield from self.db.fetch_batches(sql, batch_size)
+
+    def get_unchecked(self, key: str) -> list[tuple]:
+        """(id, j1..j6, config) of every pose not yet checked for `key`, oldest first."""
+        sql = self.db.load_sql("joints", "select_unchecked.sql")
+        return self.db.fetch_rows(sql, {"key": key})
+
+    def store_checks(self, rows: Iterable[dict]) -> int:
+        """Write update_check.sql rows in one transaction; returns rows stored."""
+        sql = self.db.load_sql("joints", "update_check.sql")
+        return self.db.execute_many(sql, rows)
+
+    @staticmethod
+    def _row_params(pose: PositionJModel) -> dict:
+        return {
             "name": pose.name,  
             "j1": pose.j1,
             "j2": pose.j2,
@@ -27,35 +109,41 @@ class PositionJRepository:
             "dry": pose.dry,
             "drz": pose.drz,
             "config": pose.config
-        })
+        }
 
     def delete_all_poses(self) -> None:
         sql = self.db.load_sql("joints", "delete_all.sql")
         self.db.execute(sql)
     
-    def delete_pose(self, name) -> None:
+    def delete_pose(self, name) -> WriteResult:
         sql = self.db.load_sql("joints", "delete_pose.sql")
-        self.db.execute(sql, {
+        deleted = self.db.execute(sql, {
             "name": name
         })
+        return WriteResult.OK if deleted else WriteResult.NOT_FOUND
       
-    def update_pose(self, pose: PositionJModel, actualName: str) -> None:
+    def update_pose(self, pose: PositionJModel, actualName: str) -> WriteResult:
+        """Rewrite the pose named actualName; CONFLICT if renaming onto another pose."""
         sql = self.db.load_sql("joints", "update_pose.sql")
-        self.db.execute(sql, {
-            "actualName": actualName,
-            "name": pose.name,
-            "j1": pose.j1,
-            "j2": pose.j2,
-            "j3": pose.j3,
-            "j4": pose.j4,
-            "j5": pose.j5,
-            "j6": pose.j6,
-            "config": pose.config
-        })
+        try:
+            updated = self.db.execute(sql, {
+                "actualName": actualName,
+                "name": pose.name,
+                "j1": pose.j1,
+                "j2": pose.j2,
+                "j3": pose.j3,
+                "j4": pose.j4,
+                "j5": pose.j5,
+                "j6": pose.j6,
+                "config": pose.config
+            })
+        except sqlite3.IntegrityError:
+            return WriteResult.CONFLICT
+        return WriteResult.OK if updated else WriteResult.NOT_FOUND
 
-    def update_offset(self, pose: PositionJModel, actualName: str) -> None:
+    def update_offset(self, pose: PositionJModel, actualName: str) -> WriteResult:
         sql = self.db.load_sql("joints", "update_offset.sql")
-        self.db.execute(sql, {
+        updated = self.db.execute(sql, {
             "actualName": actualName,
             "dx": pose.dx,
             "dy": pose.dy,
@@ -64,3 +152,4 @@ class PositionJRepository:
             "dry": pose.dry,
             "drz": pose.drz
         })
+        return WriteResult.OK if updated else WriteResult.NOT_FOUND
@@ -1,5 +1,11 @@
+import sqlite3
+from typing import Iterable, Iterator
+
 from db.db_manager import DB_Manager
 from model.position_model import PositionModel
+from model.pose_table import PoseTable
+from model.write_result import WriteResult
+from repository.pose_search import search_query
 
 class PositionRepository:
     def __init__(self):
@@ -13,9 +19,103 @@ class PositionRepository:
     def get_all_points(self) -> list[PositionModel]:
         return self.get_all_poses()
 
-    def insert_pose(self, pose: PositionModel) -> None:
+    def get_pose(self, name: str) -> PositionModel | None:
+        sql = self.db.load_sql("poses", "select_by_name.sql")
+        row = self.db.fetch_one(sql, {"name": name})
+        return PositionModel(**row) if row else None
+
+    def count(self) -> int:
+        sql = self.db.load_sql("poses", "count.sql")
+        return self.db.fetch_one(sql)["total"]
+
+    def get_table(self) -> PoseTable:
+        """Every pose as one PoseTable, newest first."""
+        sql = self.db.load_sql("poses", "select_all.sql")
+        return PoseTable.from_rows("cartesian", self.db.fetch_rows(sql))
+
+    def get_page(self, before_id: int, limit: int) -> PoseTable:
+        """Up to `limit` poses with id < before_id, newest first."""
+        sql = self.db.load_sql("poses", "select_page.sql")
+        rows = self.db.fetch_rows(sql, {"before_id": before_id, "limit": limit})
+        return PoseTable.from_rows("cartesian", rows)
+
+    def search(self, text: str, limit: int = 50, offset: int = 0) -> PoseTable:
+        """Poses whose name contains `text` (case-insensitive), best matches first."""
+        stem, params = search_query(text)
+        sql = self.db.load_sql("poses", f"{stem}.sql")
+        rows = self.db.fetch_rows(sql, {**params, "limit": limit, "offset": offset})
+        return PoseTable.from_rows("cartesian", rows)
+
+    def search_count(self, text: str) -> int:
+        stem, params = search_query(text)
+        sql = self.db.load_sql("poses", f"{stem}_count.sql")
+        return self.db.fetch_one(sql, params)["total"]
+
+    def exists(self, name: str) -> bool:
+        sql = self.db.load_sql("poses", "exists.sql")
+        return self.db.fetch_one(sql, {"name": name}) is not None
+
+    def insert_pose(self, pose: PositionModel) -> WriteResult:
+        """Insert a new pose; CONFLICT if the name is already taken."""
         sql = self.db.load_sql("poses", "insert_pose.sql")
-        self.db.execute(sql, {
+        inserted = self.db.execute(sql, self._row_params(pose))
+        return WriteResult.OK if inserted else WriteResult.CONFLICT
+
+    def upsert_pose(self, pose: PositionModel) -> WriteResult:
+        """Insert a pose, or overwrite the existing one with the same name."""
+        sql = self.db.load_sql("poses", "upsert_pose.sql")
+        self.db.execute(sql, self._row_params(pose))
+        return WriteResult.OK
+
+    def insert_many(self, rows: Iterable[dict], replace: bool = False) -> int:
+        """Bulk insert in one transaction; rows are _row_params-shaped dicts.
+
+        Names already in the table are skipped, or overwritten when `replace`
+        is set. Returns how many rows were written.
+        """
+        sql = self.db.load_sql("poses", "upsert_pose.sql" if replace else "insert_pose.sql")
+        return self.db.execute_many(
+            sql, rows,
+            before=self.db.load_sql("poses", "bulk_insert_begin.sql"),
+            after=self.db.load_sql("poses", "bulk_insert_end.sql"),
+        )
+
+    def iter_rows(self, batch_size: int = 5000) -> Iterator[list[tuple]]:
+        """All poses as (name, x..rz, dx..drz, config) tuples, oldest first."""
+        sql = self.db.load_sql("poses", "export.sql")
+        yield from self.db.fetch_batches(sql, batch_size)
+
+    # ── Cached joint solutions ───────────────────────────────────────────────
+
+    def get_solution(self, pose: PositionModel, key: str) -> list[float] | None:
+        """Stored joints for `pose` if solved for `key` at its current coordinates."""
+        sql = self.db.load_sql("poses", "select_solution.sql")
+        rows = self.db.fetch_rows(sql, {"key": key, **self._row_params(pose)})
+        return list(rows[0]) if rows else None
+
+    def get_unsolved(self, key: str) -> list[tuple]:
+        """(id, x..rz, config) of every pose not yet solved for `key`, oldest first."""
+        sql = self.db.load_sql("poses", "select_unsolved.sql")
+        return self.db.fetch_rows(sql, {"key": key})
+
+    def store_solutions(self, rows: Iterable[dict]) -> int:
+        """Write update_solution.sql rows in one transaction; returns rows stored."""
+        sql = self.db.load_sql("poses", "update_solution.sql")
+        return self.db.execute_many(sql, rows)
+
+    def get_unchecked(self, key: str) -> list[tuple]:
+        """(id, x..rz, config) of every pose not yet checked for `key`, oldest first."""
+        sql = self.db.load_sql("poses", "select_unchecked.sql")
+        return self.db.fetch_rows(sql, {"key": key})
+
+    def store_checks(self, rows: Iterable[dict]) -> int:
+        """Write update_check.sql rows in one transaction; returns rows stored."""
+        sql = self.db.load_sql("poses", "update_check.sql")
+        return self.db.execute_many(sql, rows)
+
+    @staticmethod
+    def _row_params(pose: PositionModel) -> dict:
+        return {
             "name": pose.name,  
             "x": pose.x,
             "y": pose.y,
@@ -30,35 +130,44 @@ class PositionRepository:
             "dry": pose.dry,
             "drz": pose.drz,
             "config": pose.config
-        })
+        }
 
-    def delete_all_points(self) -> None:
+    def delete_all_poses(self) -> None:
         sql = self.db.load_sql("poses", "delete_all.sql")
         self.db.execute(sql)
+
+    def delete_all_points(self) -> None:
+        self.delete_all_poses()
     
-    def delete_pose(self, name) -> None:
+    def delete_pose(self, name) -> WriteResult:
         sql = self.db.load_sql("poses", "delete_pose.sql")
-        self.db.execute(sql, {
+        deleted = self.db.execute(sql, {
             "name": name
         })
+        return WriteResult.OK if deleted else WriteResult.NOT_FOUND
       
-    def update_pose(self, pose: PositionModel, actualName: str) -> None:
+    def update_pose(self, pose: PositionModel, actualName: str) -> WriteResult:
+        """Rewrite the pose named actualName; CONFLICT if renaming onto another pose."""
         sql = self.db.load_sql("poses", "update_pose.sql")
-        self.db.execute(sql, {
-            "actualName": actualName,
-            "name": pose.name,
-            "x": pose.x,
-            "y": pose.y,
-            "z": pose.z,
-            "rx": pose.rx,
-            "ry": pose.ry,
-            "rz": pose.rz,
-            "config": pose.config
-        })
+        try:
+            updated = self.db.execute(sql, {
+                "actualName": actualName,
+                "name": pose.name,
+                "x": pose.x,
+                "y": pose.y,
+                "z": pose.z,
+                "rx": pose.rx,
+                "ry": pose.ry,
+                "rz": pose.rz,
+                "config": pose.config
+            })
+        except sqlite3.IntegrityError:
+            return WriteResult.CONFLICT
+        return WriteResult.OK if updated else WriteResult.NOT_FOUND
 
-    def update_offset(self, pose: PositionModel, actualName: str) -> None:
+    def update_offset(self, pose: PositionModel, actualName: str) -> WriteResult:
         sql = self.db.load_sql("poses", "update_offset.sql")
-        self.db.execute(sql, {
+        updated = self.db.execute(sql, {
             "actualName": actualName,
             "dx": pose.dx,
             "dy": pose.dy,
@@ -67,3 +176,4 @@ class PositionRepository:
             "dry": pose.dry,
             "drz": pose.drz
         })
+        return WriteResult.OK if updated else WriteResult.NOT_FOUND
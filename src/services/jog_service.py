@@ -0,0 +1,90 @@
+import time
+
+_CARTESIAN_AXES = {'x': 0, 'y': 1, 'z': 2, 'rx': 3, 'ry': 4, 'rz': 5}
+
+# Motion parameters shared by every jog command (same as RobotService.move).
+_TOOL, _USER, _VEL = 1, 0, 100
+
+
+class JogLatency:
+    """Wall-clock cost of jog ticks: last, exponential average and worst, in ms."""
+
+    _ALPHA = 0.2   # EMA weight of the newest tick
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.ticks = 0
+        self.last_ms = 0.0
+        self.avg_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms: float) -> None:
+        self.ticks += 1
+        self.last_ms = ms
+        self.avg_ms = ms if self.ticks == 1 else self.avg_ms + self._ALPHA * (ms - self.avg_ms)
+        self.max_ms = max(self.max_ms, ms)
+
+    def as_dict(self) -> dict:
+        return {
+            "ticks": self.ticks,
+            "last_ms": round(self.last_ms, 2),
+            "avg_ms": round(self.avg_ms, 2),
+            "max_ms": round(self.max_ms, 2),
+        }
+
+
+class JogService:
+    """One motion command per jog tick.
+
+    The current TCP pose and joint angles come from robot_state_pkg, which
+    the SDK refreshes in the background, so a tick never waits on a read
+    RPC. Cartesian jogs go out as a single MoveCart (the controller solves
+    IK) with the joint configuration fetched once per jog session instead
+    of GetRobotCurJointsConfig + GetInverseKin + MoveJ every tick. A session
+    ends at stop(); the next jog re-reads the configuration, since joint
+    jogs may have moved the arm into another one.
+    """
+
+    def __init__(self) -> None:
+        self._config: int | None = None
+        self.latency = JogLatency()
+
+    def jog_cartesian(self, robot, axis: str, direction: int, step: float) -> bool:
+        """Move to current TCP pose + direction*step on `axis` (mm / degrees)."""
+        idx = _CARTESIAN_AXES.get(axis, -1)
+        if idx < 0:
+            return False
+        started = time.perf_counter()
+        target = [float(v) for v in robot.robot_state_pkg.tl_cur_pos[:6]]
+        target[idx] += direction * step
+        error = robot.MoveCart(desc_pos=target, tool=_TOOL, user=_USER, vel=_VEL,
+                               blendT=0, config=self._joint_config(robot))
+        self._measure(started)
+        return error == 0
+
+    def jog_joint(self, robot, joint_idx: int, direction: int, step: float) -> bool:
+        """Move one joint (0–5) by direction*step degrees from where it is now."""
+        started = time.perf_counter()
+        target = [float(j) for j in robot.robot_state_pkg.jt_cur_pos[:6]]
+        target[joint_idx] += direction * step
+        error = robot.MoveJ(joint_pos=target, tool=_TOOL, user=_USER, vel=_VEL, blendT=0)
+        # Joint moves can change the arm configuration.
+        self._config = None
+        self._measure(started)
+        return error == 0
+
+    def stop(self) -> None:
+        """End the jog session; the next jog re-reads the joint configuration."""
+        self._config = None
+
+    def _joint_config(self, robot) -> int:
+        if self._config is None:
+            # First tick of a session pays for this RPC; the rest reuse it.
+            result = robot.GetRobotCurJointsConfig()
+            self._config = result[1] if isinstance(result, tuple) and result[0] == 0 else -1
+        return self._config
+
+    def _measure(self, started: float) -> None:
+        self.latency.add((time.perf_counter() - started) * 1000.0)
@@ -0,0 +1,64 @@
+"""Precomputed joint solutions for saved cartesian poses.
+
+Each tcp row can carry the joints it resolves to (sol_j1..sol_j6) together
+with a solution key naming the arm model, tool/user frame and tool offset
+they were solved for (see solution_key). Replaying a pose whose stored key
+matches the live one is then a single MoveJ, with no IK call at all.
+
+Rows are solved in bulk with the local closed-form IK, in parallel chunks
+(see pose_sweep), and the results go back in one transaction.
+Moving a pose or changing its config clears its key (trigger in migration
+008), so the next solve_library pass picks it up again.
+"""
+from typing import Any
+
+import numpy as np
+
+from services.pose_sweep import JOINT_KEYS, POSE_KEYS, map_chunks, row_params
+from utils.kinematics import Kinematics
+
+
+def solution_key(model: str, kin: Kinematics, tool: int, user: int) -> str:
+    """Identifies what a stored solution is valid for.
+
+    The tool offset is rounded to 0.1 mm / 0.1° so recalibrating the same
+    tool from a fresh state sample keeps the cache; a redefined tool does not.
+    """
+    offset = ",".join(f"{v:.1f}" for v in np.round(kin.tool, 1) + 0.0)
+    return f"{model}/tool{tool}/user{user}/{offset}"
+
+
+def solve_library(repo: Any, kin: Kinematics, key: str, workers: int | None = None) -> int:
+    """Solve and store every tcp pose not yet solved for `key`; returns how many.
+
+    All three steps on the calling thread. The app splits them instead:
+    repo.get_unsolved and store_solutions on the DB thread, solve_rows on
+    the compute thread.
+    """
+    rows = repo.get_unsolved(key)
+    if not rows:
+        return 0
+    return store_solutions(repo, key, rows, solve_rows(kin, rows, workers))
+
+
+def solve_rows(kin: Kinematics, rows: list[tuple], workers: int | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """(joints, ok) per row of repo.get_unsolved; no database access.
+
+    Poses with config -1 (branch picked at move time) and unreachable ones
+    are not ok: they are stored as "no solution" for the key so they are
+    not retried every pass.
+    """
+    def _solve(poses: np.ndarray, configs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        q, ok = kin.ik(poses, np.maximum(configs, 0))
+        return q, ok & (configs >= 0)
+
+    solved = map_chunks(rows, _solve, workers, name="ik")
+    return np.concatenate([result[0] for result in solved]), np.concatenate([result[1] for result in solved])
+
+
+def store_solutions(repo: Any, key: str, rows: list[tuple], solved: tuple[np.ndarray, np.ndarray]) -> int:
+    """Write solve_rows results for `rows` in one transaction; returns how many have a solution."""
+    joints, ok = solved
+    extras = (dict(zip(JOINT_KEYS, q if valid else [None] * 6)) for q, valid in zip(joints.tolist(), ok.tolist()))
+    repo.store_solutions(row_params(rows, key, POSE_KEYS, extras))
+    return int(ok.sum())
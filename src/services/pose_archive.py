@@ -0,0 +1,120 @@
+"""Columnar .npz export/import of whole pose libraries.
+
+One archive holds both tables as parallel arrays, so 100k poses load with a
+handful of array reads instead of per-row parsing:
+
+    format          int   ARCHIVE_FORMAT
+    <t>_name        str   (N,)
+    <t>_pose        f8    (N, 6)   x..rz for tcp, j1..j6 for joint
+    <t>_offset      f8    (N, 6)   dx..drz
+    <t>_config      i8    (N,)
+
+with <t> in ("tcp", "joint"). Rows are stored oldest first, so importing
+into an empty database reproduces the original list order.
+"""
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import numpy as np
+
+ARCHIVE_FORMAT = 1
+BATCH_SIZE = 5000
+
+# Archive prefix → value columns in the repository rows
+_TABLES = {
+    "tcp":   ("x", "y", "z", "rx", "ry", "rz"),
+    "joint": ("j1", "j2", "j3", "j4", "j5", "j6"),
+}
+_OFFSETS = ("dx", "dy", "dz", "drx", "dry", "drz")
+
+# progress(done, total), called every BATCH_SIZE rows and at the end.
+Progress = Callable[[int, int], None]
+
+
+def export_poses(repos: dict[str, Any], path: str | Path,
+                 progress: Progress | None = None) -> int:
+    """Write every pose in repos ({"tcp": repo, "joint": repoJ}) to `path`."""
+    totals = {prefix: repos[prefix].count() for prefix in _TABLES}
+    total, done = sum(totals.values()), 0
+    arrays: dict[str, np.ndarray] = {"format": np.array(ARCHIVE_FORMAT)}
+
+    for prefix in _TABLES:
+        names: list[str] = []
+        values = np.empty((totals[prefix], 13), dtype=np.float64)
+        row = 0
+        for batch in repos[prefix].iter_rows(BATCH_SIZE):
+            # Rows may have appeared since count(); grow rather than fail.
+            if row + len(batch) > len(values):
+                values = np.resize(values, (row + len(batch), 13))
+            names.extend(record[0] for record in batch)
+            values[row:row + len(batch)] = [record[1:] for record in batch]
+            row += len(batch)
+            done += len(batch)
+            if progress:
+                progress(done, total)
+        values = values[:row]
+        arrays[f"{prefix}_name"] = np.array(names, dtype=str)
+        arrays[f"{prefix}_pose"] = values[:, :6]
+        arrays[f"{prefix}_offset"] = values[:, 6:12]
+        arrays[f"{prefix}_config"] = values[:, 12].astype(np.int64)
+
+    # np.savez appends .npz to bare names; write through a handle so the
+    # file lands exactly where the user picked.
+    with open(path, "wb") as handle:
+        np.savez(handle, **arrays)
+    if progress:
+        progress(done, total)
+    return done
+
+
+def import_poses(repos: dict[str, Any], path: str | Path, replace: bool = False,
+                 progress: Progress | None = None) -> int:
+    """Insert every pose from the archive at `path`; returns rows written.
+
+    Each table goes in as a single transaction. Poses whose name already
+    exists are skipped, or overwritten when `replace` is set.
+    """
+    tables = _read_archive(path)
+    total = sum(len(names) for names, *_ in tables.values())
+    done, written = 0, 0
+
+    for prefix, (names, poses, offsets, configs) in tables.items():
+        columns = _TABLES[prefix]
+
+        def rows() -> Iterator[dict[str, Any]]:
+            nonlocal done
+            # tolist() turns numpy scalars into Python floats/ints in one pass.
+            for name, pose, offset, config in zip(names.tolist(), poses.tolist(),
+                                                  offsets.tolist(), configs.tolist()):
+                row = dict(zip(columns, pose))
+                row.update(zip(_OFFSETS, offset))
+                row["name"] = name
+                row["config"] = config
+                yield row
+                done += 1
+                if progress and done % BATCH_SIZE == 0:
+                    progress(done, total)
+
+        written += repos[prefix].insert_many(rows(), replace)
+
+    if progress:
+        progress(done, total)
+    return written
+
+
+def _read_archive(path: str | Path) -> dict[str, tuple[np.ndarray, ...]]:
+    with np.load(path, allow_pickle=False) as archive:
+        version = int(archive["format"]) if "format" in archive else None
+        if version != ARCHIVE_FORMAT:
+            raise ValueError(f"Unsupported pose archive format: {version}")
+        tables = {}
+        for prefix in _TABLES:
+            names = archive[f"{prefix}_name"]
+            poses = archive[f"{prefix}_pose"]
+            offsets = archive[f"{prefix}_offset"]
+            configs = archive[f"{prefix}_config"]
+            n = len(names)
+            if poses.shape != (n, 6) or offsets.shape != (n, 6) or configs.shape != (n,):
+                raise ValueError(f"Malformed pose archive: '{prefix}' columns differ in length")
+            tables[prefix] = (names, poses, offsets, configs)
+        return tables
@@ -0,0 +1,39 @@
+"""Chunked batch passes over stored pose rows.
+
+Shared by joint_solutions (bulk IK) and pose_validation (reachability):
+rows come from the repositories as (id, 6 values, config), are split into
+CHUNK_SIZE chunks that a thread pool processes in parallel (the kernels
+are NumPy, which releases the GIL), and go back as one parameter dict per
+row so the repository can write them in a single transaction.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+import numpy as np
+
+CHUNK_SIZE = 2000
+
+POSE_KEYS = ("x", "y", "z", "rx", "ry", "rz")
+JOINT_KEYS = ("j1", "j2", "j3", "j4", "j5", "j6")
+
+
+def map_chunks(rows: Sequence[tuple], fn: Callable[[np.ndarray, np.ndarray], Any],
+               workers: int | None = None, name: str = "sweep") -> list:
+    """fn((n, 6) values, (n,) configs) for each CHUNK_SIZE chunk of `rows`, results in row order."""
+    data = np.asarray(rows, dtype=np.float64)
+    values, configs = data[:, 1:7], data[:, 7].astype(np.int64)
+    chunks = [slice(start, start + CHUNK_SIZE) for start in range(0, len(rows), CHUNK_SIZE)]
+    workers = workers or min(len(chunks), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=name) as pool:
+        return list(pool.map(lambda chunk: fn(values[chunk], configs[chunk]), chunks))
+
+
+def row_params(rows: Iterable[tuple], key: str, keys: tuple[str, ...],
+               extras: Iterable[dict]) -> Iterator[dict]:
+    """Write parameters per row: id, config, key, the six values under `keys`, plus its extra."""
+    for row, extra in zip(rows, extras):
+        params = {"id": row[0], "config": row[7], "key": key}
+        params.update(zip(keys, row[1:7]))
+        params.update(extra)
+        yield params
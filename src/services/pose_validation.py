@@ -0,0 +1,107 @@
+"""Reachability sweep over the saved pose library.
+
+Every pose is checked against the connected arm's verified kinematics so
+an unreachable point shows up in the pose list instead of as a silent
+failed move on the shop floor:
+
+    cartesian  IK for the stored config (any branch for config -1), with
+               the joint limits applied to the solution
+    joint      joint limits, and the stored config against the branch the
+               joints actually are on
+
+Rows are checked in parallel chunks (see pose_sweep), so a 10k-pose
+library takes well under a second of solving; the statuses go back in one
+transaction per table. Reading and writing happen on the DB thread, the
+checks themselves on the compute thread. Results are
+keyed like the joint solutions (see joint_solutions.solution_key): only
+rows not yet checked for the live key are swept, and editing a pose
+clears its result (trigger in migration 009).
+"""
+from typing import Any, Callable
+
+import numpy as np
+
+from services.pose_sweep import JOINT_KEYS, POSE_KEYS, map_chunks, row_params
+from utils.kinematics import Kinematics
+
+UNCHECKED = -1
+OK = 0
+UNREACHABLE = 1         # no branch reaches the pose
+CONFIG_UNREACHABLE = 2  # the stored config's branch does not, another one does
+JOINT_LIMITS = 3        # reachable only outside the joint limits
+CONFIG_MISMATCH = 4     # stored config is not the branch the joints are on (or not a config)
+
+
+def check_cartesian(kin: Kinematics, poses: np.ndarray, configs: np.ndarray) -> np.ndarray:
+    """Status per (N, 6) TCP pose with its stored config code."""
+    _, reachable, in_limits = kin.ik_branches(poses)
+    usable = reachable & in_limits
+    rows = np.arange(len(configs))
+    branch = np.clip(configs, 0, 7)
+    picked = configs >= 0
+
+    status = np.full(len(configs), UNREACHABLE, dtype=np.int64)
+    status[reachable.any(axis=-1)] = JOINT_LIMITS
+    status[picked & ~usable[rows, branch] & usable.any(axis=-1)] = CONFIG_UNREACHABLE
+    status[np.where(picked, usable[rows, branch], usable.any(axis=-1))] = OK
+    status[(configs < -1) | (configs > 7)] = CONFIG_MISMATCH
+    return status
+
+
+def check_joints(kin: Kinematics, joints: np.ndarray, configs: np.ndarray) -> np.ndarray:
+    """Status per (N, 6) joint pose with its stored config code."""
+    status = np.full(len(configs), OK, dtype=np.int64)
+    stated = configs >= 0
+    status[stated & (kin.config_of(joints) != configs)] = CONFIG_MISMATCH
+    status[configs < -1] = CONFIG_MISMATCH
+    status[~kin.within_limits(joints)] = JOINT_LIMITS
+    return status
+
+
+def validate_library(repo: Any, repoJ: Any, kin: Kinematics, key: str,
+                     workers: int | None = None) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+    """Check and store every pose not yet checked for `key`.
+
+    All three steps on the calling thread. The app splits them instead:
+    read_unchecked and store_results on the DB thread, check_rows on the
+    compute thread. Returns {"cartesian" | "joint": (ids, statuses)}.
+    """
+    rows = read_unchecked(repo, repoJ, key)
+    statuses = check_rows(kin, rows, workers)
+    store_results(repo, repoJ, key, rows, statuses)
+    return results_by_id(rows, statuses)
+
+
+def read_unchecked(repo: Any, repoJ: Any, key: str) -> dict[str, list[tuple]]:
+    """Rows of each table not yet checked for `key` (tables with none are left out)."""
+    rows = {"cartesian": repo.get_unchecked(key), "joint": repoJ.get_unchecked(key)}
+    return {pose_type: table for pose_type, table in rows.items() if table}
+
+
+def check_rows(kin: Kinematics, rows: dict[str, list[tuple]],
+               workers: int | None = None) -> dict[str, np.ndarray]:
+    """Status per row of read_unchecked; no database access."""
+    checks: dict[str, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {
+        "cartesian": lambda values, configs: check_cartesian(kin, values, configs),
+        "joint":     lambda values, configs: check_joints(kin, values, configs),
+    }
+    return {pose_type: np.concatenate(map_chunks(table, checks[pose_type], workers, name="check"))
+            for pose_type, table in rows.items()}
+
+
+def store_results(repo: Any, repoJ: Any, key: str, rows: dict[str, list[tuple]],
+                  statuses: dict[str, np.ndarray]) -> None:
+    """Write check_rows results, one transaction per table."""
+    for pose_type, target, keys in (("cartesian", repo, POSE_KEYS), ("joint", repoJ, JOINT_KEYS)):
+        if pose_type in rows:
+            extras = ({"status": code} for code in statuses[pose_type].tolist())
+            target.store_checks(row_params(rows[pose_type], key, keys, extras))
+
+
+def results_by_id(rows: dict[str, list[tuple]],
+                  statuses: dict[str, np.ndarray]) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+    """{"cartesian" | "joint": (ids, statuses)} for pose_list_model.set_checks."""
+    return {
+        pose_type: (np.array([row[0] for row in table], dtype=np.int64), statuses[pose_type])
+        for pose_type, table in rows.items()
+    }
@@ -0,0 +1,210 @@
+import time
+from dataclasses import dataclass, field
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from model.position_model import PositionModel
+from model.positionJ_model import PositionJModel
+from services.robot_executor import RobotExecutor
+from services.robot_service import RobotService
+
+# Motion parameters shared with RobotService.move.
+_TOOL, _USER, _VEL = 1, 0, 100
+
+# Fallback progress when the state package has no motion queue fields:
+# a point counts as reached within _ARRIVAL_TOL_DEG (max over joints), or,
+# since a blended corner never passes through it, once the arm came within
+# _BLEND_ZONE_DEG and is moving away again.
+_ARRIVAL_TOL_DEG = 0.5
+_BLEND_ZONE_DEG = 10.0
+
+
+@dataclass(slots=True)
+class ProgramStep:
+    name: str
+    kind: str                          # 'cartesian' | 'joint'
+    target: list[float]                # x..rz or j1..j6
+    offset: list[float]                # dx..drz
+    config: int = -1
+    joints: list[float] | None = field(default=None)   # resolved joint target
+
+    @classmethod
+    def from_model(cls, pose: PositionModel | PositionJModel) -> "ProgramStep":
+        offset = [pose.dx, pose.dy, pose.dz, pose.drx, pose.dry, pose.drz]
+        if isinstance(pose, PositionJModel):
+            joints = [pose.j1, pose.j2, pose.j3, pose.j4, pose.j5, pose.j6]
+            return cls(pose.name, "joint", joints, offset, pose.config, list(joints))
+        return cls(pose.name, "cartesian", [pose.x, pose.y, pose.z, pose.rx, pose.ry, pose.rz],
+                   offset, pose.config)
+
+
+class ProgramRunner(QObject):
+    """Runs an ordered list of saved poses as one blended motion.
+
+    start() first resolves IK for every cartesian step in one job on the
+    robot thread (a single batch when local kinematics are verified), so
+    an unreachable pose aborts the program before the arm moves. It then
+    streams MoveJ commands with blendT = blend_ms, keeping up to
+    `lookahead` commands queued on the controller ahead of the one
+    executing; the last point is not blended, so the arm stops there.
+
+    Progress comes from the state package: the controller's motion queue
+    length (mc_queue_len / motion_done) when the SDK reports it, otherwise
+    arrival at each joint target.
+    """
+
+    progressChanged = Signal(int, int, str)   # completed, total, current step name
+    segmentTimed    = Signal(int, str, float) # index, step name, seconds
+    finished        = Signal(bool, str)       # ok, message
+
+    TICK_MS = 20
+
+    def __init__(self, service: RobotService, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._io: RobotExecutor | None = None   # the robot running the program
+        self._service = service
+        self._steps: list[ProgramStep] = []
+        self._blend_ms = 0.0
+        self._lookahead = 1
+        self._sent = 0          # commands handed to the executor
+        self._acked = 0         # commands the controller accepted
+        self._completed = 0
+        self._closest = float("inf")   # nearest approach to the next point so far
+        self._segment_started = 0.0
+        self._running = False
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.TICK_MS)
+        self._timer.timeout.connect(self._tick)
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self, executor: RobotExecutor, steps: list[ProgramStep],
+              blend_ms: float = 100.0, lookahead: int = 3) -> None:
+        """Run `steps` on the robot behind `executor`."""
+        if self._running:
+            return
+        if not steps:
+            self.finished.emit(False, "Program is empty")
+            return
+        self._running = True
+        self._io = executor
+        self._blend_ms = max(0.0, blend_ms)
+        self._lookahead = max(1, lookahead)
+        self._io.submit(self._resolve, steps, timeout=2.0 + 0.1 * len(steps),
+                        on_done=self._begin, on_error=lambda e: self._abort(str(e)))
+
+    def stop(self) -> None:
+        if not self._running:
+            return
+        self._io.stop()
+        self._abort("Program stopped")
+
+    # ── Robot thread ─────────────────────────────────────────────────────────
+
+    def _resolve(self, robot, steps: list[ProgramStep]) -> list[ProgramStep]:
+        # Steps carrying a stored joint solution are already resolved.
+        cartesian = [step for step in steps if step.joints is None]
+        if cartesian:
+            results = self._service.inverse_kin_many(
+                robot, [step.target for step in cartesian], [step.config for step in cartesian])
+            for step, result in zip(cartesian, results):
+                error, joints = result if isinstance(result, tuple) else (result, None)
+                if error != 0 or joints is None:
+                    raise ValueError(f"Pose '{step.name}' is unreachable (IK error {error})")
+                step.joints = [float(j) for j in joints[:6]]
+        return steps
+
+    def _move(self, robot, step: ProgramStep, blend_ms: float) -> int:
+        if any(step.offset):
+            return robot.MoveJ(joint_pos=step.joints, tool=_TOOL, user=_USER, vel=_VEL,
+                               offset_flag=2, offset_pos=step.offset, blendT=blend_ms)
+        return robot.MoveJ(joint_pos=step.joints, tool=_TOOL, user=_USER, vel=_VEL, blendT=blend_ms)
+
+    # ── GUI thread ───────────────────────────────────────────────────────────
+
+    def _begin(self, steps: list[ProgramStep]) -> None:
+        if not self._running:
+            return
+        self._steps = steps
+        self._sent = self._acked = self._completed = 0
+        self._closest = float("inf")
+        self._segment_started = time.perf_counter()
+        print(f"[ProgramRunner] Running {len(steps)} poses (blend {self._blend_ms:.0f} ms)")
+        self.progressChanged.emit(0, len(steps), steps[0].name)
+        self._timer.start()
+        self._tick()
+
+    def _tick(self) -> None:
+        robot = self._io.robot
+        if robot is None:
+            self._abort("Robot disconnected")
+            return
+        self._update_progress(robot.robot_state_pkg)
+        if not self._running:
+            return
+        total = len(self._steps)
+        while self._sent < total and self._sent - self._completed < self._lookahead:
+            index = self._sent
+            blend = self._blend_ms if index < total - 1 else 0
+            self._io.submit(self._move, self._steps[index], blend, kind="motion",
+                            on_done=lambda error, i=index: self._on_sent(i, error),
+                            on_error=lambda e: self._abort(str(e)))
+            self._sent += 1
+
+    def _on_sent(self, index: int, error: int) -> None:
+        if error != 0:
+            self._io.stop()
+            self._abort(f"MoveJ to '{self._steps[index].name}' rejected (error {error})")
+            return
+        self._acked = max(self._acked, index + 1)
+
+    def _update_progress(self, pkg) -> None:
+        queue_len = getattr(pkg, "mc_queue_len", None)
+        motion_done = getattr(pkg, "motion_done", None)
+        if queue_len is not None and motion_done is not None:
+            # Accepted commands minus those still queued / executing.
+            completed = self._acked - int(queue_len) - (0 if motion_done else 1)
+        else:
+            completed = self._completed + self._passed(pkg)
+        completed = min(max(completed, self._completed), self._acked)
+
+        now = time.perf_counter()
+        while self._completed < completed:
+            step = self._steps[self._completed]
+            self.segmentTimed.emit(self._completed, step.name, now - self._segment_started)
+            self._segment_started = now
+            self._completed += 1
+            self._closest = float("inf")
+            current = self._steps[min(self._completed, len(self._steps) - 1)].name
+            self.progressChanged.emit(self._completed, len(self._steps), current)
+
+        if self._completed == len(self._steps):
+            self._timer.stop()
+            self._running = False
+            print("[ProgramRunner] Program finished")
+            self.finished.emit(True, "Program finished")
+
+    def _passed(self, pkg) -> int:
+        """1 if the arm has reached or blended past the next point, else 0."""
+        if self._completed >= self._acked:
+            return 0
+        joints = [float(pkg.jt_cur_pos[i]) for i in range(6)]
+        target = self._steps[self._completed].joints
+        distance = max(abs(a - b) for a, b in zip(joints, target))
+        if distance <= _ARRIVAL_TOL_DEG:
+            return 1
+        last = self._completed == len(self._steps) - 1
+        if not last and self._closest <= _BLEND_ZONE_DEG and distance > self._closest + _ARRIVAL_TOL_DEG:
+            return 1
+        self._closest = min(self._closest, distance)
+        return 0
+
+    def _abort(self, message: str) -> None:
+        if not self._running:
+            return
+        self._timer.stop()
+        self._running = False
+        print(f"[ProgramRunner] {message}")
+        self.finished.emit(False, message)
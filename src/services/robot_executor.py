@@ -0,0 +1,277 @@
+import itertools
+import queue
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+from utils.robot_connection import close_rpc, open_rpc
+
+# Lower runs first. Stops skip the queue entirely (own thread); state queries yield to commands.
+PRIORITY_STOP = 0
+PRIORITY_COMMAND = 1
+PRIORITY_QUERY = 2
+
+DEFAULT_TIMEOUT_S = 2.0
+CONNECT_TIMEOUT_S = 10.0
+
+
+@dataclass(order=True, slots=True)
+class _Job:
+    priority: int
+    seq: int
+    fn: Callable[..., Any] = field(compare=False)
+    args: tuple = field(compare=False)
+    future: Future = field(compare=False)
+    deadline: float = field(compare=False)
+    kind: str = field(compare=False)
+    on_done: Callable[[Any], None] | None = field(compare=False)
+    on_error: Callable[[Exception], None] | None = field(compare=False)
+
+
+class RobotExecutor(QObject):
+    """Single background thread that performs all XML-RPC for one robot.
+
+    The thread owns the Robot.RPC instance (created by connect()); callers
+    hand over fn(robot, *args) with submit() and get a Future back, plus
+    optional on_done / on_error callbacks delivered on the GUI thread.
+    Commands run one at a time, lowest priority value first, FIFO within a
+    priority, so a slow or dropped controller never blocks QML.
+
+    - stop() sends StopMotion on a second connection with its own thread,
+      so it reaches the arm even while a call on the command thread is
+      running or hung, and cancels motion commands still queued. Stops
+      never expire.
+    - submit(..., key=...) keeps only the newest pending job per key
+      (e.g. jog ticks): older ones are cancelled instead of piling up.
+    - Every job has a timeout. Jobs still queued at their deadline are
+      dropped; a call that overruns fails its future with TimeoutError right
+      away (the SDK call itself cannot be interrupted and its late result is
+      discarded).
+    """
+    _delivered = Signal(object, object, object)   # job, result, error
+    linkStalled = Signal(str, float)              # what, seconds it has been running
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.robot = None              # Robot.RPC, set by the executor thread
+        self.ip: str | None = None
+        self._queue: queue.PriorityQueue[_Job] = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._pending_lock = threading.Lock()
+        self._pending: dict[str, _Job] = {}      # key → newest queued job
+        self._running: _Job | None = None
+        self._running_since = 0.0
+        self._link_gen = 0                       # bumped whenever connect() opens a new link
+        self._stop_queue: queue.SimpleQueue[_Job] = queue.SimpleQueue()
+        self._stop_robot = None                  # owned by the stop thread
+        self._stop_ip: str | None = None
+        self._delivered.connect(self._deliver)
+        self._thread = threading.Thread(target=self._run, name="robot-io", daemon=True)
+        self._thread.start()
+        self._stop_thread = threading.Thread(target=self._run_stops, name="robot-stop", daemon=True)
+        self._stop_thread.start()
+        self._watchdog = threading.Thread(target=self._watch, name="robot-io-watchdog", daemon=True)
+        self._watchdog.start()
+
+    # ── Caller API (any thread) ──────────────────────────────────────────────
+
+    def submit(self, fn: Callable[..., Any], *args: Any,
+               priority: int = PRIORITY_COMMAND, timeout: float = DEFAULT_TIMEOUT_S,
+               kind: str = "command", key: str | None = None,
+               on_done: Callable[[Any], None] | None = None,
+               on_error: Callable[[Exception], None] | None = None) -> Future:
+        """Run fn(robot, *args) on the robot thread; returns its Future.
+
+        kind="motion" marks commands that stop() must cancel if still queued.
+        """
+        job = _Job(priority, next(self._seq), fn, args, Future(),
+                   time.monotonic() + timeout, kind, on_done, on_error)
+        if key is not None:
+            with self._pending_lock:
+                previous = self._pending.get(key)
+                self._pending[key] = job
+            if previous is not None:
+                previous.future.cancel()
+        self._queue.put(job)
+        return job.future
+
+    def stop(self, on_done: Callable[[Any], None] | None = None,
+             on_error: Callable[[Exception], None] | None = None) -> Future:
+        """StopMotion on the stop connection, past the command queue; drops queued motion commands."""
+        with self._queue.mutex:
+            pending = list(self._queue.queue)
+        for job in pending:
+            if job.kind == "motion":
+                job.future.cancel()
+
+        def StopMotion(robot):
+            return robot.StopMotion()
+        job = _Job(PRIORITY_STOP, next(self._seq), StopMotion, (), Future(),
+                   float("inf"), "stop", on_done, on_error)
+        self._stop_queue.put(job)
+        return job.future
+
+    @property
+    def busy(self) -> bool:
+        """A call is on the wire and still within its timeout."""
+        job = self._running
+        return job is not None and time.monotonic() <= job.deadline
+
+    def connect(self, ip: str, on_done: Callable[[Any], None] | None = None,
+                on_error: Callable[[Exception], None] | None = None,
+                fresh: bool = False) -> Future:
+        """(Re)connect to the controller at `ip` on the robot thread.
+
+        The current connection is kept if it already goes to `ip`, unless
+        fresh=True (used to recover a dead link).
+        """
+        def _connect(_robot, ip: str):
+            if self.robot is not None and (fresh or ip != self.ip):
+                old, self.robot = self.robot, None
+                close_rpc(old, self.ip)
+            if self.robot is None:
+                self.robot = open_rpc(ip)
+                self.ip = ip
+                self._link_gen += 1     # the stop thread reopens its link too
+                self._stop_queue.put(_Job(PRIORITY_STOP, -1, None, (), Future(),
+                                          float("inf"), "open", None, None))
+            return ip
+        return self.submit(_connect, ip, timeout=CONNECT_TIMEOUT_S, kind="connect",
+                           on_done=on_done, on_error=on_error)
+
+    def shutdown(self) -> None:
+        """Finish the running call, stop the thread and close the connection (pending jobs are cancelled)."""
+        while True:
+            try:
+                self._queue.get_nowait().future.cancel()
+            except queue.Empty:
+                break
+        self._queue.put(_Job(-1, -1, None, (), Future(), 0.0, "shutdown", None, None))
+        self._stop_queue.put(_Job(-1, -1, None, (), Future(), 0.0, "shutdown", None, None))
+        self._thread.join(timeout=CONNECT_TIMEOUT_S)
+        self._stop_thread.join(timeout=CONNECT_TIMEOUT_S)
+        if self.robot is not None:
+            close_rpc(self.robot, self.ip)
+            self.robot = None
+        self._close_stop_link()
+
+    # ── Robot thread ─────────────────────────────────────────────────────────
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job.kind == "shutdown":
+                return
+            if job.future.cancelled():
+                continue
+            with self._pending_lock:
+                for key, pending in list(self._pending.items()):
+                    if pending is job:
+                        del self._pending[key]
+            if time.monotonic() > job.deadline:
+                self._fail(job, TimeoutError("robot command expired in queue"))
+                continue
+            if not job.future.set_running_or_notify_cancel():
+                continue
+            self._running, self._running_since = job, time.monotonic()
+            try:
+                robot = self.robot if job.kind == "connect" else self._robot()
+                result, error = job.fn(robot, *job.args), None
+            except Exception as e:
+                result, error = None, e
+            finally:
+                self._running = None
+            try:
+                if error is None:
+                    job.future.set_result(result)
+                else:
+                    job.future.set_exception(error)
+            except InvalidStateError:
+                continue    # timed out by the watchdog; late result discarded
+            self._delivered.emit(job, result, error)
+
+    # ── Stop thread ──────────────────────────────────────────────────────────
+
+    def _run_stops(self) -> None:
+        gen = 0     # link generation the stop connection was opened for
+        while True:
+            job = self._stop_queue.get()
+            if job.kind == "shutdown":
+                return
+            if gen != self._link_gen:
+                self._close_stop_link()
+            if job.kind == "open":
+                try:
+                    gen = self._open_stop_link(gen)
+                except Exception as e:
+                    print(f"[Robot] Stop connection failed: {e}")   # retried by the next stop
+                continue
+            if not job.future.set_running_or_notify_cancel():
+                continue
+            try:
+                gen = self._open_stop_link(gen)
+                result, error = job.fn(self._stop_robot), None
+            except Exception as e:
+                result, error = None, e
+                self._close_stop_link()     # the next stop starts on a fresh link
+            if error is None:
+                job.future.set_result(result)
+            else:
+                job.future.set_exception(error)
+            self._delivered.emit(job, result, error)
+
+    def _open_stop_link(self, gen: int) -> int:
+        """Open the stop connection if needed; returns the link generation it belongs to."""
+        if self._stop_robot is not None:
+            return gen
+        gen, ip = self._link_gen, self.ip
+        if ip is None:
+            raise ConnectionError("Robot not connected")
+        self._stop_robot, self._stop_ip = open_rpc(ip), ip
+        return gen
+
+    def _close_stop_link(self) -> None:
+        if self._stop_robot is not None:
+            old, self._stop_robot = self._stop_robot, None
+            close_rpc(old, self._stop_ip)
+
+    def _robot(self):
+        if self.robot is None:
+            raise ConnectionError("Robot not connected")
+        return self.robot
+
+    def _fail(self, job: _Job, error: Exception) -> None:
+        if job.future.set_running_or_notify_cancel():
+            job.future.set_exception(error)
+            self._delivered.emit(job, None, error)
+
+    def _watch(self) -> None:
+        while self._thread.is_alive():
+            time.sleep(0.05)
+            job = self._running
+            if job is None or job.future.done() or time.monotonic() <= job.deadline:
+                continue
+            elapsed = time.monotonic() - self._running_since
+            try:
+                job.future.set_exception(TimeoutError(f"robot command timed out after {elapsed:.1f}s"))
+            except InvalidStateError:
+                continue    # finished in the meantime
+            self._delivered.emit(job, None, job.future.exception())
+            self.linkStalled.emit(getattr(job.fn, "__name__", "command"), elapsed)
+
+    # ── GUI thread ───────────────────────────────────────────────────────────
+
+    @Slot(object, object, object)
+    def _deliver(self, job: _Job, result: Any, error: Exception | None) -> None:
+        if error is not None:
+            if job.on_error:
+                job.on_error(error)
+            else:
+                print(f"[Robot] {getattr(job.fn, '__name__', job.fn)} failed: {error}")
+            return
+        if job.on_done:
+            job.on_done(result)
@@ -0,0 +1,187 @@
+"""Robot connection manager: background connect, heartbeat and reconnect.
+
+RobotLink owns the connection lifecycle on top of RobotExecutor:
+
+    connecting    first attempt(s) for the requested ip
+    connected     heartbeats answering
+    reconnecting  link lost; retrying with exponential backoff
+    disconnected  no ip requested yet
+
+A connection only counts as up once a real RPC has answered (creating
+Robot.RPC does not prove the controller is reachable). While connected,
+a cheap RPC is sent every HEARTBEAT_MS unless another call is already on
+the wire; its round trip is published as rttMs. MAX_MISSES failed heartbeats or stalled
+calls in a row drop the link and start the reconnect loop
+(BACKOFF_BASE_S, doubling up to BACKOFF_MAX_S).
+"""
+import time
+
+from PySide6.QtCore import Property, QObject, QTimer, Signal
+
+from services.robot_executor import PRIORITY_QUERY, RobotExecutor
+
+HEARTBEAT_MS = 1000
+HEARTBEAT_TIMEOUT_S = 2.0
+MAX_MISSES = 3
+BACKOFF_BASE_S = 0.5
+BACKOFF_MAX_S = 30.0
+
+DISCONNECTED = "disconnected"
+CONNECTING = "connecting"
+CONNECTED = "connected"
+RECONNECTING = "reconnecting"
+
+
+def _ping(robot) -> float:
+    """One controller round trip, in ms."""
+    started = time.perf_counter()
+    result = robot.GetControllerIP()
+    error = result[0] if isinstance(result, tuple) else result
+    if error != 0:
+        raise ConnectionError(f"heartbeat returned error {error}")
+    return (time.perf_counter() - started) * 1000.0
+
+
+class RobotLink(QObject):
+    """Link state for QML (exposed as "RobotLink") and reconnect driver."""
+
+    linkChanged = Signal()      # notify for state, ip, rttMs, attempt
+    linkUp      = Signal(str)   # ip — first connect and every reconnect
+    linkDown    = Signal(str)   # ip — heartbeats lost
+
+    def __init__(self, executor: RobotExecutor, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._io = executor
+        self._state = DISCONNECTED
+        self._ip = ""
+        self._rtt_ms = -1.0
+        self._attempt = 0          # failed attempts since the last success
+        self._misses = 0
+        self._beat_pending = False
+        # Bumped per connect_to(); callbacks from an older target are ignored.
+        self._generation = 0
+
+        self._heartbeat = QTimer(self)
+        self._heartbeat.setInterval(HEARTBEAT_MS)
+        self._heartbeat.timeout.connect(self._beat)
+        self._retry = QTimer(self)
+        self._retry.setSingleShot(True)
+        self._retry.timeout.connect(lambda: self._attempt_connect(fresh=True))
+        executor.linkStalled.connect(self._on_stalled)
+
+    def _get_state(self) -> str:
+        return self._state
+
+    def _get_ip(self) -> str:
+        return self._ip
+
+    def _get_rtt_ms(self) -> float:
+        return self._rtt_ms
+
+    def _get_attempt(self) -> int:
+        return self._attempt
+
+    state   = Property(str, _get_state, notify=linkChanged)
+    ip      = Property(str, _get_ip, notify=linkChanged)
+    rttMs   = Property(float, _get_rtt_ms, notify=linkChanged)   # -1 until measured
+    attempt = Property(int, _get_attempt, notify=linkChanged)
+
+    @property
+    def connected(self) -> bool:
+        return self._state == CONNECTED
+
+    def connect_to(self, ip: str) -> None:
+        """Connect to `ip` in the background; a no-op if already on it."""
+        if ip == self._ip and self._state in (CONNECTING, CONNECTED):
+            return
+        self._generation += 1
+        self._retry.stop()
+        self._heartbeat.stop()
+        self._ip, self._attempt, self._rtt_ms = ip, 0, -1.0
+        self._set_state(CONNECTING)
+        self._attempt_connect(fresh=False)
+
+    def stop(self) -> None:
+        self._retry.stop()
+        self._heartbeat.stop()
+
+    # ── Connecting ───────────────────────────────────────────────────────────
+
+    def _attempt_connect(self, fresh: bool) -> None:
+        generation = self._generation
+        print(f"[RobotLink] Connecting to {self._ip} (attempt {self._attempt + 1})")
+        self._io.connect(self._ip, fresh=fresh,
+                         on_done=lambda _ip: self._verify(generation),
+                         on_error=lambda e: self._on_attempt_failed(generation, e))
+
+    def _verify(self, generation: int) -> None:
+        """Connection object created; up once the controller answers."""
+        if generation != self._generation:
+            return
+        self._io.submit(_ping, priority=PRIORITY_QUERY, timeout=HEARTBEAT_TIMEOUT_S, kind="heartbeat",
+                        on_done=lambda rtt: self._on_up(generation, rtt),
+                        on_error=lambda e: self._on_attempt_failed(generation, e))
+
+    def _on_up(self, generation: int, rtt_ms: float) -> None:
+        if generation != self._generation:
+            return
+        self._attempt, self._misses, self._rtt_ms = 0, 0, rtt_ms
+        self._set_state(CONNECTED)
+        print(f"[RobotLink] Connected to {self._ip} ({rtt_ms:.1f} ms)")
+        self._heartbeat.start()
+        self.linkUp.emit(self._ip)
+
+    def _on_attempt_failed(self, generation: int, error: Exception) -> None:
+        if generation != self._generation:
+            return
+        self._attempt += 1
+        delay = min(BACKOFF_MAX_S, BACKOFF_BASE_S * 2 ** (self._attempt - 1))
+        print(f"[RobotLink] {self._ip} unreachable ({error}); retrying in {delay:g}s")
+        self.linkChanged.emit()
+        self._retry.start(int(delay * 1000))
+
+    # ── Health ───────────────────────────────────────────────────────────────
+
+    def _beat(self) -> None:
+        # A call on the wire is its own health check: if it overruns, the
+        # executor reports it (_on_stalled) and the next beat goes out.
+        if self._beat_pending or self._io.busy:
+            return
+        self._beat_pending = True
+        generation = self._generation
+        self._io.submit(_ping, priority=PRIORITY_QUERY, timeout=HEARTBEAT_TIMEOUT_S,
+                        kind="heartbeat", key="heartbeat",
+                        on_done=lambda rtt: self._on_beat(generation, rtt),
+                        on_error=lambda e: self._on_beat(generation, None, e))
+
+    def _on_beat(self, generation: int, rtt_ms: float | None, error: Exception | None = None) -> None:
+        self._beat_pending = False
+        if generation != self._generation:
+            return
+        if error is None:
+            self._misses = 0
+            self._rtt_ms = rtt_ms
+            self.linkChanged.emit()
+        else:
+            self._miss(f"heartbeat failed: {error}")
+
+    def _on_stalled(self, what: str, seconds: float) -> None:
+        if self._state == CONNECTED:
+            self._miss(f"{what} stalled for {seconds:.1f}s")
+
+    def _miss(self, reason: str) -> None:
+        self._misses += 1
+        print(f"[RobotLink] {reason} ({self._misses}/{MAX_MISSES})")
+        if self._misses < MAX_MISSES:
+            return
+        self._generation += 1     # late heartbeats belong to the dead link
+        self._heartbeat.stop()
+        self._rtt_ms = -1.0
+        self._set_state(RECONNECTING)
+        print(f"[RobotLink] Link to {self._ip} lost, reconnecting")
+        self.linkDown.emit(self._ip)
+        self._attempt_connect(fresh=True)
+
+    def _set_state(self, state: str) -> None:
+        self._state = state
+        self.linkChanged.emit()
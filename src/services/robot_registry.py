@@ -0,0 +1,199 @@
+"""Named robot connections for running several cells from one station.
+
+Each RobotCell is one controller with its own command thread
+(RobotExecutor), link monitor (RobotLink) and state poll (StateHub), so a
+slow or dropped cell never holds up another. The registry tracks which
+cell is selected (the one the jog panel, pose moves and programs target)
+and fans batch actions out to every cell at once: since each cell's calls
+run on its own thread, stop_all / fan_out take as long as the slowest
+cell rather than the sum of all of them.
+"""
+from typing import Any, Callable
+
+from PySide6.QtCore import Property, QObject, Signal
+
+from services.robot_executor import PRIORITY_QUERY, DEFAULT_TIMEOUT_S, RobotExecutor
+from services.robot_link import RobotLink
+from services.state_hub import StateHub
+
+FEED_PORT = 9999   # the cell controller's joint WebSocket server (robot_viewer feed)
+
+
+class RobotCell(QObject):
+    """One controller: command thread, link monitor and state poll."""
+
+    def __init__(self, name: str, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.name = name
+        self.io = RobotExecutor(self)
+        self.link = RobotLink(self.io, self)
+        self.hub = StateHub(self._state_pkg, self)
+        # Background cells poll slowly; the selected one is sped up by its owner.
+        self.hub.set_visible(False)
+        self.hub.start()
+
+    def _state_pkg(self):
+        robot = self.io.robot
+        return robot.robot_state_pkg if robot is not None else None
+
+    def summary(self) -> dict:
+        """name, ip, link state, rtt_ms and the last polled estop/collision/enable."""
+        state = self.hub.snapshot
+        return {
+            "name": self.name,
+            "ip": self.link.ip,
+            "state": self.link.state,
+            "rtt_ms": self.link.rttMs,
+            "estop": state.get("estop", -1),
+            "collision": state.get("collision", -1),
+            "enable": state.get("enable", -1),
+        }
+
+    def shutdown(self) -> None:
+        self.link.stop()
+        self.hub.stop()
+        self.io.shutdown()
+
+
+class RobotRegistry(QObject):
+    """Named RobotCells plus the current selection (exposed to QML as "Robots")."""
+
+    cellsChanged    = Signal()           # added / removed / re-addressed
+    selectedChanged = Signal()
+    overviewChanged = Signal()           # any cell's link state, RTT or status flags
+    linkUp          = Signal(str, str)   # name, ip
+    feedChanged     = Signal()           # the selected cell's joint feed moved
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._cells: dict[str, RobotCell] = {}
+        self._selected = ""
+        self._feed_at: Callable[[str], str] = lambda ip: f"{ip}:{FEED_PORT}"
+        self._feed_host = ""
+        self.cellsChanged.connect(self.overviewChanged)
+        self.cellsChanged.connect(self._refresh_feed)
+        self.selectedChanged.connect(self._refresh_feed)
+
+    # ── QML ──────────────────────────────────────────────────────────────────
+
+    def _get_names(self) -> list[str]:
+        return list(self._cells)
+
+    def _get_selected(self) -> str:
+        return self._selected
+
+    def _get_link(self) -> QObject | None:
+        cell = self.current
+        return cell.link if cell is not None else None
+
+    def _get_overview(self) -> list[dict]:
+        return [cell.summary() for cell in self._cells.values()]
+
+    def _get_feed_host(self) -> str:
+        return self._feed_host
+
+    names    = Property("QVariantList", _get_names, notify=cellsChanged)
+    selected = Property(str, _get_selected, notify=selectedChanged)
+    link     = Property(QObject, _get_link, notify=selectedChanged)   # selected cell's RobotLink
+    overview = Property("QVariantList", _get_overview, notify=overviewChanged)
+    feedHost = Property(str, _get_feed_host, notify=feedChanged)      # selected cell's joint WebSocket
+
+    # ── Cells ────────────────────────────────────────────────────────────────
+
+    @property
+    def current(self) -> RobotCell | None:
+        return self._cells.get(self._selected)
+
+    @property
+    def cells(self) -> list[RobotCell]:
+        return list(self._cells.values())
+
+    def get(self, name: str) -> RobotCell | None:
+        return self._cells.get(name)
+
+    def addresses(self) -> dict[str, str]:
+        """name → ip, for saving the cell list."""
+        return {name: cell.link.ip for name, cell in self._cells.items()}
+
+    def add(self, name: str, ip: str) -> RobotCell:
+        """Add a cell and start connecting it; an existing name is re-pointed at `ip`."""
+        cell = self._cells.get(name)
+        if cell is None:
+            cell = self._cells[name] = RobotCell(name, self)
+            cell.link.linkUp.connect(lambda ip, name=name: self.linkUp.emit(name, ip))
+            cell.link.linkChanged.connect(self.overviewChanged)
+            cell.hub.changed.connect(self._on_cell_state)
+        cell.link.connect_to(ip)
+        self.cellsChanged.emit()
+        if not self._selected:
+            self.select(name)
+        return cell
+
+    def remove(self, name: str) -> None:
+        cell = self._cells.pop(name, None)
+        if cell is None:
+            return
+        if name == self._selected:
+            self._selected = next(iter(self._cells), "")
+            self.selectedChanged.emit()
+        cell.shutdown()
+        cell.deleteLater()
+        self.cellsChanged.emit()
+
+    def select(self, name: str) -> None:
+        if name in self._cells and name != self._selected:
+            self._selected = name
+            self.selectedChanged.emit()
+
+    def set_feed_resolver(self, feed_at: Callable[[str], str]) -> None:
+        """ip → joint feed host:port for the viewer (default: the controller's FEED_PORT)."""
+        self._feed_at = feed_at
+        self._refresh_feed()
+
+    def shutdown(self) -> None:
+        for cell in self._cells.values():
+            cell.shutdown()
+
+    def _refresh_feed(self) -> None:
+        cell = self.current
+        host = self._feed_at(cell.link.ip) if cell is not None and cell.link.ip else ""
+        if host != self._feed_host:
+            self._feed_host = host
+            self.feedChanged.emit()
+
+    def _on_cell_state(self, delta: dict) -> None:
+        if delta.keys() & {"estop", "collision", "enable"}:
+            self.overviewChanged.emit()
+
+    # ── Batch actions ────────────────────────────────────────────────────────
+
+    def stop_all(self, on_done: Callable[[dict[str, Any]], None] | None = None) -> None:
+        """StopMotion on every cell at once (queued motion is dropped first)."""
+        self._gather(self.cells, lambda cell, done, error: cell.io.stop(on_done=done, on_error=error),
+                     on_done)
+
+    def fan_out(self, fn: Callable[..., Any], *args: Any, on_done: Callable[[dict[str, Any]], None],
+                priority: int = PRIORITY_QUERY, timeout: float = DEFAULT_TIMEOUT_S) -> None:
+        """fn(robot, *args) on every connected cell in parallel.
+
+        on_done gets {name: result or the exception raised} on the GUI
+        thread once every cell has answered or timed out.
+        """
+        cells = [cell for cell in self._cells.values() if cell.link.connected]
+        self._gather(cells, lambda cell, done, error: cell.io.submit(
+            fn, *args, priority=priority, timeout=timeout, on_done=done, on_error=error), on_done)
+
+    @staticmethod
+    def _gather(cells: list[RobotCell], submit: Callable, on_done: Callable | None) -> None:
+        results: dict[str, Any] = {}
+
+        def _finish(name: str, value: Any) -> None:
+            results[name] = value
+            if len(results) == len(cells) and on_done is not None:
+                on_done(results)
+
+        if not cells and on_done is not None:
+            on_done(results)
+        for cell in cells:
+            submit(cell, lambda result, name=cell.name: _finish(name, result),
+                   lambda error, name=cell.name: _finish(name, error))
@@ -1,89 +1,197 @@
-from typing import Optional
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+import numpy as np
+
 from model.position_model import PositionModel
 from model.positionJ_model import PositionJModel
+from model.pose_snapshot import PoseSnapshot
 from repository.position_repository import PositionRepository
 from repository.positionJ_repository import PositionJRepository
-from utils.robot_singleton import RobotSingletonRCP
+from utils.kinematics import Kinematics, MODELS
+from services.joint_solutions import solution_key
 from datetime import datetime
 
+# Arm model for local kinematics (FR3, FR5, FR10, FR16); the bundled viewer is an FR3.
+ROBOT_MODEL = os.environ.get("ROBOT_MODEL", "FR3")
+
+# Local IK must agree with GetInverseKin this closely (degrees) to be used.
+_KIN_TOLERANCE_DEG = 0.05
+# Verification results kept for this many connections (one per robot,
+# plus a few just replaced by reconnects).
+_KIN_CACHE_SIZE = 16
+
 class RobotService:
 
     def __init__(self):
         self._repo = PositionRepository()
         self._repoJ = PositionJRepository()
+        # Per connection: (connection, local IK or None if it disagrees with
+        # the controller, key of the stored joint solutions valid for it).
+        # Shared by every robot's executor thread, hence the lock.
+        self._kin: OrderedDict[int, tuple[Any, Kinematics | None, str | None]] = OrderedDict()
+        self._kin_lock = threading.Lock()
 
-    def get_current_pose(self) -> "PositionModel":
-        robot = RobotSingletonRCP()
-        result = robot.GetActualTCPPose()
-        timestamp = datetime.now().isoformat()
-        ip_result = robot.GetControllerIP()
+    def _local_kinematics(self, robot) -> Kinematics | None:
+        """Local IK for `robot` if it reproduces the controller's own solver.
 
-        if isinstance(result, tuple):
-            error, pose = result
-            x, y, z, rx, ry, rz = pose
-        else:
-            error = result
-            x = y = z = rx = ry = rz = 0.0
+        Checked once per connection: the TCP offset is derived from the
+        current joints and TCP pose in robot_state_pkg, then one
+        GetInverseKin on a nearby target must match the local solution and
+        the reported config code must match ours.
+        """
+        return self._verified(robot)[1]
 
-        config = -1
-        result = robot.GetRobotCurJointsConfig()
-        if(isinstance(result, tuple)): 
-            error, data = result
-            if(error == 0): config = data
-
-        ip = ip_result[1] if isinstance(ip_result, tuple) else "0.0.0.0"
-
-        return PositionModel(
-                                id=None,
-                                name='nome do ponto',
-                                x=float(x),
-                                y=float(y),
-                                z=float(z),
-                                rx=float(rx),
-                                ry=float(ry),
-                                rz=float(rz),
-                                config=int(config),
-                                created_at=timestamp
-                            )
-        
-    def get_current_joint_pose(self) -> "PositionJModel":
-        robot = RobotSingletonRCP()
-        result = robot.GetActualJointPosDegree(0)  # 0 = todas as juntas
-        timestamp = datetime.now().isoformat()
-        ip_result = robot.GetControllerIP()
+    def _verified(self, robot) -> tuple[Any, Kinematics | None, str | None]:
+        with self._kin_lock:
+            entry = self._kin.get(id(robot))
+        if entry is not None and entry[0] is robot:
+            return entry
+        # Only this robot's own thread calls in with it, so no double check.
+        kin = self._verify_kinematics(robot)
+        key = solution_key(ROBOT_MODEL, kin, tool=1, user=0) if kin is not None else None
+        entry = (robot, kin, key)
+        with self._kin_lock:
+            self._kin[id(robot)] = entry
+            while len(self._kin) > _KIN_CACHE_SIZE:
+                self._kin.popitem(last=False)
+        return entry
 
-        if isinstance(result, tuple):
-            error, joints = result
-            if error == 0 and len(joints) >= 6:
-                j1, j2, j3, j4, j5, j6 = joints[:6]
-            else:
-                j1 = j2 = j3 = j4 = j5 = j6 = 0.0
+    def solver(self, robot) -> tuple[Kinematics, str] | None:
+        """(verified local IK, its solution key) for bulk-solving saved poses, or None."""
+        _, kin, key = self._verified(robot)
+        return (kin, key) if kin is not None else None
+
+    @staticmethod
+    def _verify_kinematics(robot) -> Kinematics | None:
+        if ROBOT_MODEL not in MODELS:
+            return None
+        try:
+            kin = Kinematics(ROBOT_MODEL)
+            pkg = robot.robot_state_pkg
+            joints = np.array([float(j) for j in pkg.jt_cur_pos[:6]])
+            tcp = np.array([float(v) for v in pkg.tl_cur_pos[:6]])
+            kin.calibrate_tool(joints, tcp)
+
+            target = tcp + np.array([0.0, 0.0, 10.0, 0.0, 0.0, 0.0])
+            error, remote = robot.GetInverseKin(type=0, desc_pos=target.tolist(), config=-1)
+            local, ok = kin.ik(target, -1, reference=joints)
+            cfg = robot.GetRobotCurJointsConfig()
+            same_config = isinstance(cfg, tuple) and cfg[0] == 0 and int(cfg[1]) == int(kin.config_of(joints)[0])
+            diff = np.abs(((local - np.asarray(remote[:6], dtype=float)) + 180.0) % 360.0 - 180.0).max()
+            if error == 0 and ok and same_config and diff < _KIN_TOLERANCE_DEG:
+                print(f"[Kinematics] Local {ROBOT_MODEL} IK verified (Δ={diff:.4f}°)")
+                return kin
+            print(f"[Kinematics] Local {ROBOT_MODEL} IK disagrees with controller (Δ={diff:.3f}°), using GetInverseKin")
+        except Exception as e:
+            print(f"[Kinematics] Verification failed, using GetInverseKin: {e}")
+        return None
+
+    def inverse_kin(self, robot, desc_pos: list[float], config: int):
+        """GetInverseKin-compatible (error, joints), solved locally when verified."""
+        kin = self._local_kinematics(robot)
+        if kin is None:
+            return robot.GetInverseKin(desc_pos=desc_pos, type=0, config=config)
+        reference = [float(j) for j in robot.robot_state_pkg.jt_cur_pos[:6]]
+        joints, ok = kin.ik(np.asarray(desc_pos, dtype=float), config, reference=reference)
+        # Non-zero error like GetInverseKin's when no solution exists.
+        return (0, joints.tolist()) if ok else (-1, None)
+
+    def inverse_kin_many(self, robot, poses: list[list[float]], configs: list[int]) -> list[tuple]:
+        """inverse_kin for a whole sequence, solved in one batch when local IK is verified.
+
+        config -1 entries take the solution nearest the previous pose's
+        joints (the arm's current joints for the first), as if moving
+        through the list in order.
+        """
+        kin = self._local_kinematics(robot)
+        if kin is None:
+            return [robot.GetInverseKin(desc_pos=list(pose), type=0, config=int(config))
+                    for pose, config in zip(poses, configs)]
+        poses_arr = np.asarray(poses, dtype=float).reshape(-1, 6)
+        configs_arr = np.asarray(configs, dtype=int)
+        joints, ok = kin.ik(poses_arr, np.maximum(configs_arr, 0))
+        reference = np.array([float(j) for j in robot.robot_state_pkg.jt_cur_pos[:6]])
+        results = []
+        for i, config in enumerate(configs_arr):
+            if config < 0:
+                joints[i], ok[i] = kin.ik(poses_arr[i], -1, reference=reference)
+            if ok[i]:
+                reference = joints[i]
+            results.append((0, joints[i].tolist()) if ok[i] else (-1, None))
+        return results
+
+    def capture_pose(self, robot) -> PoseSnapshot:
+        """TCP pose, joints and config of the arm from one state frame.
+
+        Everything comes from a single robot_state_pkg frame, so the TCP
+        and joints are from the same instant; the config code is derived
+        from those joints with the verified local kinematics, making the
+        capture free of RPCs. Without verified kinematics the config costs
+        one GetRobotCurJointsConfig, and without a state package the pose
+        is read over RPC instead.
+        """
+        pkg = robot.robot_state_pkg     # one reference: the SDK swaps in whole frames
+        captured_at = datetime.now().isoformat()
+        try:
+            tcp = tuple(float(v) for v in pkg.tl_cur_pos[:6])
+            joints = tuple(float(j) for j in pkg.jt_cur_pos[:6])
+            frame = int(getattr(pkg, "frame_cnt", -1))
+        except (AttributeError, TypeError, ValueError):
+            return self._capture_pose_rpc(robot, captured_at)
+        if len(tcp) < 6 or len(joints) < 6:
+            return self._capture_pose_rpc(robot, captured_at)
+
+        kin = self._local_kinematics(robot)
+        if kin is not None:
+            config = int(kin.config_of(np.asarray(joints))[0])
         else:
-            j1 = j2 = j3 = j4 = j5 = j6 = 0.0
+            config = self._joints_config(robot)
+        return PoseSnapshot(tcp=tcp, joints=joints, config=config, frame=frame, captured_at=captured_at)
+
+    def _capture_pose_rpc(self, robot, captured_at: str) -> PoseSnapshot:
+        error, joints = robot.GetActualJointPosDegree(0)  # 0 = todas as juntas
+        if error != 0:
+            raise ConnectionError(f"GetActualJointPosDegree returned {error}")
+        error, tcp = robot.GetActualTCPPose()
+        if error != 0:
+            raise ConnectionError(f"GetActualTCPPose returned {error}")
+        return PoseSnapshot(tcp=tuple(float(v) for v in tcp[:6]), joints=tuple(float(j) for j in joints[:6]),
+                            config=self._joints_config(robot), captured_at=captured_at)
 
-        config = -1
+    @staticmethod
+    def _joints_config(robot) -> int:
         result = robot.GetRobotCurJointsConfig()
-        if(isinstance(result, tuple)): 
-            error, data = result
-            if(error == 0): config = data
-
-        ip = ip_result[1] if isinstance(ip_result, tuple) else "0.0.0.0"
-
-        return PositionJModel(
-                                id=None,
-                                name='nome do ponto',
-                                j1=float(j1),
-                                j2=float(j2),
-                                j3=float(j3),
-                                j4=float(j4),
-                                j5=float(j5),
-                                j6=float(j6),
-                                config=int(config),
-                                created_at=timestamp
-                            )
-        
-    def get_sdk_version(self):
-        robot = RobotSingletonRCP()
+        if isinstance(result, tuple) and result[0] == 0:
+            return int(result[1])
+        return -1
+
+    def get_current_pose(self, robot) -> "PositionModel":
+        return self.capture_pose(robot).as_position()
+
+    def get_current_joint_pose(self, robot) -> "PositionJModel":
+        return self.capture_pose(robot).as_joint_position()
+
+    def read_state(self, robot) -> dict:
+        """TCP pose, joints and status flags, read over RPC."""
+        error, tcp = robot.GetActualTCPPose()
+        if error != 0:
+            raise ConnectionError(f"GetActualTCPPose returned {error}")
+        error, joints = robot.GetActualJointPosDegree()
+        if error != 0:
+            raise ConnectionError(f"GetActualJointPosDegree returned {error}")
+        pkg = robot.robot_state_pkg
+        return {
+            "tcp": [float(v) for v in tcp[:6]],
+            "joints": [float(j) for j in joints[:6]],
+            "estop": int(pkg.EmergencyStop),
+            "collision": int(pkg.collisionState),
+            "enable": int(pkg.rbtEnableState),
+        }
+
+    def get_sdk_version(self, robot):
         return robot.GetSDKVersion()
 
     def save_current_pose(self, robotModel: PositionModel):
@@ -96,17 +204,8 @@ class RobotService:
         robotModel.name = "nome do ponto"
         self._repoJ.insert_pose(robotModel)
 
-    def move(self, points: PositionModel):
-        
-        robot = RobotSingletonRCP()
-        timestamp = datetime.now().isoformat()
-        ip_result = robot.GetControllerIP()
-
-        print("Pontos recebidos para mover o robo:", points)
-        print("IP do robo:", ip_result)
-        print("Timestamp da operacao:", timestamp)
-        print("Iniciando movimento...")
-
+    def move(self, robot, points: PositionModel, joints: list[float] | None = None):
+        """MoveJ to a cartesian pose; `joints` is its stored solution, if known."""
         desc_pos1 = [points.x, 
                      points.y, 
                      points.z, 
@@ -117,20 +216,18 @@ class RobotService:
         
         config1 = points.config
         
-        result = robot.GetInverseKin(desc_pos = desc_pos1, type = 0, config = config1)
+        result = (0, joints) if joints is not None else self.inverse_kin(robot, desc_pos1, config1)
         if(isinstance(result, tuple)):
             error, position = result
             if(error != 0): return False
             success = robot.MoveJ(joint_pos = position, tool = 1, user = 0, vel = 100, blendT=0)
-            print("Movendo o robo para a posicao salva", success)
             return bool(success == 0)
     
-    def move_with_offset(self, points: PositionModel):
-        robot = RobotSingletonRCP()
+    def move_with_offset(self, robot, points: PositionModel, joints: list[float] | None = None):
         desc_pos = [points.x, points.y, points.z, points.rx, points.ry, points.rz]
         offset_pos = [points.dx, points.dy, points.dz, points.drx, points.dry, points.drz]
         config1 = points.config
-        result = robot.GetInverseKin(desc_pos=desc_pos, type=0, config=config1)
+        result = (0, joints) if joints is not None else self.inverse_kin(robot, desc_pos, config1)
         if isinstance(result, tuple):
             error, joint_pos = result
             if error != 0:
@@ -139,20 +236,14 @@ class RobotService:
                                   offset_flag=2, offset_pos=offset_pos, blendT=0)
             return bool(success == 0)
 
-    def move_joints_with_offset(self, points: PositionJModel):
-        robot = RobotSingletonRCP()
+    def move_joints_with_offset(self, robot, points: PositionJModel):
         joint_pos = [points.j1, points.j2, points.j3, points.j4, points.j5, points.j6]
         offset_pos = [points.dx, points.dy, points.dz, points.drx, points.dry, points.drz]
         success = robot.MoveJ(joint_pos=joint_pos, tool=1, user=0, vel=100,
                               offset_flag=2, offset_pos=offset_pos, blendT=0)
         return bool(success == 0)
 
-    def move_joints(self, points: PositionJModel):
-
-        robot = RobotSingletonRCP()
-        timestamp = datetime.now().isoformat()
-        ip_result = robot.GetControllerIP()
-
+    def move_joints(self, robot, points: PositionJModel):
         joint_pos = [points.j1,
                      points.j2,
                      points.j3,
@@ -164,6 +255,5 @@ class RobotService:
         success = robot.MoveJ(joint_pos = joint_pos, tool = 1, user = 0, vel = 100, blendT=0)
         return bool(success == 0)
 
-    def stop_motion(self):
-        robot = RobotSingletonRCP()
+    def stop_motion(self, robot):
         robot.StopMotion()
\ No newline at end of file
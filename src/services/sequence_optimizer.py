@@ -0,0 +1,194 @@
+"""Visit order for a set of poses that minimises estimated cycle time.
+
+The cost of moving between two poses is the duration of a synchronised
+MoveJ between their joint vectors: every axis runs a trapezoidal profile
+with its own speed / acceleration limit and the move lasts as long as the
+slowest one, so the matrix is computed for all pairs at once in NumPy
+(in row blocks to bound memory).
+
+The order is then a shortest open path through that matrix: nearest
+neighbour to start, improved by 2-opt (reverse a stretch) and Or-opt
+(move a run of 1–3 poses elsewhere, either way round) until neither finds
+a gain or the time budget runs out. Each pass scans all candidate moves
+for one position as a single vector operation, which keeps a few hundred
+poses well under a second.
+
+Ends are pinned by sentinel nodes: a fixed first / last pose stays where
+it is; an open start may begin at the arm's current joints (or anywhere),
+and an open end finishes wherever is cheapest.
+"""
+import time
+
+import numpy as np
+
+# Nominal FR joint limits at 100 % velocity (deg/s, deg/s²).
+JOINT_SPEED_DPS = np.array([180.0, 180.0, 180.0, 180.0, 180.0, 180.0])
+JOINT_ACCEL_DPS2 = np.array([720.0, 720.0, 720.0, 720.0, 720.0, 720.0])
+
+TIME_BUDGET_S = 0.5
+MAX_SEGMENT = 3         # longest run Or-opt relocates
+_ROW_BLOCK = 256
+_EPS = 1e-9
+
+
+def travel_times(joints: np.ndarray, to: np.ndarray | None = None,
+                 speed: np.ndarray = JOINT_SPEED_DPS, accel: np.ndarray = JOINT_ACCEL_DPS2) -> np.ndarray:
+    """(N, M) MoveJ durations in seconds from each of (N, 6) joints to each of (M, 6) `to` (default: joints)."""
+    joints = np.atleast_2d(np.asarray(joints, dtype=np.float64))
+    to = joints if to is None else np.atleast_2d(np.asarray(to, dtype=np.float64))
+    speed, accel = np.asarray(speed, dtype=np.float64), np.asarray(accel, dtype=np.float64)
+    ramp = speed * speed / accel            # distance spent accelerating + braking
+    times = np.empty((len(joints), len(to)))
+    for start in range(0, len(joints), _ROW_BLOCK):
+        d = np.abs(joints[start:start + _ROW_BLOCK, None, :] - to[None, :, :])
+        axis = np.where(d >= ramp, d / speed + speed / accel, 2.0 * np.sqrt(d / accel))
+        times[start:start + _ROW_BLOCK] = axis.max(axis=-1)
+    return times
+
+
+def path_time(times: np.ndarray, order: np.ndarray) -> float:
+    """Total of times[a, b] along consecutive visits in `order`."""
+    order = np.asarray(order)
+    return float(times[order[:-1], order[1:]].sum())
+
+
+def optimize_order(times: np.ndarray, fix_start: bool = False, fix_end: bool = False,
+                   start_times: np.ndarray | None = None,
+                   time_budget_s: float = TIME_BUDGET_S) -> np.ndarray:
+    """Visit order (indices into times) with a short total travel time.
+
+    fix_start / fix_end keep pose 0 first / pose N-1 last. With an open
+    start, start_times (N,) are the durations from where the arm is now
+    to each pose; without them the path may begin anywhere. Never returns
+    an order slower than the given one.
+    """
+    n = len(times)
+    if n < 3:
+        return np.arange(n)
+    D, first, last = _with_ends(np.asarray(times, dtype=np.float64), fix_start, fix_end, start_times)
+    inner = np.array([i for i in range(n) if i not in (first, last)])
+
+    path = np.concatenate(([first], _nearest_neighbour(D, first, inner), [last]))
+    deadline = time.perf_counter() + time_budget_s
+    improved = True
+    while improved and time.perf_counter() < deadline:
+        path, improved = _two_opt(D, path, deadline)
+        path, moved = _or_opt(D, path, deadline)
+        improved |= moved
+
+    given = np.concatenate(([first], inner, [last]))
+    if path_time(D, given) <= path_time(D, path) + _EPS:
+        path = given
+    return path[(path < n)]
+
+
+def _with_ends(times: np.ndarray, fix_start: bool, fix_end: bool,
+               start_times: np.ndarray | None) -> tuple[np.ndarray, int, int]:
+    """times plus sentinel start / end nodes; returns (matrix, first, last)."""
+    n = len(times)
+    D = np.zeros((n + 2, n + 2))
+    D[:n, :n] = times
+    first, last = (0 if fix_start else n), (n - 1 if fix_end else n + 1)
+    if not fix_start and start_times is not None:
+        D[n, :n] = D[:n, n] = start_times      # kept symmetric for 2-opt
+    # The sentinels only ever meet a real pose at their own end of the path.
+    D[n, n + 1] = D[n + 1, n] = np.inf
+    return D, first, last
+
+
+def _nearest_neighbour(D: np.ndarray, first: int, inner: np.ndarray) -> np.ndarray:
+    left = list(inner)
+    order, current = [], first
+    while left:
+        k = int(np.argmin(D[current, left]))
+        current = left.pop(k)
+        order.append(current)
+    return np.array(order, dtype=np.int64)
+
+
+def _two_opt(D: np.ndarray, path: np.ndarray, deadline: float) -> tuple[np.ndarray, bool]:
+    """One sweep of first-improvement 2-opt; ends stay put."""
+    m, improved = len(path), False
+    for i in range(m - 3):
+        if time.perf_counter() > deadline:
+            break
+        a, b = path[i], path[i + 1]
+        j = np.arange(i + 2, m - 1)
+        c, d = path[j], path[j + 1]
+        delta = D[a, c] + D[b, d] - D[a, b] - D[c, d]
+        best = int(np.argmin(delta))
+        if delta[best] < -_EPS:
+            end = j[best]
+            path[i + 1:end + 1] = path[i + 1:end + 1][::-1].copy()
+            improved = True
+    return path, improved
+
+
+def _or_opt(D: np.ndarray, path: np.ndarray, deadline: float) -> tuple[np.ndarray, bool]:
+    """One sweep moving runs of 1..MAX_SEGMENT poses to their cheapest other place."""
+    improved = False
+    for length in range(1, MAX_SEGMENT + 1):
+        i = 1
+        while i + length < len(path):          # the run is path[i:i+length], never an end
+            if time.perf_counter() > deadline:
+                return path, improved
+            prev, nxt = path[i - 1], path[i + length]
+            s0, s1 = path[i], path[i + length - 1]
+            gain = D[prev, s0] + D[s1, nxt] - D[prev, nxt]
+
+            rest = np.concatenate((path[:i], path[i + length:]))
+            a, b = rest[:-1], rest[1:]
+            forward = D[a, s0] + D[s1, b] - D[a, b]
+            backward = D[a, s1] + D[s0, b] - D[a, b]
+            cost = np.minimum(forward, backward)
+            cost[i - 1] = np.inf                  # where it came from
+            k = int(np.argmin(cost))
+            if cost[k] - gain < -_EPS:
+                run = path[i:i + length]
+                if backward[k] < forward[k]:
+                    run = run[::-1]
+                path = np.concatenate((rest[:k + 1], run, rest[k + 1:]))
+                improved = True
+            else:
+                i += 1
+    return path, improved
+
+
+def order_steps(steps: list, kin=None, start_joints: list[float] | None = None,
+                fix_start: bool = False, fix_end: bool = False) -> tuple[list, float, float] | None:
+    """Program steps (see program_runner.ProgramStep) reordered by optimize_order.
+
+    Steps need joints to be costed: joint steps and solved cartesian ones
+    carry them, the rest are solved with `kin` (config -1 nearest to
+    start_joints). Returns (steps, estimated seconds before, after), or
+    None if some step cannot be placed in joint space.
+    """
+    joints = [step.joints for step in steps]
+    unresolved = [i for i, q in enumerate(joints) if q is None]
+    if unresolved:
+        if kin is None:
+            return None
+        targets = np.array([steps[i].target for i in unresolved], dtype=np.float64)
+        configs = np.array([steps[i].config for i in unresolved], dtype=np.int64)
+        solved, ok = kin.ik(targets, np.maximum(configs, 0))
+        if np.any(configs < 0):
+            nearest, near_ok = kin.ik(targets, -1, reference=start_joints)
+            solved = np.where((configs < 0)[:, None], nearest, solved)
+            ok = np.where(configs < 0, near_ok, ok)
+        if not ok.all():
+            return None
+        for i, q in zip(unresolved, solved):
+            joints[i] = q
+    joints = np.asarray(joints, dtype=np.float64)
+
+    times = travel_times(joints)
+    start_times = None
+    if not fix_start and start_joints is not None:
+        start_times = travel_times(np.asarray(start_joints, dtype=np.float64), joints)[0]
+    order = optimize_order(times, fix_start, fix_end, start_times)
+
+    def _total(sequence: np.ndarray) -> float:
+        lead = start_times[sequence[0]] if start_times is not None else 0.0
+        return float(lead) + path_time(times, sequence)
+
+    return [steps[i] for i in order], _total(np.arange(len(steps))), _total(order)
@@ -0,0 +1,60 @@
+import json
+
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtNetwork import QHostAddress
+from PySide6.QtWebSockets import QWebSocket, QWebSocketServer
+
+from services.sim_robot import SimRPC
+
+
+class SimJointFeed(QObject):
+    """WebSocket joint stream for robot_viewer/viewer.html, fed by a SimRPC.
+
+    Sends the same frames as the cell's joint server,
+    {"joints": {"j1": deg, ..., "j6": deg}}, to every connected client.
+    """
+
+    RATE_HZ = 30
+
+    def __init__(self, sim: SimRPC, port: int = 9999, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._sim = sim
+        self._clients: list[QWebSocket] = []
+        self._server = QWebSocketServer("robot-sim", QWebSocketServer.NonSecureMode, self)
+        if not self._server.listen(QHostAddress.LocalHost, port):
+            raise OSError(f"Sim joint feed cannot listen on port {port}: {self._server.errorString()}")
+        self._server.newConnection.connect(self._on_connection)
+        self._timer = QTimer(self)
+        self._timer.setInterval(1000 // self.RATE_HZ)
+        self._timer.timeout.connect(self._broadcast)
+        self._timer.start()
+
+    @property
+    def host(self) -> str:
+        return f"127.0.0.1:{self._server.serverPort()}"
+
+    def close(self) -> None:
+        self._timer.stop()
+        clients, self._clients = self._clients, []
+        for client in clients:
+            client.disconnected.disconnect()
+            client.close()
+        self._server.close()
+
+    def _on_connection(self) -> None:
+        client = self._server.nextPendingConnection()
+        client.disconnected.connect(lambda: self._on_disconnected(client))
+        self._clients.append(client)
+
+    def _on_disconnected(self, client: QWebSocket) -> None:
+        if client in self._clients:
+            self._clients.remove(client)
+        client.deleteLater()
+
+    def _broadcast(self) -> None:
+        if not self._clients:
+            return
+        joints = self._sim.robot_state_pkg.jt_cur_pos
+        message = json.dumps({"joints": {f"j{i + 1}": round(float(joints[i]), 3) for i in range(6)}})
+        for client in self._clients:
+            client.sendTextMessage(message)
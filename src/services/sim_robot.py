@@ -0,0 +1,275 @@
+"""Simulated Fairino controller for running and benchmarking without a cell.
+
+SimRPC implements the part of fairino.Robot.RPC this app calls, with the
+same call signatures and (error, value) return shapes. Every call costs a
+configurable round-trip latency; motion is integrated on a background
+thread at the controller's 8 ms state rate with a trapezoidal joint-space
+profile, so MoveJ / MoveCart take as long as they would on the arm and
+blended commands (blendT > 0) cut the corner into the next queued one.
+Kinematics come from utils.kinematics for the chosen model.
+
+Start the app with --sim to use it (see main.py).
+"""
+import copy
+import random
+import threading
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from utils.kinematics import Kinematics, matrix_to_pose, pose_to_matrix
+
+# Error codes returned by the simulator (non-zero like the SDK's).
+ERR_NOT_ENABLED = 8
+ERR_IK_FAILED = 112
+
+_TICK_S = 0.008
+_HOME = [0.0, -90.0, 90.0, -90.0, -90.0, 0.0]
+
+
+@dataclass
+class SimTiming:
+    latency_ms: float = 2.0       # mean RPC round trip
+    jitter_ms: float = 0.5        # its standard deviation
+    joint_speed_dps: float = 180.0
+    joint_accel_dps2: float = 720.0
+
+
+class SimStatePkg:
+    """The robot_state_pkg fields the app reads; a new one every 8 ms."""
+
+    def __init__(self, joints: list[float], tcp: list[float]) -> None:
+        self.frame_cnt = 0
+        self.jt_cur_pos = list(joints)
+        self.tl_cur_pos = list(tcp)
+        self.EmergencyStop = 0
+        self.collisionState = 0
+        self.rbtEnableState = 1
+        self.motion_done = 1
+        self.mc_queue_len = 0
+
+
+class _Segment:
+    """Trapezoidal joint move from start to target at the given peak speed."""
+
+    def __init__(self, start: np.ndarray, target: np.ndarray, speed: float, accel: float,
+                 blend_s: float) -> None:
+        self.start, self.target = start, target
+        self.distance = float(np.abs(target - start).max())
+        self.max_speed = speed
+        self.speed, self.accel = speed, accel
+        self.blend_s = blend_s
+        ramp = speed / accel
+        if self.distance <= speed * ramp:       # never reaches peak speed
+            self.ramp = (self.distance / accel) ** 0.5
+            self.speed = accel * self.ramp
+            self.duration = 2 * self.ramp
+        else:
+            self.ramp = ramp
+            self.duration = self.distance / speed + ramp
+        self.elapsed = 0.0
+
+    def position(self) -> np.ndarray:
+        if self.distance == 0.0:
+            return self.target
+        t, T, r, a, v = min(self.elapsed, self.duration), self.duration, self.ramp, self.accel, self.speed
+        if t < r:
+            s = 0.5 * a * t * t
+        elif t < T - r:
+            s = 0.5 * a * r * r + v * (t - r)
+        else:
+            s = self.distance - 0.5 * a * (T - t) ** 2
+        return self.start + (self.target - self.start) * (s / self.distance)
+
+    @property
+    def remaining(self) -> float:
+        return self.duration - self.elapsed
+
+
+class SimRPC:
+    """Stand-in for fairino.Robot.RPC (see module docstring)."""
+
+    def __init__(self, model: str = "FR3", timing: SimTiming | None = None,
+                 tool: list[float] | None = None, ip: str = "127.0.0.1") -> None:
+        self.timing = timing or SimTiming()
+        self.ip = ip
+        self._kin = Kinematics(model, np.asarray(tool if tool is not None else [0, 0, 0, 0, 0, 0], dtype=float))
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        joints = np.array(_HOME)
+        self.robot_state_pkg = SimStatePkg(_HOME, self._kin.fk(joints).tolist())
+        self._joints = joints
+        self._queue: list[_Segment] = []
+        self._active: _Segment | None = None
+        self._speed_pct = 100.0
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="sim-robot", daemon=True)
+        self._thread.start()
+
+    # ── Motion ───────────────────────────────────────────────────────────────
+
+    def MoveJ(self, joint_pos, tool, user, desc_pos=None, vel=20.0, acc=0.0, ovl=100.0,
+              exaxis_pos=None, blendT=-1.0, offset_flag=0, offset_pos=None):
+        self._rpc()
+        target = np.asarray(joint_pos[:6], dtype=float)
+        if offset_flag and offset_pos is not None and any(offset_pos):
+            target = self._apply_offset(target, offset_flag, offset_pos)
+            if target is None:
+                return ERR_IK_FAILED
+        return self._enqueue(target, vel, blendT)
+
+    def MoveCart(self, desc_pos, tool, user, vel=20.0, acc=0.0, ovl=100.0, blendT=-1.0, config=-1):
+        self._rpc()
+        with self._lock:
+            reference = self._planned_end()
+        target, ok = self._kin.ik(np.asarray(desc_pos[:6], dtype=float), config, reference=reference)
+        if not ok:
+            return ERR_IK_FAILED
+        return self._enqueue(target, vel, blendT)
+
+    def StopMotion(self):
+        self._rpc()
+        with self._lock:
+            self._queue.clear()
+            self._active = None
+            self._idle.notify_all()
+        return 0
+
+    def _enqueue(self, target: np.ndarray, vel: float, blendT: float) -> int:
+        with self._lock:
+            if not self.robot_state_pkg.rbtEnableState:
+                return ERR_NOT_ENABLED
+            speed = self.timing.joint_speed_dps * max(vel, 1.0) / 100.0 * self._speed_pct / 100.0
+            segment = _Segment(self._planned_end(), target, speed, self.timing.joint_accel_dps2,
+                               max(blendT, 0.0) / 1000.0)
+            self._queue.append(segment)
+            self._idle.notify_all()
+            if blendT < 0:
+                # blendT = -1 blocks until the arm stops, as on the controller.
+                self._idle.wait_for(lambda: self._active is None and not self._queue)
+        return 0
+
+    def _planned_end(self) -> np.ndarray:
+        if self._queue:
+            return self._queue[-1].target
+        if self._active is not None:
+            return self._active.target
+        return self._joints.copy()
+
+    def _apply_offset(self, joints: np.ndarray, flag: int, offset: list[float]) -> np.ndarray | None:
+        """Joints reaching fk(joints) shifted by `offset` (1 = base frame, 2 = tool frame)."""
+        T = pose_to_matrix(self._kin.fk(joints))
+        O = pose_to_matrix(np.asarray(offset[:6], dtype=float))
+        if flag == 2:
+            T = T @ O
+        else:
+            T = T.copy()
+            T[:3, :3] = O[:3, :3] @ T[:3, :3]
+            T[:3, 3] += O[:3, 3]
+        target, ok = self._kin.ik(matrix_to_pose(T), -1, reference=joints)
+        return target if ok else None
+
+    def _run(self) -> None:
+        next_tick = time.monotonic()
+        while self._running:
+            with self._lock:
+                self._step(_TICK_S)
+            next_tick += _TICK_S
+            time.sleep(max(0.0, next_tick - time.monotonic()))
+
+    def _step(self, dt: float) -> None:
+        if self._active is None and self._queue:
+            self._active = self._queue.pop(0)
+        active = self._active
+        if active is not None:
+            active.elapsed += dt
+            self._joints = active.position()
+            blend_into_next = self._queue and active.remaining <= active.blend_s
+            if active.remaining <= 0 or blend_into_next:
+                self._active = None
+                if blend_into_next:
+                    # Corner cut: the next move starts from where the arm is now.
+                    nxt = self._queue[0]
+                    self._queue[0] = _Segment(self._joints.copy(), nxt.target, nxt.max_speed,
+                                              nxt.accel, nxt.blend_s)
+                elif not self._queue:
+                    self._idle.notify_all()
+        # A new package per frame, swapped in whole like the SDK's, so a
+        # reader holding one reference sees a consistent frame.
+        pkg = copy.copy(self.robot_state_pkg)
+        pkg.frame_cnt += 1
+        pkg.jt_cur_pos = self._joints.tolist()
+        pkg.tl_cur_pos = self._kin.fk(self._joints).tolist()
+        pkg.mc_queue_len = len(self._queue)
+        pkg.motion_done = int(self._active is None and not self._queue)
+        self.robot_state_pkg = pkg
+
+    # ── Queries ──────────────────────────────────────────────────────────────
+
+    def GetActualTCPPose(self, flag=1):
+        self._rpc()
+        return 0, list(self.robot_state_pkg.tl_cur_pos)
+
+    def GetActualJointPosDegree(self, flag=1):
+        self._rpc()
+        return 0, list(self.robot_state_pkg.jt_cur_pos)
+
+    def GetRobotCurJointsConfig(self):
+        self._rpc()
+        with self._lock:
+            joints = self._joints.copy()
+        return 0, int(self._kin.config_of(joints)[0])
+
+    def GetInverseKin(self, type, desc_pos, config=-1):
+        self._rpc()
+        with self._lock:
+            reference = self._joints.copy()
+        joints, ok = self._kin.ik(np.asarray(desc_pos[:6], dtype=float), config, reference=reference)
+        return (0, joints.tolist()) if ok else (ERR_IK_FAILED, [0.0] * 6)
+
+    def GetControllerIP(self):
+        self._rpc()
+        return 0, self.ip
+
+    def GetSDKVersion(self):
+        self._rpc()
+        return 0, ["SIM", "SIM"]
+
+    # ── State ────────────────────────────────────────────────────────────────
+
+    def ResetAllError(self):
+        self._rpc()
+        with self._lock:
+            self.robot_state_pkg.collisionState = 0
+            self.robot_state_pkg.EmergencyStop = 0
+        return 0
+
+    def RobotEnable(self, state):
+        self._rpc()
+        with self._lock:
+            self.robot_state_pkg.rbtEnableState = int(bool(state))
+            if not state:
+                self._queue.clear()
+                self._active = None
+                self._idle.notify_all()
+        return 0
+
+    def SetSpeed(self, vel):
+        self._rpc()
+        self._speed_pct = float(min(max(vel, 1), 100))
+        return 0
+
+    def CloseRPC(self):
+        # The simulator outlives reconnects; shutdown() stops it.
+        return 0
+
+    def shutdown(self) -> None:
+        self._running = False
+        self._thread.join(timeout=1.0)
+
+    def _rpc(self) -> None:
+        """Pay one simulated network round trip."""
+        delay = random.gauss(self.timing.latency_ms, self.timing.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000.0)
@@ -0,0 +1,133 @@
+"""Single poll of robot_state_pkg for the whole UI.
+
+StateHub reads the state package once per cycle, compares it with the
+previous snapshot and emits only the fields that changed, so an idle arm
+costs no signal traffic and QML does not re-render identical values. The
+poll rate follows what the arm is doing:
+
+    FAST_MS     jogging, moving, or within ACTIVE_HOLD_S of either
+    IDLE_MS     connected and still
+    HIDDEN_MS   main window minimized / hidden
+
+Positions are compared at POSITION_DECIMALS, below which the UI shows
+nothing different.
+"""
+import time
+from typing import Callable
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+POSITION_DECIMALS = 3
+
+_FLAGS = (("estop", "EmergencyStop"), ("collision", "collisionState"), ("enable", "rbtEnableState"))
+
+
+class StateHub(QObject):
+    """Adaptive-rate, change-only view of robot_state_pkg on the GUI thread.
+
+    `state_pkg` returns the live package, or None while disconnected.
+    """
+
+    changed = Signal(dict)   # subset of tcp[6], joints[6], estop, collision, enable
+
+    FAST_MS = 50
+    IDLE_MS = 250
+    HIDDEN_MS = 1000
+    ACTIVE_HOLD_S = 1.0
+
+    def __init__(self, state_pkg: Callable[[], object], parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._state_pkg = state_pkg
+        self._last: dict = {}
+        self._active_until = 0.0
+        self._visible = True
+        self._paused = False
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.IDLE_MS)
+        self._timer.timeout.connect(self._poll)
+
+    @property
+    def interval_ms(self) -> int:
+        return self._timer.interval()
+
+    @property
+    def snapshot(self) -> dict:
+        """Last values read (empty before the first poll)."""
+        return {key: list(value) if isinstance(value, tuple) else value
+                for key, value in self._last.items()}
+
+    def start(self) -> None:
+        self._timer.start()
+
+    def stop(self) -> None:
+        self._timer.stop()
+
+    def kick(self) -> None:
+        """A motion command went out: poll fast now rather than on the next idle tick."""
+        self._active_until = time.monotonic() + self.ACTIVE_HOLD_S
+        if self._visible and self._timer.interval() != self.FAST_MS:
+            self._timer.setInterval(self.FAST_MS)
+            self._poll()
+
+    def set_visible(self, visible: bool) -> None:
+        if visible == self._visible:
+            return
+        self._visible = visible
+        self._retime()
+        if visible:
+            self._poll()
+
+    def set_paused(self, paused: bool) -> None:
+        """Stop emitting (e.g. during a replay); on resume every field is re-sent."""
+        self._paused = paused
+        if not paused:
+            self.resync()
+
+    def resync(self) -> None:
+        """Forget the last snapshot so the next poll emits every field."""
+        self._last = {}
+        if self._timer.isActive():
+            self._poll()
+
+    def _poll(self) -> None:
+        if self._paused:
+            return
+        read = self._read()
+        if read is None:
+            return
+        snapshot, done = read
+        delta = {key: value for key, value in snapshot.items() if self._last.get(key) != value}
+        if not done or ("joints" in delta and self._last):
+            self._active_until = time.monotonic() + self.ACTIVE_HOLD_S
+        self._last = snapshot
+        if delta:
+            self.changed.emit({key: list(value) if isinstance(value, tuple) else value
+                               for key, value in delta.items()})
+        self._retime()
+
+    def _read(self) -> tuple[dict, bool] | None:
+        """(snapshot, motion done) from the package, or None if there is none yet."""
+        pkg = self._state_pkg()
+        if pkg is None:
+            return None
+        try:
+            snapshot = {
+                "tcp":    tuple(round(float(pkg.tl_cur_pos[i]), POSITION_DECIMALS) for i in range(6)),
+                "joints": tuple(round(float(pkg.jt_cur_pos[i]), POSITION_DECIMALS) for i in range(6)),
+            }
+            for key, attr in _FLAGS:
+                snapshot[key] = int(getattr(pkg, attr))
+        except (AttributeError, IndexError, TypeError, ValueError):
+            return None     # package not populated yet
+        # Not on every firmware; when present it catches moves too slow to show in joints.
+        return snapshot, bool(getattr(pkg, "motion_done", 1))
+
+    def _retime(self) -> None:
+        if not self._visible:
+            interval = self.HIDDEN_MS
+        elif time.monotonic() < self._active_until:
+            interval = self.FAST_MS
+        else:
+            interval = self.IDLE_MS
+        if interval != self._timer.interval():
+            self._timer.setInterval(interval)
@@ -0,0 +1,289 @@
+"""Robot state telemetry: memory-mapped ring buffer, recorder and replay.
+
+The recorder thread samples robot_state_pkg at the controller's native
+state rate into a fixed-size ring of records in a memory-mapped file, so the
+last RING_SECONDS survive an application crash. Every SEGMENT_SECONDS while
+recording, and once more on stop, the records not yet written out are
+flushed to a compressed columnar .npz segment (same idea as pose_archive):
+
+    format      int   TELEMETRY_FORMAT
+    t           f8    (N,)     unix time, seconds
+    tcp         f8    (N, 6)   x, y, z, rx, ry, rz
+    joints      f8    (N, 6)   j1..j6, degrees
+    estop       u1    (N,)
+    collision   u1    (N,)
+    enable      u1    (N,)
+
+TelemetryReplay plays a segment back on the GUI thread at 1x or faster.
+"""
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+from PySide6.QtCore import QObject, QTimer, Signal
+
+TELEMETRY_FORMAT = 1
+
+# The Fairino real-time state port publishes every 8 ms.
+SAMPLE_PERIOD_S = 0.008
+RING_SECONDS = 600
+SEGMENT_SECONDS = 60
+
+RECORD_DTYPE = np.dtype([
+    ("t", "f8"),
+    ("tcp", "f8", (6,)),
+    ("joints", "f8", (6,)),
+    ("estop", "u1"),
+    ("collision", "u1"),
+    ("enable", "u1"),
+], align=True)
+
+_HEADER_DTYPE = np.dtype([
+    ("magic", "S8"),
+    ("capacity", "i8"),
+    ("count", "i8"),      # records ever written; slot = count % capacity
+    ("flushed", "i8"),    # records already written out to segments
+])
+_HEADER_BYTES = 64
+_MAGIC = b"RBTTLM1"
+
+_COLUMNS = RECORD_DTYPE.names
+
+
+class TelemetryRing:
+    """Fixed-capacity ring of RECORD_DTYPE records in a memory-mapped file.
+
+    A file left by a previous run with the same capacity is reopened as is.
+    Single writer; the count is bumped after the record is written, so a
+    reader never sees a half-written record.
+    """
+
+    def __init__(self, path: str | Path, capacity: int) -> None:
+        self.path = Path(path)
+        self.capacity = capacity
+        fresh = not self._matches(capacity)
+        if fresh:
+            # np.memmap cannot grow a file in "r+"; create it full length.
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "wb") as f:
+                f.truncate(_HEADER_BYTES + capacity * RECORD_DTYPE.itemsize)
+        self._header = np.memmap(self.path, dtype=_HEADER_DTYPE, mode="r+", shape=(1,))
+        self._records = np.memmap(self.path, dtype=RECORD_DTYPE, mode="r+",
+                                  offset=_HEADER_BYTES, shape=(capacity,))
+        if fresh:
+            self._header[0] = (_MAGIC, capacity, 0, 0)
+
+    def _matches(self, capacity: int) -> bool:
+        """True if path already holds a ring of this capacity."""
+        if not self.path.exists():
+            return False
+        if self.path.stat().st_size != _HEADER_BYTES + capacity * RECORD_DTYPE.itemsize:
+            return False
+        header = np.fromfile(self.path, dtype=_HEADER_DTYPE, count=1)
+        return header["magic"][0] == _MAGIC and header["capacity"][0] == capacity
+
+    @property
+    def count(self) -> int:
+        return int(self._header["count"][0])
+
+    def append(self, record: tuple) -> None:
+        count = self.count
+        self._records[count % self.capacity] = record
+        self._header["count"] = count + 1
+
+    def read(self, start: int, stop: int | None = None) -> np.ndarray:
+        """Records [start, stop) in write order (clipped to what is still held)."""
+        stop = self.count if stop is None else stop
+        start = max(start, stop - self.capacity, 0)
+        if start >= stop:
+            return np.empty(0, dtype=RECORD_DTYPE)
+        slots = np.arange(start, stop) % self.capacity
+        return np.asarray(self._records[slots])
+
+    def mark_flushed(self) -> None:
+        """Treat everything held so far as flushed (start of a new session)."""
+        self._header["flushed"] = self.count
+
+    def flush_segment(self, path: str | Path) -> int:
+        """Write the records not yet flushed to `path` (.npz); returns how many."""
+        stop = self.count
+        records = self.read(int(self._header["flushed"][0]), stop)
+        if len(records):
+            np.savez_compressed(path, format=np.array(TELEMETRY_FORMAT),
+                                **{name: records[name] for name in _COLUMNS})
+        self._header["flushed"] = stop
+        return len(records)
+
+    def close(self) -> None:
+        self._records.flush()
+        self._header.flush()
+        del self._records, self._header
+
+
+def load_segment(path: str | Path) -> np.ndarray:
+    """A flushed segment back as a RECORD_DTYPE array."""
+    with np.load(path) as archive:
+        if int(archive["format"]) != TELEMETRY_FORMAT:
+            raise ValueError(f"Unsupported telemetry format in {path}")
+        t = archive["t"]
+        records = np.empty(len(t), dtype=RECORD_DTYPE)
+        for name in _COLUMNS:
+            values = archive[name]
+            if len(values) != len(t):
+                raise ValueError(f"Column '{name}' has {len(values)} rows, expected {len(t)}")
+            records[name] = values
+    return records
+
+
+class TelemetryRecorder:
+    """Samples robot_state_pkg into a TelemetryRing on a background thread.
+
+    `state_pkg` returns the live package (or None while disconnected). When
+    the package carries a frame counter, a sample is only stored when it
+    changed, so the ring holds each controller frame once.
+    """
+
+    def __init__(self, ring: TelemetryRing, state_pkg: Callable[[], object],
+                 segment_dir: str | Path, period_s: float = SAMPLE_PERIOD_S) -> None:
+        self.ring = ring
+        self._state_pkg = state_pkg
+        self.segment_dir = Path(segment_dir)
+        self.period_s = period_s
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._flusher: threading.Thread | None = None
+        self.segments: list[Path] = []
+
+    @property
+    def recording(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.recording:
+            return
+        # Only this session goes into segments, not what the ring held before.
+        self.ring.mark_flushed()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="telemetry", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Path | None:
+        """Stop sampling and flush the last segment; returns its path, if any."""
+        if self._thread is None:
+            return None
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        if self._flusher is not None:
+            self._flusher.join()
+        return self._flush()
+
+    def _run(self) -> None:
+        last_frame = None
+        next_sample = next_flush = time.monotonic()
+        next_flush += SEGMENT_SECONDS
+        while not self._stop.is_set():
+            pkg = self._state_pkg()
+            if pkg is not None:
+                frame = getattr(pkg, "frame_cnt", None)
+                if frame is None or frame != last_frame:
+                    last_frame = frame
+                    try:
+                        self.ring.append(self._sample(pkg))
+                    except (AttributeError, IndexError, TypeError, ValueError):
+                        pass    # package not populated yet
+            now = time.monotonic()
+            if now >= next_flush and not (self._flusher and self._flusher.is_alive()):
+                # Compressing takes a while; the ring keeps taking samples meanwhile.
+                self._flusher = threading.Thread(target=self._flush, name="telemetry-flush", daemon=True)
+                self._flusher.start()
+                next_flush = now + SEGMENT_SECONDS
+            next_sample += self.period_s
+            self._stop.wait(max(0.0, next_sample - time.monotonic()))
+            if time.monotonic() - next_sample > self.period_s:
+                next_sample = time.monotonic()   # fell behind; don't burst
+
+    @staticmethod
+    def _sample(pkg) -> tuple:
+        return (
+            time.time(),
+            [float(pkg.tl_cur_pos[i]) for i in range(6)],
+            [float(pkg.jt_cur_pos[i]) for i in range(6)],
+            int(pkg.EmergencyStop),
+            int(pkg.collisionState),
+            int(pkg.rbtEnableState),
+        )
+
+    def _flush(self) -> Path | None:
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        path = self.segment_dir / f"telemetry_{datetime.now():%Y%m%d_%H%M%S_%f}.npz"
+        written = self.ring.flush_segment(path)
+        if not written:
+            return None
+        print(f"[Telemetry] {written} samples written to {path}")
+        self.segments.append(path)
+        return path
+
+
+class TelemetryReplay(QObject):
+    """Plays recorded samples back in real time × speed on the GUI thread."""
+
+    frame    = Signal(dict)         # tcp[6], joints[6], estop, collision, enable, t
+    progress = Signal(float, float) # seconds played, total seconds (recording time)
+    finished = Signal()
+
+    TICK_MS = 16
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._records = np.empty(0, dtype=RECORD_DTYPE)
+        self._offsets = np.empty(0)
+        self._speed = 1.0
+        self._started = 0.0
+        self._index = -1
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.TICK_MS)
+        self._timer.timeout.connect(self._tick)
+
+    @property
+    def running(self) -> bool:
+        return self._timer.isActive()
+
+    def start(self, records: np.ndarray, speed: float = 1.0) -> None:
+        if not len(records):
+            self.finished.emit()
+            return
+        self._records = records
+        self._offsets = records["t"] - records["t"][0]
+        self._speed = max(speed, 0.01)
+        self._started = time.monotonic()
+        self._index = -1
+        self._timer.start()
+        self._tick()
+
+    def stop(self) -> None:
+        if self._timer.isActive():
+            self._timer.stop()
+            self.finished.emit()
+
+    def _tick(self) -> None:
+        played = (time.monotonic() - self._started) * self._speed
+        index = int(np.searchsorted(self._offsets, played, side="right")) - 1
+        if index != self._index:
+            self._index = index
+            record = self._records[index]
+            self.frame.emit({
+                "t": float(record["t"]),
+                "tcp": record["tcp"].tolist(),
+                "joints": record["joints"].tolist(),
+                "estop": int(record["estop"]),
+                "collision": int(record["collision"]),
+                "enable": int(record["enable"]),
+            })
+        total = float(self._offsets[-1])
+        self.progress.emit(min(played, total), total)
+        if index >= len(self._records) - 1:
+            self.stop()
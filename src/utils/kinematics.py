@@ -0,0 +1,307 @@
+"""Closed-form forward / inverse kinematics for Fairino FR arms.
+
+The FR series shares the UR-style geometry (three parallel middle axes and
+an offset wrist), so every reachable flange pose has up to eight joint
+solutions in closed form. Everything here is vectorised over a leading
+batch axis: one call solves a single target or a whole pose library.
+
+Units follow the SDK: millimetres and degrees, poses as
+[x, y, z, rx, ry, rz] with R = Rz(rz) · Ry(ry) · Rx(rx).
+
+The eight solutions are indexed by the controller's `config` code
+(GetRobotCurJointsConfig / GetInverseKin's `config`), see CONFIG_BRANCHES.
+The DH tables are the nominal values from the Fairino manuals; use
+validate() against recorded controller results before trusting a model,
+which is what RobotService does before it stops calling GetInverseKin.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+_EPS = 1e-9
+
+
+@dataclass(frozen=True)
+class ArmModel:
+    name: str
+    d1: float
+    a2: float
+    a3: float
+    d4: float
+    d5: float
+    d6: float
+    # Joint limits in degrees, (6, 2) as (lower, upper)
+    limits: tuple[tuple[float, float], ...]
+
+
+_FR_LIMITS = ((-175, 175), (-265, 85), (-160, 160), (-265, 85), (-175, 175), (-175, 175))
+
+MODELS = {
+    "FR3":  ArmModel("FR3",  140.0, -280.0, -240.0, 102.0, 102.0, 100.0, _FR_LIMITS),
+    "FR5":  ArmModel("FR5",  152.0, -425.0, -395.0, 102.0, 102.0, 100.0, _FR_LIMITS),
+    "FR10": ArmModel("FR10", 180.0, -700.0, -586.0, 159.0, 114.0, 106.0, _FR_LIMITS),
+    "FR16": ArmModel("FR16", 180.0, -520.0, -400.0, 159.0, 114.0, 106.0, _FR_LIMITS),
+}
+
+# config code → (shoulder, elbow, wrist) branch signs used by ik_all().
+# Bit 2 = shoulder (left/right), bit 1 = elbow (up/down), bit 0 = wrist (flip).
+CONFIG_BRANCHES = {code: ((code >> 2) & 1, (code >> 1) & 1, code & 1) for code in range(8)}
+
+
+# ── Pose <-> matrix ──────────────────────────────────────────────────────────
+
+def pose_to_matrix(poses: np.ndarray) -> np.ndarray:
+    """(..., 6) [x, y, z, rx, ry, rz] → (..., 4, 4) homogeneous transforms."""
+    poses = np.asarray(poses, dtype=np.float64)
+    rx, ry, rz = np.deg2rad(poses[..., 3]), np.deg2rad(poses[..., 4]), np.deg2rad(poses[..., 5])
+    cx, sx, cy, sy, cz, sz = np.cos(rx), np.sin(rx), np.cos(ry), np.sin(ry), np.cos(rz), np.sin(rz)
+    T = np.zeros(poses.shape[:-1] + (4, 4))
+    T[..., 0, 0] = cz * cy
+    T[..., 0, 1] = cz * sy * sx - sz * cx
+    T[..., 0, 2] = cz * sy * cx + sz * sx
+    T[..., 1, 0] = sz * cy
+    T[..., 1, 1] = sz * sy * sx + cz * cx
+    T[..., 1, 2] = sz * sy * cx - cz * sx
+    T[..., 2, 0] = -sy
+    T[..., 2, 1] = cy * sx
+    T[..., 2, 2] = cy * cx
+    T[..., :3, 3] = poses[..., :3]
+    T[..., 3, 3] = 1.0
+    return T
+
+
+def matrix_to_pose(T: np.ndarray) -> np.ndarray:
+    """(..., 4, 4) → (..., 6) [x, y, z, rx, ry, rz]."""
+    T = np.asarray(T, dtype=np.float64)
+    ry = np.arctan2(-T[..., 2, 0], np.hypot(T[..., 0, 0], T[..., 1, 0]))
+    rz = np.arctan2(T[..., 1, 0], T[..., 0, 0])
+    rx = np.arctan2(T[..., 2, 1], T[..., 2, 2])
+    return np.concatenate([T[..., :3, 3], np.rad2deg(np.stack([rx, ry, rz], axis=-1))], axis=-1)
+
+
+def _dh(theta: np.ndarray, d: float, a: float, alpha: float) -> np.ndarray:
+    """Standard DH link transform Rz(theta)·Tz(d)·Tx(a)·Rx(alpha), batched over theta."""
+    ct, st = np.cos(theta), np.sin(theta)
+    ca, sa = np.cos(alpha), np.sin(alpha)
+    T = np.zeros(np.shape(theta) + (4, 4))
+    T[..., 0, 0] = ct
+    T[..., 0, 1] = -st * ca
+    T[..., 0, 2] = st * sa
+    T[..., 0, 3] = a * ct
+    T[..., 1, 0] = st
+    T[..., 1, 1] = ct * ca
+    T[..., 1, 2] = -ct * sa
+    T[..., 1, 3] = a * st
+    T[..., 2, 1] = sa
+    T[..., 2, 2] = ca
+    T[..., 2, 3] = d
+    T[..., 3, 3] = 1.0
+    return T
+
+
+def _inv(T: np.ndarray) -> np.ndarray:
+    """Inverse of rigid transforms (..., 4, 4)."""
+    R = np.swapaxes(T[..., :3, :3], -1, -2)
+    out = np.zeros_like(T)
+    out[..., :3, :3] = R
+    out[..., :3, 3] = -np.einsum("...ij,...j->...i", R, T[..., :3, 3])
+    out[..., 3, 3] = 1.0
+    return out
+
+
+# ── Kinematics ───────────────────────────────────────────────────────────────
+
+class Kinematics:
+    """FK/IK for one arm model, optionally with a tool (TCP) offset.
+
+    tool is [x, y, z, rx, ry, rz] of the TCP in the flange frame; poses in
+    and out of fk/ik are TCP poses in the base frame.
+    """
+
+    _ALPHA = (np.pi / 2, 0.0, 0.0, np.pi / 2, -np.pi / 2, 0.0)
+
+    def __init__(self, model: ArmModel | str, tool: np.ndarray | None = None) -> None:
+        self.model = MODELS[model] if isinstance(model, str) else model
+        self.set_tool(np.zeros(6) if tool is None else tool)
+        self._limits = np.asarray(self.model.limits, dtype=np.float64)
+
+    def set_tool(self, tool: np.ndarray) -> None:
+        self.tool = np.asarray(tool, dtype=np.float64)
+        self._T_tool = pose_to_matrix(self.tool)
+        self._T_tool_inv = _inv(self._T_tool)
+
+    def calibrate_tool(self, joints: np.ndarray, tcp: np.ndarray) -> None:
+        """Set the tool offset that makes fk(joints) == tcp (one live sample)."""
+        self.set_tool(matrix_to_pose(_inv(self.flange(joints)) @ pose_to_matrix(tcp)))
+
+    def _link_params(self) -> tuple[tuple[float, float, float], ...]:
+        m = self.model
+        return ((m.d1, 0.0, self._ALPHA[0]), (0.0, m.a2, self._ALPHA[1]), (0.0, m.a3, self._ALPHA[2]),
+                (m.d4, 0.0, self._ALPHA[3]), (m.d5, 0.0, self._ALPHA[4]), (m.d6, 0.0, self._ALPHA[5]))
+
+    def flange(self, joints: np.ndarray) -> np.ndarray:
+        """(..., 6) joint angles in degrees → (..., 4, 4) flange transforms."""
+        q = np.deg2rad(np.asarray(joints, dtype=np.float64))
+        T = None
+        for i, (d, a, alpha) in enumerate(self._link_params()):
+            A = _dh(q[..., i], d, a, alpha)
+            T = A if T is None else T @ A
+        return T
+
+    def fk(self, joints: np.ndarray) -> np.ndarray:
+        """(..., 6) joints → (..., 6) TCP poses."""
+        return matrix_to_pose(self.flange(joints) @ self._T_tool)
+
+    def ik_all(self, poses: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Every closed-form solution of (N, 6) TCP poses.
+
+        Returns (joints (N, 8, 6) in degrees, valid (N, 8)); solution k is
+        the one for config code k. Invalid entries are unreachable or
+        outside the joint limits.
+        """
+        q, reachable, in_limits = self.ik_branches(poses)
+        return q, reachable & in_limits
+
+    def ik_branches(self, poses: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """ik_all with its two failure reasons apart: (joints, reachable, in_limits).
+
+        reachable says the branch reaches the pose at all; in_limits that
+        its joints (wrapped by ±360 where that helps) fit the joint limits.
+        """
+        m = self.model
+        T = pose_to_matrix(np.atleast_2d(poses)) @ self._T_tool_inv     # flange targets
+        n = T.shape[0]
+        p = T[:, :3, 3]
+
+        # θ1: wrist centre p05 seen from above; two shoulder branches.
+        p05 = p - m.d6 * T[:, :3, 2]
+        r = np.hypot(p05[:, 0], p05[:, 1])
+        ratio1 = m.d4 / np.maximum(r, _EPS)
+        reach1 = ratio1 <= 1.0 + 1e-12
+        phi = np.arccos(np.clip(ratio1, -1.0, 1.0))
+        psi = np.arctan2(p05[:, 1], p05[:, 0])
+        t1 = psi[:, None] + np.stack([phi, -phi], axis=-1) + np.pi / 2      # (n, 2)
+
+        # θ5: two wrist branches per shoulder.
+        s1, c1 = np.sin(t1), np.cos(t1)
+        ratio5 = (p[:, None, 0] * s1 - p[:, None, 1] * c1 - m.d4) / m.d6
+        reach5 = np.abs(ratio5) <= 1.0 + 1e-9
+        a5 = np.arccos(np.clip(ratio5, -1.0, 1.0))
+        t5 = np.stack([a5, -a5], axis=-1)                                   # (n, 2, 2)
+
+        # θ6 from the inverse transform's x/y axes (free when s5 = 0).
+        R = T[:, :3, :3]
+        X, Y = R[:, 0, :], R[:, 1, :]        # rows of R = columns of R^T
+        s1e, c1e = s1[..., None], c1[..., None]
+        s5 = np.sin(t5)
+        safe5 = np.where(np.abs(s5) < _EPS, 1.0, s5)
+        t6 = np.arctan2((-X[:, None, None, 1] * s1e + Y[:, None, None, 1] * c1e) / safe5,
+                        (X[:, None, None, 0] * s1e - Y[:, None, None, 0] * c1e) / safe5)
+        t6 = np.where(np.abs(s5) < _EPS, 0.0, t6)
+
+        # Planar 3R problem for θ2, θ3, θ4.
+        t1b = np.broadcast_to(t1[..., None], t5.shape)
+        T01 = _dh(t1b, m.d1, 0.0, self._ALPHA[0])
+        T45 = _dh(t5, m.d5, 0.0, self._ALPHA[4])
+        T56 = _dh(t6, m.d6, 0.0, self._ALPHA[5])
+        T14 = _inv(T01) @ T[:, None, None] @ _inv(T45 @ T56)
+        p13 = T14[..., :3, 3] - m.d4 * T14[..., :3, 1]
+        norm13 = np.linalg.norm(p13, axis=-1)
+        ratio3 = (norm13**2 - m.a2**2 - m.a3**2) / (2 * m.a2 * m.a3)
+        reach3 = np.abs(ratio3) <= 1.0 + 1e-9
+        a3 = np.arccos(np.clip(ratio3, -1.0, 1.0))
+        t3 = np.stack([a3, -a3], axis=-1)                                   # (n, 2, 2, 2)
+
+        p13e = p13[..., None, :]
+        norm13e = np.maximum(norm13[..., None], _EPS)
+        t2 = -np.arctan2(p13e[..., 1], -p13e[..., 0]) + np.arcsin(
+            np.clip(m.a3 * np.sin(t3) / norm13e, -1.0, 1.0))
+        T14e = np.broadcast_to(T14[..., None, :, :], t3.shape + (4, 4))
+        T34 = _inv(_dh(t2, 0.0, m.a2, 0.0) @ _dh(t3, 0.0, m.a3, 0.0)) @ T14e
+        t4 = np.arctan2(T34[..., 1, 0], T34[..., 0, 0])
+
+        def full(x: np.ndarray) -> np.ndarray:
+            return np.broadcast_to(x, t3.shape)
+
+        # Axes: shoulder, wrist, elbow → reorder to config bit order (shoulder, elbow, wrist).
+        q = np.stack([full(t1[:, :, None, None]), t2, t3, t4,
+                      full(t5[..., None]), full(t6[..., None])], axis=-1)
+        q = np.transpose(q, (0, 1, 3, 2, 4)).reshape(n, 8, 6)
+        valid = full(reach1[:, None, None, None]) & full(reach5[:, :, None, None]) & full(reach3[..., None])
+        valid = np.transpose(valid, (0, 1, 3, 2)).reshape(n, 8)
+
+        q, in_limits = self._wrap_to_limits(np.rad2deg(q))
+        return q, valid, in_limits
+
+    def within_limits(self, joints: np.ndarray) -> np.ndarray:
+        """Whether (..., 6) joint vectors lie inside the joint limits as given."""
+        joints = np.asarray(joints, dtype=np.float64)
+        lower, upper = self._limits[:, 0], self._limits[:, 1]
+        return np.all((joints >= lower - 1e-6) & (joints <= upper + 1e-6), axis=-1)
+
+    def ik(self, poses: np.ndarray, config: int | np.ndarray = -1,
+           reference: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """Joint solutions for (N, 6) or (6,) TCP poses.
+
+        config 0–7 picks that branch; -1 picks the valid solution closest to
+        `reference` joints (the controller's behaviour with config=-1).
+        Returns (joints, ok) shaped like the input (without the last axis for ok).
+        """
+        poses = np.asarray(poses, dtype=np.float64)
+        single = poses.ndim == 1
+        q, valid = self.ik_all(poses)
+        n = q.shape[0]
+        config = np.broadcast_to(np.asarray(config), (n,))
+        if np.any(config < 0):
+            ref = np.zeros(6) if reference is None else np.asarray(reference, dtype=np.float64)
+            dist = np.abs(q - np.broadcast_to(ref, (n, 6))[:, None, :]).max(axis=-1)
+            dist = np.where(valid, dist, np.inf)
+            nearest = dist.argmin(axis=-1)
+            config = np.where(config < 0, nearest, config)
+        rows = np.arange(n)
+        joints, ok = q[rows, config], valid[rows, config]
+        return (joints[0], bool(ok[0])) if single else (joints, ok)
+
+    def config_of(self, joints: np.ndarray) -> np.ndarray:
+        """Config code (0–7) of joint vectors, i.e. which ik_all branch they are."""
+        joints = np.atleast_2d(np.asarray(joints, dtype=np.float64))
+        q, valid = self.ik_all(self.fk(joints))
+        diff = np.abs(((q - joints[:, None, :]) + 180.0) % 360.0 - 180.0).max(axis=-1)
+        return np.where(valid, diff, np.inf).argmin(axis=-1)
+
+    def _wrap_to_limits(self, q: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Shift angles by ±360 into the joint range; flag the ones that don't fit."""
+        lower, upper = self._limits[:, 0], self._limits[:, 1]
+        q = (q + 180.0) % 360.0 - 180.0
+        q = np.where(q > upper, q - 360.0, q)
+        q = np.where(q < lower, q + 360.0, q)
+        return q, np.all((q >= lower - 1e-6) & (q <= upper + 1e-6), axis=-1)
+
+
+def validate(kin: Kinematics, joints: np.ndarray, poses: np.ndarray,
+             configs: np.ndarray | None = None) -> dict:
+    """Compare local results with recorded controller data.
+
+    joints/poses are (N, 6) pairs read from the controller (e.g.
+    GetActualJointPosDegree with GetActualTCPPose, or GetInverseKin inputs
+    and outputs); configs optionally the matching GetRobotCurJointsConfig
+    codes. Returns worst-case FK position/orientation error, worst IK joint
+    error and how many config codes matched.
+    """
+    joints = np.atleast_2d(np.asarray(joints, dtype=np.float64))
+    poses = np.atleast_2d(np.asarray(poses, dtype=np.float64))
+    fk = kin.fk(joints)
+    pos_err = np.linalg.norm(fk[:, :3] - poses[:, :3], axis=-1)
+    rot_err = np.abs(((fk[:, 3:] - poses[:, 3:]) + 180.0) % 360.0 - 180.0).max(axis=-1)
+    local_configs = kin.config_of(joints)
+    ik, ok = kin.ik(poses, configs if configs is not None else local_configs)
+    ik_err = np.where(ok, np.abs(((ik - joints) + 180.0) % 360.0 - 180.0).max(axis=-1), np.inf)
+    report = {
+        "samples": len(joints),
+        "fk_max_mm": float(pos_err.max()),
+        "fk_max_deg": float(rot_err.max()),
+        "ik_max_deg": float(ik_err.max()),
+    }
+    if configs is not None:
+        report["config_matches"] = int(np.sum(local_configs == np.asarray(configs)))
+    return report
@@ -0,0 +1,50 @@
+from threading import Lock
+from typing import Any, Callable, Optional
+
+try:
+    from fairino import Robot
+except ImportError:     # --sim runs without the SDK installed
+    Robot = None
+
+from utils.rpc_stats import InstrumentedRPC
+
+# Each robot's executor opens and owns its own connection, so any number
+# of controllers can be connected at once (see services.robot_registry).
+
+_lock = Lock()
+# ip → connection; None means fairino's Robot.RPC (see use_factory).
+_factory: Optional[Callable[[str], Any]] = None
+
+
+def use_factory(factory: Optional[Callable[[str], Any]]) -> None:
+    """Build connections with `factory` (e.g. the simulator) instead of Robot.RPC."""
+    global _factory
+    with _lock:
+        _factory = factory
+
+
+def open_rpc(ip: str) -> InstrumentedRPC:
+    """New connection to the controller at `ip`.
+
+    Handed out wrapped in InstrumentedRPC so SDK calls can be timed
+    (utils.rpc_stats); it forwards everything else unchanged.
+    """
+    with _lock:
+        factory = _factory
+    if factory is not None:
+        rpc = factory(ip)
+    elif Robot is None:
+        raise RuntimeError("fairino SDK not installed; install it or start with --sim")
+    else:
+        rpc = Robot.RPC(ip)
+    print(f"[Robot] Conectado a {ip}")
+    return InstrumentedRPC(rpc)
+
+
+def close_rpc(robot: Any, ip: str | None = None) -> None:
+    """Close a connection from open_rpc; errors from a dead link are ignored."""
+    try:
+        robot.CloseRPC()
+        print(f"[Robot] Desconectado de {ip or 'robot'}")
+    except Exception:
+        pass
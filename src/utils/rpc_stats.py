@@ -0,0 +1,146 @@
+import json
+import math
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+# Latency histogram: log-spaced buckets, each 25% wider than the last, from
+# 0.05 ms up to ~2 min; percentiles are read back at bucket resolution.
+_BUCKET_BASE_MS = 0.05
+_BUCKET_RATIO = 1.25
+_BUCKETS = 66
+_LOG_RATIO = math.log(_BUCKET_RATIO)
+
+
+def _bucket(ms: float) -> int:
+    if ms <= _BUCKET_BASE_MS:
+        return 0
+    return min(int(math.log(ms / _BUCKET_BASE_MS) / _LOG_RATIO) + 1, _BUCKETS - 1)
+
+
+def _bucket_ms(index: int) -> float:
+    """Geometric middle of bucket `index` (its lower edge for bucket 0)."""
+    if index == 0:
+        return _BUCKET_BASE_MS
+    return _BUCKET_BASE_MS * _BUCKET_RATIO ** (index - 0.5)
+
+
+class _MethodStats:
+    __slots__ = ("calls", "failures", "errors", "total_ms", "max_ms", "histogram")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.failures = 0                   # raised instead of returning
+        self.errors: dict[int, int] = {}    # non-zero SDK error code → count
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.histogram = [0] * _BUCKETS
+
+    def percentile(self, q: float) -> float:
+        rank, seen = q * self.calls, 0
+        for index, count in enumerate(self.histogram):
+            seen += count
+            if count and seen >= rank:
+                return min(_bucket_ms(index), self.max_ms)
+        return self.max_ms
+
+    def as_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "errors": {str(code): count for code, count in sorted(self.errors.items())},
+            "avg_ms": round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            "p50_ms": round(self.percentile(0.50), 3),
+            "p95_ms": round(self.percentile(0.95), 3),
+            "p99_ms": round(self.percentile(0.99), 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class RpcStats:
+    """Per-method call counts, SDK error codes and latency histograms.
+
+    Fed by InstrumentedRPC while `enabled`; thread-safe, since calls come from
+    the robot thread and jog/state code alike.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._methods: dict[str, _MethodStats] = {}
+        self._since = time.time()
+
+    def record(self, method: str, ms: float, result: Any = None, failed: bool = False) -> None:
+        code = result[0] if isinstance(result, tuple) and result else result
+        with self._lock:
+            stats = self._methods.get(method)
+            if stats is None:
+                stats = self._methods[method] = _MethodStats()
+            stats.calls += 1
+            stats.total_ms += ms
+            stats.max_ms = max(stats.max_ms, ms)
+            stats.histogram[_bucket(ms)] += 1
+            if failed:
+                stats.failures += 1
+            elif isinstance(code, int) and not isinstance(code, bool) and code != 0:
+                stats.errors[code] = stats.errors.get(code, 0) + 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._methods.clear()
+            self._since = time.time()
+
+    def snapshot(self) -> dict:
+        """{"enabled", "since", "methods": {name: stats}}, slowest p95 first."""
+        with self._lock:
+            methods = {name: stats.as_dict() for name, stats in self._methods.items()}
+        ordered = sorted(methods.items(), key=lambda item: item[1]["p95_ms"], reverse=True)
+        return {"enabled": self.enabled, "since": self._since, "methods": dict(ordered)}
+
+    def dump_json(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.write_text(json.dumps(self.snapshot(), indent=2), encoding="utf-8")
+        return path
+
+
+# Process-wide statistics for the controller connection. Off unless
+# ROBOT_RPC_STATS=1 or switched on at runtime from the UI.
+RPC_STATS = RpcStats(enabled=os.environ.get("ROBOT_RPC_STATS", "") == "1")
+
+
+class InstrumentedRPC:
+    """Transparent proxy around Robot.RPC that times every SDK method call.
+
+    Attribute access is forwarded; while stats are disabled methods come back
+    unwrapped, so the only cost is one extra attribute lookup per call.
+    Non-callable attributes (robot_state_pkg) are never wrapped.
+    """
+
+    __slots__ = ("_rpc", "_stats")
+
+    def __init__(self, rpc: Any, stats: RpcStats = RPC_STATS) -> None:
+        object.__setattr__(self, "_rpc", rpc)
+        object.__setattr__(self, "_stats", stats)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._rpc, name)
+        stats = self._stats
+        if not stats.enabled or not callable(attr):
+            return attr
+
+        def _timed(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                result = attr(*args, **kwargs)
+            except Exception:
+                stats.record(name, (time.perf_counter() - started) * 1000.0, failed=True)
+                raise
+            stats.record(name, (time.perf_counter() - started) * 1000.0, result)
+            return result
+
+        return _timed
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._rpc, name, value)